@@ -0,0 +1,67 @@
+# backend/benchmarks/bench_concept_store.py
+"""
+Compare resident memory of the dict-of-dicts concept layout with the
+columnar ConceptStore.
+
+Both layouts are pickled the way the snapshot stores them, then each is
+loaded in a fresh subprocess (as a warm start would) and measured as the
+RSS growth from holding a 21k-concept table.
+
+Usage:
+    python backend/benchmarks/bench_concept_store.py
+"""
+import json
+import pickle
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent.parent
+
+_CHILD = """
+import gc, json, pickle, sys
+sys.path.insert(0, {base!r})
+import numpy
+from backend.src.concept_store import ConceptStore
+
+def rss_kib():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+
+with open({path!r}, 'rb') as f:
+    data = f.read()
+gc.collect()
+before = rss_kib()
+concepts = pickle.loads(data)
+gc.collect()
+print(json.dumps({{'rss_mb': (rss_kib() - before) / 1024}}))
+"""
+
+
+def main():
+    sys.path.insert(0, str(BASE_DIR))
+    from backend.benchmarks.synthetic import make_concepts
+    from backend.src.concept_store import ConceptStore
+
+    concepts = make_concepts()
+    layouts = {'dict': concepts, 'columnar': ConceptStore.from_dicts(concepts)}
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for layout, table in layouts.items():
+            path = Path(tmp) / f"{layout}.pickle"
+            path.write_bytes(pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL))
+            code = _CHILD.format(base=str(BASE_DIR), path=str(path))
+            output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+            results[layout] = json.loads(output.strip().splitlines()[-1])['rss_mb']
+
+    for layout, rss_mb in results.items():
+        print(f"{layout:<9} {rss_mb:8.1f} MB")
+    print(f"reduction {100 * (1 - results['columnar'] / results['dict']):7.1f} %")
+
+
+if __name__ == "__main__":
+    main()
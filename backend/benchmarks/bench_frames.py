@@ -0,0 +1,78 @@
+# backend/benchmarks/bench_frames.py
+"""
+Time cross-sectional frame queries on an EDGAR-sized frame store.
+
+Writes a synthetic store (6,000 companies, 3,000 concepts, 60 calendar
+periods, about 12M facts by default) with write_frame_store, then ranks a
+concept's frame for every company and for a 500-company universe, the
+shape of an S&P 500 query. Queries run against the memory-mapped columns
+exactly as the API serves them.
+
+Usage:
+    python backend/benchmarks/bench_frames.py [fact_count]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.frame_store import FrameStore, write_frame_store
+
+COMPANIES = 6000
+CONCEPTS = 3000
+PERIODS = [f"CY{year}{quarter}" for year in range(2010, 2025) for quarter in ("", "Q1", "Q2", "Q3")]
+
+
+def make_columns(count: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    return {
+        # Popular concepts (low codes) are reported by far more companies
+        'concept': np.minimum(rng.zipf(1.3, count) - 1, CONCEPTS - 1).astype(np.int32),
+        'period': rng.integers(0, len(PERIODS), count, dtype=np.int32),
+        'unit': np.zeros(count, dtype=np.int32),
+        'cik': rng.integers(0, COMPANIES, count, dtype=np.int32),
+        'value': rng.lognormal(18, 2, count),
+    }
+
+
+def _time(fn, repeat: int = 200) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 12_000_000
+    concepts = [f"us-gaap:Concept{i}" for i in range(CONCEPTS)]
+    ciks = np.arange(1, COMPANIES + 1, dtype=np.int64) * 17
+    names = [f"Company {i}" for i in range(COMPANIES)]
+    universe = ciks[np.random.default_rng(1).choice(COMPANIES, 500, replace=False)].tolist()
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        version = write_frame_store(make_columns(count), concepts, PERIODS, ['USD'], ciks, names, Path(directory))
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        store = FrameStore(version)
+        opened = time.perf_counter() - start
+        print(f"store    {len(store)} facts in {len(store.keys)} frames  {store.memory_bytes() / 1e6:.0f} MB  "
+              f"built in {build:.1f}s  opened in {opened * 1000:.1f} ms")
+
+        frame = store.frame("Concept0", "CY2024")
+        print(f"all      {frame['stats']['count']:5d} companies  "
+              f"{_time(lambda: store.frame('Concept0', 'CY2024')):6.2f} ms")
+        frame = store.frame("Concept0", "CY2024", ciks=universe)
+        print(f"universe {frame['stats']['count']:5d} companies  "
+              f"{_time(lambda: store.frame('Concept0', 'CY2024', ciks=universe)):6.2f} ms")
+        print(f"rare     {store.frame('Concept2000', 'CY2024')['stats']['count']:5d} companies  "
+              f"{_time(lambda: store.frame('Concept2000', 'CY2024')):6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# backend/benchmarks/bench_instance_parse.py
+"""
+Time streaming fact extraction on a 10-K-sized filing.
+
+Generates an XBRL instance and an inline XBRL document with the same facts
+(60k by default, spread over a few hundred contexts and concepts), then
+parses each with parse_instance, reporting wall time and the peak Python
+heap allocated during the parse (lxml's own buffers are not traced, but
+the document tree is freed as it is read, so they stay small too).
+
+Usage:
+    python backend/benchmarks/bench_instance_parse.py [fact_count]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.benchmarks.synthetic import WORDS
+from backend.src.instance_parser import parse_instance
+
+
+def _facts(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    concepts = sorted({''.join(rng.sample(WORDS, 3)) for _ in range(800)})
+    for i in range(count):
+        yield concepts[i % len(concepts)], f"c{rng.randrange(400)}", rng.randrange(-10 ** 9, 10 ** 9)
+
+
+def _contexts():
+    return "".join(
+        f'<xbrli:context id="c{i}"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193'
+        f'</xbrli:identifier></xbrli:entity><xbrli:period><xbrli:startDate>2024-01-01</xbrli:startDate>'
+        f'<xbrli:endDate>2024-12-31</xbrli:endDate></xbrli:period></xbrli:context>'
+        for i in range(400)
+    )
+
+
+def make_instance(count: int) -> bytes:
+    facts = "".join(f'<us-gaap:{name} contextRef="{context}" unitRef="usd" decimals="-6">{value}</us-gaap:{name}>'
+                    for name, context, value in _facts(count))
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:link="http://www.xbrl.org/2003/linkbase" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:iso4217="http://www.xbrl.org/2003/iso4217" '
+        'xmlns:us-gaap="http://fasb.org/us-gaap/2024">'
+        '<link:schemaRef xlink:type="simple" xlink:href="test-20241231.xsd"/>'
+        f'{_contexts()}<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>{facts}'
+        '</xbrli:xbrl>'
+    ).encode()
+
+
+NEGATIVE = ' sign="-"'
+
+
+def make_inline(count: int) -> bytes:
+    rows = "".join(
+        f'<tr><td>{name}</td><td><span>$</span><ix:nonFraction name="us-gaap:{name}" contextRef="{context}" '
+        f'unitRef="usd" decimals="-6" scale="6" format="ixt:num-dot-decimal"{NEGATIVE if value < 0 else ""}>'
+        f'{abs(value) / 1e6:,.0f}</ix:nonFraction></td></tr>'
+        for name, context, value in _facts(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:ix="http://www.xbrl.org/2013/inlineXBRL" '
+        'xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:link="http://www.xbrl.org/2003/linkbase" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:iso4217="http://www.xbrl.org/2003/iso4217" '
+        'xmlns:ixt="http://www.xbrl.org/inlineXBRL/transformation/2020-02-12"><body>'
+        '<div style="display:none"><ix:header><ix:references><link:schemaRef xlink:type="simple" '
+        'xlink:href="test-20241231.xsd"/></ix:references><ix:resources>'
+        f'{_contexts()}<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>'
+        f'</ix:resources></ix:header></div><table>{rows}</table></body></html>'
+    ).encode()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+    for label, document in (('instance', make_instance(count)), ('inline', make_inline(count))):
+        start = time.perf_counter()
+        table = parse_instance(document)
+        elapsed = time.perf_counter() - start
+        # Measured on a second pass: tracing every allocation slows the parse several-fold
+        tracemalloc.start()
+        parse_instance(document)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:8s} {len(document) / 1e6:6.1f} MB  {len(table)} facts  {elapsed * 1000:7.1f} ms  "
+              f"peak heap {peak / 1e6:5.1f} MB  table {table.memory_bytes() / 1e6:4.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
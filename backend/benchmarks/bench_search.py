@@ -0,0 +1,49 @@
+# backend/benchmarks/bench_search.py
+"""
+Measure search_concepts latency and search_concepts_batch throughput over a
+21k-concept table.
+
+Usage:
+    python backend/benchmarks/bench_search.py
+"""
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.benchmarks.synthetic import make_loader
+
+QUERIES = ['revenue', 'assets', 'cash', 'income', 'equity', 'debt', 'expense', 'inventory',
+           'cash equivalents', 'deferred tax', 'accounts receivable', 'amort', 'lease liability',
+           'amount', 'operating lease payment', 'goodwill impairment']
+
+
+def main():
+    loader = make_loader()
+    timings = []
+    for _ in range(50):
+        for query in QUERIES:
+            start = time.perf_counter()
+            loader.search_concepts(query, limit=10)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    p50 = statistics.median(timings)
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(f"{len(loader.concepts)} concepts, {len(timings)} queries: p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+
+    # Two random label words per query, as a mapping job would send them
+    rng = random.Random(1)
+    words = [word for name in loader.concept_names[:2000] for word in (loader.concepts[name].label or "").split()[:3]]
+    batch = [{'query': " ".join(rng.sample(words, 2)), 'limit': 5} for _ in range(10000)]
+    start = time.perf_counter()
+    loader.search_concepts_batch(batch)
+    elapsed = time.perf_counter() - start
+    print(f"batch of {len(batch)} queries: {elapsed * 1000:.0f} ms ({len(batch) / elapsed:.0f} queries/s)")
+
+
+if __name__ == "__main__":
+    main()
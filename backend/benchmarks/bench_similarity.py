@@ -0,0 +1,40 @@
+# backend/benchmarks/bench_similarity.py
+"""
+Measure similar-concept latency over a 21k-concept table, one lookup at a
+time and in batch mode.
+
+Usage:
+    python backend/benchmarks/bench_similarity.py
+"""
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.benchmarks.synthetic import make_loader
+
+
+def main():
+    loader = make_loader()
+    names = loader.concept_names[::10]
+
+    timings = []
+    for name in names:
+        start = time.perf_counter()
+        loader.find_similar_concepts(name, k=10)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p50 = statistics.median(timings)
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(f"{len(loader.concepts)} concepts, {len(timings)} single lookups: p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+
+    start = time.perf_counter()
+    loader.find_similar_concepts_batch(names, k=10)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"batch of {len(names)}: {elapsed:.1f} ms ({elapsed / len(names):.3f} ms per concept)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# backend/benchmarks/bench_taxonomy_load.py
+"""
+Compare cold-load time and peak RSS of the taxonomy extractors.
+
+Each extractor runs in a fresh subprocess with the snapshot disabled so both
+measurements are true cold loads.
+
+Usage:
+    python backend/benchmarks/bench_taxonomy_load.py [--taxonomy-dir DIR] [--entry-point XSD]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent.parent
+
+_CHILD = """
+import json, resource, sys, time
+sys.path.insert(0, {base!r})
+from pathlib import Path
+from backend.src.taxonomy_loader import TaxonomyLoader
+
+start = time.perf_counter()
+loader = TaxonomyLoader(entry_point=Path({entry_point!r}), taxonomy_dir=Path({taxonomy_dir!r}), extractor={extractor!r})
+loader.load_taxonomy(use_snapshot=False)
+elapsed = time.perf_counter() - start
+
+# ru_maxrss is KiB on Linux; include process pool workers
+rss_kib = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+print(json.dumps({{'seconds': elapsed, 'peak_rss_mb': rss_kib / 1024, 'concepts': len(loader.concepts)}}))
+"""
+
+
+def run(extractor: str, taxonomy_dir: Path, entry_point: Path) -> dict:
+    code = _CHILD.format(base=str(BASE_DIR), entry_point=str(entry_point), taxonomy_dir=str(taxonomy_dir), extractor=extractor)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    from backend.src.config import US_GAAP_ENTRY_POINT, US_GAAP_TAXONOMY_DIR
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--taxonomy-dir", type=Path, default=US_GAAP_TAXONOMY_DIR)
+    parser.add_argument("--entry-point", type=Path, default=US_GAAP_ENTRY_POINT)
+    args = parser.parse_args()
+
+    print(f"{'extractor':<10} {'concepts':>9} {'seconds':>9} {'peak RSS MB':>12}")
+    for extractor in ('arelle', 'lxml'):
+        result = run(extractor, args.taxonomy_dir, args.entry_point)
+        print(f"{extractor:<10} {result['concepts']:>9} {result['seconds']:>9.2f} {result['peak_rss_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(BASE_DIR))
+    main()
@@ -0,0 +1,104 @@
+# backend/benchmarks/bench_taxonomy_versions.py
+"""
+Measure the resident memory of each additional taxonomy version.
+
+Four synthetic versions are generated, each adding, relabelling and
+deprecating a few percent of the previous one's concepts, the way
+consecutive US-GAAP releases do. Their loader state is pickled as the
+snapshot stores it, then restored one after another in a fresh subprocess,
+recording the RSS growth per version. Strings shared with versions already
+loaded are interned on restore, so later versions cost less than the first.
+
+Usage:
+    python backend/benchmarks/bench_taxonomy_versions.py
+"""
+import json
+import pickle
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent.parent
+VERSIONS = ('2022', '2023', '2024', '2025')
+
+_CHILD = """
+import gc, json, pickle, sys
+sys.path.insert(0, {base!r})
+import numpy
+from backend.src import concept_store, search_index, suggest_index, fuzzy_index, facet_index, similarity_index
+from backend.src import relationship_index, reference_index
+
+def rss_kib():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+
+states = []
+growth = []
+for path in {paths!r}:
+    with open(path, 'rb') as f:
+        data = f.read()
+    gc.collect()
+    before = rss_kib()
+    states.append(pickle.loads(data))
+    del data
+    gc.collect()
+    growth.append((rss_kib() - before) / 1024)
+print(json.dumps(growth))
+"""
+
+
+def make_versions(count: int = 21000):
+    """Concept tables for consecutive versions with a few percent churn each."""
+    from backend.benchmarks.synthetic import make_concepts
+
+    rng = random.Random(11)
+    extra = iter(make_concepts(count + 4 * count // 25, seed=13).items())
+    concepts = make_concepts(count)
+    versions = []
+    for _ in VERSIONS:
+        versions.append(concepts)
+        concepts = {name: dict(info) for name, info in concepts.items()}
+        names = list(concepts)
+        for name in rng.sample(names, len(names) // 100):
+            concepts[name]['is_deprecated'] = True
+        for name in rng.sample(names, len(names) // 100):
+            concepts[name]['label'] = concepts[name]['label'] + " (Revised)"
+        added = 0
+        while added < len(names) // 50:
+            name, info = next(extra)
+            if name not in concepts:
+                concepts[name] = info
+                added += 1
+    return versions
+
+
+def main():
+    sys.path.insert(0, str(BASE_DIR))
+    from backend.src.concept_store import ConceptStore
+    from backend.src.taxonomy_loader import TaxonomyLoader
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for version, concepts in zip(VERSIONS, make_versions()):
+            loader = TaxonomyLoader(taxonomy_dir=Path(tmp) / f"us-gaap-{version}")
+            loader.concepts = ConceptStore.from_dicts(concepts, documentation_dir=Path(tmp))
+            loader._build_search_index()
+            state = loader._snapshot_state()
+            path = Path(tmp) / f"{version}.pickle"
+            path.write_bytes(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+            paths.append(str(path))
+
+        code = _CHILD.format(base=str(BASE_DIR), paths=paths)
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+        growth = json.loads(output.strip().splitlines()[-1])
+
+    for version, rss_mb in zip(VERSIONS, growth):
+        print(f"{version}  {rss_mb:8.1f} MB  ({100 * rss_mb / growth[0]:5.1f} % of the first)")
+
+
+if __name__ == "__main__":
+    main()
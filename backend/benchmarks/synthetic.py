@@ -0,0 +1,66 @@
+# backend/benchmarks/synthetic.py
+"""
+Synthetic concept tables for benchmarks.
+
+The checked-in taxonomy may not include the full US-GAAP element schema, so
+benchmarks fall back to a generated table of the same size and shape.
+"""
+import random
+from typing import Any, Dict
+
+WORDS = [
+    'Accounts', 'Accrued', 'Accumulated', 'Acquisition', 'Additional', 'Adjustment', 'Allowance',
+    'Amortization', 'Asset', 'Assets', 'Available', 'Benefit', 'Business', 'Capital', 'Carrying',
+    'Cash', 'Combination', 'Common', 'Comprehensive', 'Contract', 'Cost', 'Credit', 'Current',
+    'Customer', 'Debt', 'Deferred', 'Depreciation', 'Derivative', 'Disposal', 'Dividends',
+    'Earnings', 'Equity', 'Equivalents', 'Expense', 'Fair', 'Finance', 'Financing', 'Goodwill',
+    'Gross', 'Impairment', 'Income', 'Intangible', 'Interest', 'Inventory', 'Investing',
+    'Investment', 'Lease', 'Liabilities', 'Liability', 'Loss', 'Net', 'Noncurrent', 'Obligation',
+    'Operating', 'Other', 'Payable', 'Payment', 'Pension', 'Period', 'Plan', 'Preferred',
+    'Proceeds', 'Property', 'Receivable', 'Restricted', 'Retained', 'Revenue', 'Revenues', 'Sale',
+    'Securities', 'Share', 'Stock', 'Tax', 'Total', 'Unrecognized', 'Value', 'Weighted',
+]
+DOC_WORDS = [w.lower() for w in WORDS] + [
+    'amount', 'of', 'the', 'for', 'recognized', 'reporting', 'entity', 'period', 'during', 'after',
+    'before', 'including', 'excluding', 'portion', 'attributable', 'to', 'parent', 'classified',
+]
+DATA_TYPES = ['xbrli:monetaryItemType', 'xbrli:stringItemType', 'xbrli:sharesItemType',
+              'dtr-types:perShareItemType', 'dtr-types:percentItemType', 'nonnum:textBlockItemType']
+
+
+def make_concepts(count: int = 21000, seed: int = 7) -> Dict[str, Dict[str, Any]]:
+    """Generate a concepts dict in the TaxonomyLoader layout."""
+    rng = random.Random(seed)
+    concepts = {}
+    while len(concepts) < count:
+        parts = rng.sample(WORDS, rng.randint(2, 6))
+        name = "".join(parts)
+        if name in concepts:
+            continue
+        label = " ".join(parts)
+        data_type = rng.choice(DATA_TYPES)
+        monetary = data_type == 'xbrli:monetaryItemType'
+        concepts[name] = {
+            'name': name,
+            'qname': f"us-gaap:{name}",
+            'label': label,
+            'documentation': " ".join(rng.choice(DOC_WORDS) for _ in range(rng.randint(10, 40))),
+            'data_type': data_type,
+            'period_type': rng.choice(['duration', 'instant']),
+            'balance_type': rng.choice(['debit', 'credit']) if monetary else None,
+            'is_deprecated': rng.random() < 0.05,
+            'is_abstract': rng.random() < 0.1,
+            'substitution_group': 'xbrli:item',
+        }
+    return concepts
+
+
+def make_loader(count: int = 21000):
+    """Build a loaded TaxonomyLoader over a synthetic concept table."""
+    from backend.src.taxonomy_loader import TaxonomyLoader
+
+    loader = TaxonomyLoader()
+    loader.concepts = make_concepts(count)
+    loader._build_search_index()
+    loader.is_loaded = True
+    return loader
@@ -0,0 +1,188 @@
+# backend/src/cli.py
+"""
+Command line entry points for XBRL Search maintenance tasks.
+
+Usage:
+    python -m backend.src.cli build-snapshot [--version 2024]
+    python -m backend.src.cli ingest-companyfacts [--zip companyfacts.zip] [--tickers AAPL MSFT] [--force]
+    python -m backend.src.cli build-frames
+    python -m backend.src.cli sweep [--tickers AAPL MSFT] [--forms 10-K 10-Q] [--output cache/sweeps/sp500]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+from .companyfacts_ingest import ingest_archive, ingest_from_sec
+from .classifier import FinancialStatementClassifier
+from .config import (DEFAULT_TAXONOMY_VERSION, FACT_DB_PATH, FACT_INGEST_WORKERS, FRAME_STORE_DIR, SWEEP_CONCURRENCY,
+                     SWEEP_FORM_TYPES, SWEEP_RESULTS_DIR, TAXONOMY_EXTRACTOR, TAXONOMY_VERSIONS)
+from .fact_database import FactDatabase
+from .filing_sweep import SweepJob
+from .frame_store import FrameStore, build_frame_store
+from .sec_client import SECClient
+from .sp500_list import SP500_LIST
+from .taxonomy_loader import TaxonomyLoader
+from .taxonomy_registry import discover_taxonomy_versions, entry_point_for
+
+logger = logging.getLogger(__name__)
+
+
+def build_snapshot(args: argparse.Namespace) -> int:
+    """Rebuild the taxonomy snapshot of one version from the DTS."""
+    versions = TAXONOMY_VERSIONS or discover_taxonomy_versions()
+    if args.version not in versions:
+        print(f"Unknown taxonomy version {args.version} (available: {', '.join(versions) or 'none'})", file=sys.stderr)
+        return 1
+    taxonomy_dir = versions[args.version]
+    loader = TaxonomyLoader(entry_point=entry_point_for(args.version, taxonomy_dir), taxonomy_dir=taxonomy_dir,
+                            extractor=args.extractor)
+    start = time.perf_counter()
+    loader.load_taxonomy(use_snapshot=False)
+    path = loader.write_snapshot()
+    if path is None:
+        return 1
+    print(f"Built snapshot {path} with {len(loader.concepts)} concepts in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+async def _ingest_from_sec(db: FactDatabase, tickers, args: argparse.Namespace):
+    client = SECClient()
+    try:
+        index = await client.get_company_index()
+        ciks = []
+        for ticker in tickers:
+            company = index.lookup_ticker(ticker)
+            if company is None:
+                logger.warning(f"Unknown ticker {ticker}, skipping")
+                continue
+            ciks.append(int(company['cik']))
+        return await ingest_from_sec(db, client, ciks, workers=args.workers, force=args.force)
+    finally:
+        await client.aclose()
+
+
+def ingest_companyfacts(args: argparse.Namespace) -> int:
+    """Load companyfacts into the local fact database, resuming an interrupted run."""
+    db = FactDatabase(args.db)
+    try:
+        if args.zip is not None:
+            if args.tickers:
+                print("--tickers needs the SEC API; use --ciks to limit --zip", file=sys.stderr)
+                return 1
+            ciks = [int(cik) for cik in args.ciks] if args.ciks else None
+            result = ingest_archive(db, args.zip, ciks=ciks, workers=args.workers, force=args.force)
+        else:
+            result = asyncio.run(_ingest_from_sec(db, args.tickers or SP500_LIST, args))
+        stats = db.stats()
+    finally:
+        db.close()
+    notes = f", {result['failed']} failed" if result.get('failed') else ""
+    notes += f", {result['filtered']} archive members not selected by --ciks" if result.get('filtered') else ""
+    print(f"Ingested {result['companies']} companies ({result['facts']} facts) in {result['seconds']:.1f}s, "
+          f"skipped {result['skipped']} already stored{notes}; database holds {stats['companies']} companies, "
+          f"{stats['facts']} facts")
+    return 1 if result.get('failed') else 0
+
+
+async def _sp500_ciks():
+    client = SECClient()
+    try:
+        index = await client.get_company_index()
+    finally:
+        await client.aclose()
+    return [int(company['cik']) for company in map(index.lookup_ticker, SP500_LIST) if company]
+
+
+def build_frames(args: argparse.Namespace) -> int:
+    """Rebuild the memory-mapped frame store from the fact database."""
+    db = FactDatabase(args.db, readonly=True)
+    if not db.exists():
+        print(f"No fact database at {args.db}; run ingest-companyfacts first", file=sys.stderr)
+        return 1
+    start = time.perf_counter()
+    # Resolved here so frame queries never need the company index
+    try:
+        universes = {'sp500': asyncio.run(_sp500_ciks())}
+    except Exception as e:
+        logger.warning(f"Could not resolve S&P 500 tickers, building without the sp500 universe: {e}")
+        universes = {}
+    try:
+        version = build_frame_store(db, args.dir, universes=universes)
+    finally:
+        db.close()
+    store = FrameStore(version)
+    print(f"Built frame store {version} with {len(store)} facts in {len(store.keys)} frames "
+          f"({store.memory_bytes() / 1e6:.1f} MB) in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+async def _sweep(job: SweepJob) -> dict:
+    client = SECClient()
+    try:
+        return await job.run(client, FinancialStatementClassifier())
+    finally:
+        await client.aclose()
+
+
+def sweep(args: argparse.Namespace) -> int:
+    """Analyze the latest filings of a company list, skipping companies already swept."""
+    try:
+        job = SweepJob(tickers=args.tickers, form_types=args.forms, output_dir=args.output,
+                       concurrency=args.concurrency, force=args.force)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    status = asyncio.run(_sweep(job))
+    print(f"Swept {status['completed']} companies ({status['filings']} filings) in {status['elapsed_seconds']}s, "
+          f"{status['companies_per_minute']}/min; skipped {status['skipped']} already swept, "
+          f"{status['failed']} failed; results in {status['output_dir']}")
+    for ticker, error in status['errors'].items():
+        print(f"  {ticker}: {error}", file=sys.stderr)
+    return 0 if status['state'] == 'completed' and not status['failed'] else 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.src.cli", description="XBRL Search maintenance commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    snapshot_parser = subparsers.add_parser("build-snapshot", help="Rebuild the persisted taxonomy snapshot")
+    snapshot_parser.add_argument("--extractor", choices=("arelle", "lxml"), default=TAXONOMY_EXTRACTOR,
+                                 help="Concept extractor to build the snapshot with")
+    snapshot_parser.add_argument("--version", default=DEFAULT_TAXONOMY_VERSION,
+                                 help="Taxonomy version to build, e.g. 2024")
+    snapshot_parser.set_defaults(func=build_snapshot)
+
+    ingest_parser = subparsers.add_parser("ingest-companyfacts", help="Load companyfacts into the local fact database")
+    ingest_parser.add_argument("--zip", type=Path, help="Local companyfacts.zip to ingest instead of the SEC API")
+    ingest_parser.add_argument("--tickers", nargs="+", help="Tickers to download (default: the S&P 500 list)")
+    ingest_parser.add_argument("--ciks", nargs="+", help="Only these CIKs from --zip (default: all)")
+    ingest_parser.add_argument("--workers", type=int, default=FACT_INGEST_WORKERS,
+                               help="Parser processes (default: CPU count)")
+    ingest_parser.add_argument("--force", action="store_true", help="Re-ingest companies that are already stored")
+    ingest_parser.add_argument("--db", type=Path, default=FACT_DB_PATH, help="Fact database path")
+    ingest_parser.set_defaults(func=ingest_companyfacts)
+
+    frames_parser = subparsers.add_parser("build-frames", help="Rebuild the frame store from the fact database")
+    frames_parser.add_argument("--db", type=Path, default=FACT_DB_PATH, help="Fact database path")
+    frames_parser.add_argument("--dir", type=Path, default=FRAME_STORE_DIR, help="Frame store directory")
+    frames_parser.set_defaults(func=build_frames)
+
+    sweep_parser = subparsers.add_parser("sweep", help="Analyze the latest filings of the S&P 500 (or given tickers)")
+    sweep_parser.add_argument("--tickers", nargs="+", help="Tickers to sweep (default: the S&P 500 list)")
+    sweep_parser.add_argument("--forms", nargs="+", default=SWEEP_FORM_TYPES, help="Form types to analyze")
+    sweep_parser.add_argument("--output", type=Path, default=SWEEP_RESULTS_DIR / "sp500",
+                              help="Directory of per-company result files")
+    sweep_parser.add_argument("--concurrency", type=int, default=SWEEP_CONCURRENCY, help="Companies in flight at once")
+    sweep_parser.add_argument("--force", action="store_true", help="Re-sweep companies that already have results")
+    sweep_parser.set_defaults(func=sweep)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
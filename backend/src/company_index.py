@@ -0,0 +1,220 @@
+# backend/src/company_index.py
+"""
+In-memory index over SEC's company_tickers.json.
+
+EDGAR publishes one file mapping every ticker to its CIK and company name
+(about 10k entries). It is downloaded once, kept under CACHE_DIR and
+refreshed after CACHE_EXPIRY_HOURS. Tickers and CIKs resolve through dicts,
+and company names through a sorted token table searched by prefix, so
+"Berkshire", "berkshire hath" and "BRK.B" all resolve without a network
+round-trip.
+"""
+import json
+import logging
+import os
+import re
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .config import CACHE_DIR, CACHE_EXPIRY_HOURS
+
+logger = logging.getLogger(__name__)
+
+COMPANY_TICKERS_CACHE = CACHE_DIR / "company_tickers.json"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_TICKER_SEPARATORS = re.compile(r"[\s./]+")
+
+
+def normalize_ticker(ticker: str) -> str:
+    """Canonical ticker form: upper case with class separators as '-' (BRK.B, BRK/B -> BRK-B)."""
+    return _TICKER_SEPARATORS.sub("-", ticker.strip().upper())
+
+
+def name_tokens(text: str) -> List[str]:
+    """Lower-cased alphanumeric words of a company name or query."""
+    return _TOKEN_PATTERN.findall(text.lower().replace("&", " and "))
+
+
+def format_cik(cik: int) -> str:
+    """Zero-padded 10-digit CIK as used in EDGAR URLs."""
+    return str(cik).zfill(10)
+
+
+class CompanyIndex:
+    """Ticker, CIK and company-name lookups over one company_tickers.json download."""
+
+    def __init__(self):
+        self.ciks = np.zeros(0, dtype=np.int64)
+        self.names: List[str] = []
+        self.tickers: List[List[str]] = []
+        self.ticker_rows: Dict[str, int] = {}
+        self.cik_rows: Dict[int, int] = {}
+        self.tokens: List[str] = []
+        self.token_rows: List[np.ndarray] = []
+        self.loaded_at = 0.0
+
+    @classmethod
+    def build(cls, entries: Iterable[Dict[str, Any]]) -> "CompanyIndex":
+        """
+        Build the index.
+
+        Args:
+            entries: company_tickers.json values, each with cik_str, ticker and title
+
+        Returns:
+            CompanyIndex with one row per CIK; a CIK's tickers keep file order,
+            which EDGAR sorts by prominence (e.g. BRK-B before BRK-A)
+        """
+        index = cls()
+        ciks = []
+        for entry in entries:
+            cik = int(entry['cik_str'])
+            row = index.cik_rows.get(cik)
+            if row is None:
+                row = index.cik_rows[cik] = len(ciks)
+                ciks.append(cik)
+                index.names.append(entry['title'])
+                index.tickers.append([])
+            ticker = normalize_ticker(entry['ticker'])
+            index.tickers[row].append(ticker)
+            index.ticker_rows.setdefault(ticker, row)
+        index.ciks = np.array(ciks, dtype=np.int64)
+
+        rows_by_token: Dict[str, List[int]] = {}
+        for row, name in enumerate(index.names):
+            for token in set(name_tokens(name)):
+                rows_by_token.setdefault(token, []).append(row)
+        index.tokens = sorted(rows_by_token)
+        index.token_rows = [np.array(rows_by_token[token], dtype=np.int32) for token in index.tokens]
+        index.loaded_at = time.time()
+        return index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _company(self, row: int) -> Dict[str, Any]:
+        return {'cik': format_cik(int(self.ciks[row])), 'name': self.names[row], 'tickers': list(self.tickers[row])}
+
+    def lookup_ticker(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Company for an exact ticker, in any common class notation."""
+        row = self.ticker_rows.get(normalize_ticker(ticker))
+        return self._company(row) if row is not None else None
+
+    def lookup_cik(self, cik: Any) -> Optional[Dict[str, Any]]:
+        """Company for a CIK given as an int or a (zero-padded) string."""
+        try:
+            row = self.cik_rows.get(int(cik))
+        except (TypeError, ValueError):
+            return None
+        return self._company(row) if row is not None else None
+
+    def _prefix_rows(self, prefix: str) -> np.ndarray:
+        """Rows whose name has a token starting with the prefix."""
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\uffff", start)
+        if start == end:
+            return np.zeros(0, dtype=np.int32)
+        if end - start == 1:
+            return self.token_rows[start]
+        return np.unique(np.concatenate(self.token_rows[start:end]))
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Resolve a ticker or company name.
+
+        An exact ticker match ranks first. Name matches require every query
+        word to prefix a word of the name; names starting with the query,
+        then names with fewer extra words, rank higher.
+
+        Args:
+            query: Ticker ("BRK-B", "brk.b") or name words ("Berkshire", "apple in")
+            limit: Maximum companies to return
+
+        Returns:
+            List of {cik, name, tickers} dicts
+        """
+        results = []
+        ticker_row = self.ticker_rows.get(normalize_ticker(query)) if query.strip() else None
+        if ticker_row is not None:
+            results.append(ticker_row)
+
+        words = name_tokens(query)
+        if words and len(results) < limit:
+            rows = self._prefix_rows(words[0])
+            for word in words[1:]:
+                if len(rows) == 0:
+                    break
+                rows = np.intersect1d(rows, self._prefix_rows(word), assume_unique=True)
+
+            phrase = " ".join(words)
+            candidates = []
+            for row in rows.tolist():
+                if row == ticker_row:
+                    continue
+                tokens = name_tokens(self.names[row])
+                candidates.append((not " ".join(tokens).startswith(phrase), len(tokens), self.names[row], row))
+            candidates.sort()
+            results.extend(row for *_, row in candidates[:limit - len(results)])
+
+        return [self._company(row) for row in results[:limit]]
+
+    def is_stale(self, max_age_hours: float = CACHE_EXPIRY_HOURS) -> bool:
+        """Whether the data is older than the refresh interval."""
+        return time.time() - self.loaded_at > max_age_hours * 3600
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the index."""
+        string_bytes = sum(len(name) + 49 for name in self.names) + sum(len(token) + 49 for token in self.tokens)
+        ticker_bytes = sum(len(ticker) + 49 for tickers in self.tickers for ticker in tickers)
+        row_bytes = sum(rows.nbytes for rows in self.token_rows) + self.ciks.nbytes
+        return string_bytes + ticker_bytes + row_bytes
+
+
+def company_tickers_expired(cache_path: Path = COMPANY_TICKERS_CACHE,
+                            max_age_hours: float = CACHE_EXPIRY_HOURS) -> bool:
+    """Whether the cached company_tickers.json is missing or older than max_age_hours."""
+    cache_path = Path(cache_path)
+    return not cache_path.exists() or time.time() - cache_path.stat().st_mtime > max_age_hours * 3600
+
+
+def load_company_index(body: Optional[bytes] = None, cache_path: Path = COMPANY_TICKERS_CACHE) -> CompanyIndex:
+    """
+    Build the index from the cached download, first replacing it with a fresh one.
+
+    Args:
+        body: Freshly downloaded company_tickers.json, or None to build from the cache
+        cache_path: Where the download is kept between runs
+
+    Returns:
+        CompanyIndex; loaded_at is the download time, so an index built from
+        a stale cache after a failed refresh is retried on the next call
+
+    Raises:
+        FileNotFoundError: If there is no usable body and nothing cached
+    """
+    cache_path = Path(cache_path)
+    if body is not None:
+        try:
+            json.loads(body)  # Never replace a good cache with a truncated download
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".tmp{os.getpid()}")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, cache_path)
+            logger.info(f"Downloaded company tickers ({len(body)} bytes)")
+        except Exception as e:
+            if not cache_path.exists():
+                raise
+            logger.warning(f"Failed to refresh company tickers, using cached copy: {e}")
+
+    cached_at = cache_path.stat().st_mtime
+    with open(cache_path, "rb") as f:
+        data = json.load(f)
+    index = CompanyIndex.build(data.values() if isinstance(data, dict) else data)
+    index.loaded_at = cached_at
+    logger.info(f"Indexed {len(index)} companies")
+    return index
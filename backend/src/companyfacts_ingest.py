@@ -0,0 +1,175 @@
+# backend/src/companyfacts_ingest.py
+"""
+Bulk ingestion of SEC companyfacts JSON into the local fact database.
+
+Companies come either from SEC's nightly companyfacts.zip on local disk or
+from the companyfacts API for a ticker list (SP500_LIST by default). Each
+company's JSON is read and flattened to fact rows on a process pool, one
+company per task, so the archive is never loaded as a whole and at most a
+few companies are in memory at once. The parent process is the only
+SQLite writer and commits company by company, which is what lets an
+interrupted run resume where it stopped.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .config import FACT_INGEST_WORKERS
+from .fact_database import FactDatabase
+
+logger = logging.getLogger(__name__)
+
+_MEMBER_PATTERN = re.compile(r"CIK(\d{10})\.json$")
+
+_archive: Optional[zipfile.ZipFile] = None  # Per worker process, opened on first use
+
+
+def parse_company_facts(body: bytes) -> Dict[str, Any]:
+    """
+    Flatten one companyfacts document to fact rows.
+
+    Args:
+        body: companyfacts JSON of one company
+
+    Returns:
+        Dictionary with cik, name and concepts: a list of
+        (taxonomy, concept name, label, [FactRow, ...])
+    """
+    data = json.loads(body)
+    concepts = []
+    for taxonomy, taxonomy_facts in data.get('facts', {}).items():
+        for name, concept in taxonomy_facts.items():
+            rows = []
+            for unit, facts in concept.get('units', {}).items():
+                for fact in facts:
+                    rows.append((unit, fact.get('start'), fact['end'], fact.get('val'), fact.get('fy'), fact.get('fp'),
+                                 fact.get('form'), fact.get('filed'), fact.get('accn'), fact.get('frame')))
+            concepts.append((taxonomy, name, concept.get('label'), rows))
+    return {'cik': int(data['cik']), 'name': data.get('entityName', ''), 'concepts': concepts}
+
+
+def _parse_archive_member(zip_path: str, member: str) -> Dict[str, Any]:
+    global _archive
+    if _archive is None or _archive.filename != zip_path:
+        _archive = zipfile.ZipFile(zip_path)
+    return parse_company_facts(_archive.read(member))
+
+
+def cik_of_member(member: str) -> Optional[int]:
+    """CIK of a companyfacts.zip member named CIK##########.json."""
+    match = _MEMBER_PATTERN.search(member)
+    return int(match.group(1)) if match else None
+
+
+def bounded_map(executor: Executor, fn: Callable, items: Iterable[Sequence], window: int) -> Iterator[Any]:
+    """
+    Run fn(*item) on the executor with at most `window` tasks outstanding.
+
+    Results are yielded as they complete, so finished work is written while
+    the remaining items are still being parsed, and parsed companies never
+    pile up in memory.
+    """
+    pending = set()
+    for item in items:
+        pending.add(executor.submit(fn, *item))
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    for future in pending:
+        yield future.result()
+
+
+def _write(db: FactDatabase, company: Dict[str, Any], progress: Dict[str, Any]):
+    count = db.write_company(company)
+    progress['companies'] += 1
+    progress['facts'] += count
+    if progress['companies'] % 50 == 0:
+        elapsed = time.perf_counter() - progress['started']
+        logger.info(f"Ingested {progress['companies']} companies, {progress['facts']} facts in {elapsed:.0f}s")
+
+
+def ingest_archive(db: FactDatabase, zip_path: Path, ciks: Optional[Iterable[int]] = None,
+                   workers: Optional[int] = FACT_INGEST_WORKERS, force: bool = False) -> Dict[str, Any]:
+    """
+    Ingest companies from a local companyfacts.zip.
+
+    Args:
+        db: Fact database to write to
+        zip_path: Path of companyfacts.zip
+        ciks: Only these companies (None for every company in the archive)
+        workers: Process pool size (None = CPU count)
+        force: Re-ingest companies that are already stored
+
+    Returns:
+        Dictionary with companies and facts written, companies skipped as
+        already stored, archive members filtered out by `ciks`, and seconds taken
+    """
+    with zipfile.ZipFile(zip_path) as archive:
+        members = [(member, cik_of_member(member)) for member in archive.namelist()]
+    wanted = set(ciks) if ciks is not None else None
+    candidates = [(member, cik) for member, cik in members if cik is not None and (wanted is None or cik in wanted)]
+    done = set() if force else db.ingested_ciks()
+    todo = [member for member, cik in candidates if cik not in done]
+
+    progress = {'companies': 0, 'facts': 0, 'skipped': len(candidates) - len(todo),
+                'filtered': len(members) - len(candidates), 'started': time.perf_counter()}
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        tasks = ((str(zip_path), member) for member in todo)
+        for company in bounded_map(pool, _parse_archive_member, tasks, window=2 * workers):
+            _write(db, company, progress)
+    progress['seconds'] = time.perf_counter() - progress.pop('started')
+    return progress
+
+
+async def ingest_from_sec(db: FactDatabase, client, ciks: List[int], workers: Optional[int] = FACT_INGEST_WORKERS,
+                          force: bool = False) -> Dict[str, Any]:
+    """
+    Download and ingest companies through the companyfacts API.
+
+    Downloads go through the SEC client, so they are rate limited and cached;
+    parsing runs on a process pool and writes on a worker thread, one
+    company at a time, while the next companies download.
+
+    Args:
+        db: Fact database to write to
+        client: SECClient
+        ciks: Companies to ingest
+        workers: Process pool size (None = CPU count)
+        force: Re-ingest companies that are already stored
+
+    Returns:
+        Dictionary with companies and facts written, companies skipped or failed, and seconds taken
+    """
+    done = set() if force else db.ingested_ciks()
+    todo = [cik for cik in ciks if cik not in done]
+    progress = {'companies': 0, 'facts': 0, 'skipped': len(ciks) - len(todo), 'failed': 0,
+                'started': time.perf_counter()}
+    loop = asyncio.get_running_loop()
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(workers) as pool:
+        slots = asyncio.Semaphore(2 * workers)
+        write_lock = asyncio.Lock()  # SQLite takes one writer at a time
+
+        async def ingest_one(cik: int):
+            async with slots:
+                body = await client.get_company_facts(str(cik).zfill(10))
+                if body is None:
+                    progress['failed'] += 1
+                    return
+                company = await loop.run_in_executor(pool, parse_company_facts, body)
+                async with write_lock:
+                    await asyncio.to_thread(_write, db, company, progress)
+
+        await asyncio.gather(*(ingest_one(cik) for cik in todo))
+    progress['seconds'] = time.perf_counter() - progress.pop('started')
+    return progress
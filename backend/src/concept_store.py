@@ -0,0 +1,211 @@
+# backend/src/concept_store.py
+"""
+Columnar storage for concept metadata.
+
+Concepts get dense integer IDs. Free-text attributes are kept in one list
+per column; low-cardinality attributes (data type, period type, balance,
+substitution group, namespace prefix) are dictionary-encoded into small
+integer arrays over interned value tables, and flags are boolean arrays.
+Alternate-role labels (terse, total, negated, ...) are sparse per-role
+maps, and documentation lives in a memory-mapped DocumentationStore.
+ConceptView gives dict-style and attribute access to one row without
+materializing it.
+"""
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .config import DOCUMENTATION_DIR
+from .documentation_store import DocumentationStore
+
+# Columns stored as dictionary-encoded integer codes
+ENUM_COLUMNS = ('data_type', 'period_type', 'balance_type', 'substitution_group')
+FLAG_COLUMNS = ('is_deprecated', 'is_abstract')
+CONCEPT_FIELDS = ('name', 'qname', 'label', 'documentation', 'data_type', 'period_type',
+                  'balance_type', 'is_deprecated', 'is_abstract', 'substitution_group')
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _encode(values: List[Optional[str]]) -> Tuple[List[Optional[str]], np.ndarray]:
+    """Dictionary-encode a column into (value table, codes)."""
+    table = list(dict.fromkeys(values))
+    lookup = {value: code for code, value in enumerate(table)}
+    dtype = np.uint8 if len(table) <= 0xFF else np.uint16
+    codes = np.fromiter((lookup[value] for value in values), dtype=dtype, count=len(values))
+    return [_intern(value) for value in table], codes
+
+
+def _string_list_bytes(values: List[Optional[str]]) -> int:
+    """Bytes held by a list of strings, counting each distinct object once."""
+    seen = set()
+    total = sys.getsizeof(values)
+    for value in values:
+        if value is not None and id(value) not in seen:
+            seen.add(id(value))
+            total += sys.getsizeof(value)
+    return total
+
+
+class ConceptView:
+    """Lightweight read-only view of one concept row."""
+
+    __slots__ = ('_store', 'id')
+
+    def __init__(self, store: "ConceptStore", concept_id: int):
+        self._store = store
+        self.id = concept_id
+
+    def __getattr__(self, field: str) -> Any:
+        if field in CONCEPT_FIELDS:
+            return self._store.value(self.id, field)
+        raise AttributeError(field)
+
+    def __getitem__(self, field: str) -> Any:
+        if field not in CONCEPT_FIELDS:
+            raise KeyError(field)
+        return self._store.value(self.id, field)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """Dict-style access, for code written against the old dict layout."""
+        if field not in CONCEPT_FIELDS:
+            return default
+        return self._store.value(self.id, field)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the row as a concept info dict."""
+        return {field: self._store.value(self.id, field) for field in CONCEPT_FIELDS}
+
+    def __repr__(self) -> str:
+        return f"ConceptView({self.name!r})"
+
+
+class ConceptStore(Mapping):
+    """Column-wise concept table keyed by concept name."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.labels: List[Optional[str]] = []
+        self.role_labels: Dict[str, Dict[int, str]] = {}
+        self.documentation: Optional[DocumentationStore] = None
+        self.prefixes: List[Optional[str]] = []
+        self.prefix_codes = np.zeros(0, dtype=np.uint8)
+        self.enum_tables: Dict[str, List[Optional[str]]] = {}
+        self.enum_codes: Dict[str, np.ndarray] = {}
+        self.flags: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_dicts(cls, concepts: Mapping[str, Dict[str, Any]],
+                   documentation_dir: Path = DOCUMENTATION_DIR) -> "ConceptStore":
+        """
+        Build a store from the extractor's dict-of-dicts layout.
+
+        Args:
+            concepts: Mapping of concept name to concept info dict
+            documentation_dir: Directory for the documentation blob file
+
+        Returns:
+            Populated ConceptStore; IDs follow the mapping's order
+        """
+        store = cls()
+        infos = list(concepts.values())
+        store.names = [sys.intern(info['name']) for info in infos]
+        store.ids = {name: concept_id for concept_id, name in enumerate(store.names)}
+
+        # Labels equal to the name share the name's string object
+        store.labels = [
+            store.names[i] if info.get('label') == info['name'] else _intern(info.get('label'))
+            for i, info in enumerate(infos)
+        ]
+        for concept_id, info in enumerate(infos):
+            for role, text in (info.get('labels') or {}).items():
+                store.role_labels.setdefault(sys.intern(role), {})[concept_id] = sys.intern(text)
+        store.documentation = DocumentationStore.write((info.get('documentation') for info in infos), documentation_dir)
+
+        prefixes = []
+        for info in infos:
+            qname = info.get('qname') or info['name']
+            prefix, sep, _ = qname.rpartition(':')
+            prefixes.append(prefix if sep else None)
+        store.prefixes, store.prefix_codes = _encode(prefixes)
+
+        for column in ENUM_COLUMNS:
+            store.enum_tables[column], store.enum_codes[column] = _encode([info.get(column) for info in infos])
+        for column in FLAG_COLUMNS:
+            store.flags[column] = np.fromiter((bool(info.get(column, False)) for info in infos), dtype=bool, count=len(infos))
+        return store
+
+    def value(self, concept_id: int, field: str) -> Any:
+        """Read one field of one concept."""
+        if field == 'name':
+            return self.names[concept_id]
+        if field == 'label':
+            return self.labels[concept_id]
+        if field == 'documentation':
+            return self.documentation.get(concept_id)
+        if field in self.enum_codes:
+            return self.enum_tables[field][self.enum_codes[field][concept_id]]
+        if field in self.flags:
+            return bool(self.flags[field][concept_id])
+        if field == 'qname':
+            prefix = self.prefixes[self.prefix_codes[concept_id]]
+            name = self.names[concept_id]
+            return f"{prefix}:{name}" if prefix else name
+        raise KeyError(field)
+
+    def labels_of(self, concept_id: int) -> Dict[str, str]:
+        """Alternate-role labels of one concept, keyed by role short name."""
+        return {role: labels[concept_id] for role, labels in self.role_labels.items() if concept_id in labels}
+
+    def view(self, concept_id: int) -> ConceptView:
+        """View of the concept with the given ID."""
+        return ConceptView(self, concept_id)
+
+    def __getitem__(self, name: str) -> ConceptView:
+        return ConceptView(self, self.ids[name])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __setstate__(self, state: Dict[str, Any]):
+        # Unpickled strings are fresh copies; interning them shares identical
+        # names and labels with every other taxonomy version in the process
+        self.__dict__.update(state)
+        self.names = [sys.intern(name) for name in self.names]
+        self.ids = {name: concept_id for concept_id, name in enumerate(self.names)}
+        self.labels = [_intern(label) for label in self.labels]
+        self.role_labels = {
+            sys.intern(role): {concept_id: sys.intern(text) for concept_id, text in labels.items()}
+            for role, labels in self.role_labels.items()
+        }
+        self.prefixes = [_intern(prefix) for prefix in self.prefixes]
+        self.enum_tables = {column: [_intern(value) for value in table] for column, table in self.enum_tables.items()}
+
+    def memory_report(self) -> Dict[str, int]:
+        """Approximate bytes held per column."""
+        report = {
+            'name': _string_list_bytes(self.names) + sys.getsizeof(self.ids),
+            'label': _string_list_bytes([label for label, name in zip(self.labels, self.names) if label is not name])
+                     + sys.getsizeof(self.labels),
+            'role_labels': sum(sys.getsizeof(labels) + _string_list_bytes(list(labels.values()))
+                               for labels in self.role_labels.values()),
+            # Only the offsets are resident; the texts stay in the mapped blob
+            'documentation': self.documentation.offsets.nbytes,
+            'qname_prefix': self.prefix_codes.nbytes + _string_list_bytes(self.prefixes),
+        }
+        for column in ENUM_COLUMNS:
+            report[column] = self.enum_codes[column].nbytes + _string_list_bytes(self.enum_tables[column])
+        for column in FLAG_COLUMNS:
+            report[column] = self.flags[column].nbytes
+        return report
@@ -9,14 +9,25 @@ BACKEND_DIR = BASE_DIR / "backend"
 TAXONOMIES_DIR = BASE_DIR / "taxonomies"
 
 # Taxonomy paths
-US_GAAP_ENTRY_POINT = TAXONOMIES_DIR / "us-gaap-2025" / "entire" / "us-gaap-entryPoint-all-2025.xsd"
+US_GAAP_TAXONOMY_DIR = TAXONOMIES_DIR / "us-gaap-2025"
+US_GAAP_ENTRY_POINT = US_GAAP_TAXONOMY_DIR / "entire" / "us-gaap-entryPoint-all-2025.xsd"
+
+# Taxonomy versions served side by side: version -> taxonomy directory. Empty means
+# every taxonomies/us-gaap-<version>/ directory; each needs entire/us-gaap-entryPoint-all-<version>.xsd
+TAXONOMY_VERSIONS = {}
+DEFAULT_TAXONOMY_VERSION = "2025"  # Used when a request names no version
 
 # SEC EDGAR settings
 SEC_BASE_URL = "https://data.sec.gov"
 SEC_ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data"
 SEC_COMPANY_FACTS_URL = "https://data.sec.gov/api/xbrl/companyfacts"
 SEC_SUBMISSIONS_URL = "https://data.sec.gov/submissions"
-SEC_API_DELAY = 0.1  # Delay between SEC API requests (seconds)
+SEC_API_DELAY = 0.1  # Average interval between SEC API requests across all workers (seconds)
+SEC_RATE_LIMIT_BURST = 1  # Requests that may go out back to back after an idle period
+SEC_MAX_CONNECTIONS = 10  # Pooled keep-alive connections to SEC hosts
+SEC_REQUEST_TIMEOUT_SECONDS = 30
+SEC_MAX_RETRIES = 3  # Retries of a request that failed with 429, 5xx or a connection error
+SEC_RETRY_BACKOFF_SECONDS = 0.5  # Base of the jittered exponential backoff between retries
 
 # User agent for SEC requests (required by SEC)
 SEC_USER_AGENT = "XBRL-Searcher 1.0 educational@example.com"
@@ -24,15 +35,59 @@ SEC_USER_AGENT = "XBRL-Searcher 1.0 educational@example.com"
 # Cache settings
 CACHE_DIR = BASE_DIR / "cache"
 CACHE_EXPIRY_HOURS = 24
+SEC_RATE_LIMIT_STATE = CACHE_DIR / "sec-rate-limit.bin"  # Token bucket shared by every worker on this host
+
+# SEC response cache settings
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+# (URL regex, seconds an entry stays fresh or None for never); first match wins, else CACHE_EXPIRY_HOURS
+HTTP_CACHE_TTL_POLICY = [
+    (r"/Archives/edgar/data/", None),  # Filed documents never change
+    (r"/submissions/", 15 * 60),  # New filings show up here first
+    (r"/api/xbrl/", 6 * 3600),
+]
+HTTP_CACHE_ONLY = False  # Serve SEC data from the cache only, never the network (offline replays)
+
+# Local companyfacts database (python -m backend.src.cli ingest-companyfacts)
+FACT_DB_PATH = CACHE_DIR / "companyfacts.sqlite"
+FACT_INGEST_WORKERS = None  # Process pool size for parsing companyfacts JSON (None = CPU count)
+FRAME_STORE_DIR = CACHE_DIR / "frames"  # Memory-mapped columns for cross-sectional frame queries
+
+# Filing sweep settings (python -m backend.src.cli sweep, POST /jobs/sweep)
+SWEEP_RESULTS_DIR = CACHE_DIR / "sweeps"  # One subdirectory of per-company result files per sweep
+SWEEP_FORM_TYPES = ["10-K", "10-Q"]  # Latest filing of each form type is analyzed
+SWEEP_CONCURRENCY = 8  # Companies in flight at once; the SEC rate limit still paces requests
+
+# Taxonomy snapshot settings
+SNAPSHOT_DIR = CACHE_DIR / "snapshots"
+SNAPSHOT_FORMAT_VERSION = 11  # Bump whenever the snapshot contents change shape
+USE_TAXONOMY_SNAPSHOT = True
+DOCUMENTATION_DIR = CACHE_DIR / "documentation"  # Memory-mapped concept documentation blobs, one subdirectory per version
+PARSE_CACHE_DIR = CACHE_DIR / "parsed"  # Per-file parse results reused when only some taxonomy files change
+TAXONOMY_RETRY_AFTER_SECONDS = 5  # Retry-After sent with 503s while the taxonomy loads in the background
+
+# Taxonomy extraction settings
+TAXONOMY_EXTRACTOR = "arelle"  # "arelle" (full DTS, imported schemas included) or "lxml" (package schemas only)
+TAXONOMY_EXTRACTOR_WORKERS = None  # Process pool size for the lxml extractor (None = CPU count)
+
+# Search result cache settings
+SEARCH_CACHE_SIZE = 1024  # Maximum cached queries (0 disables the cache)
+SEARCH_CACHE_TTL_SECONDS = 600
 
 # Arelle settings
 ARELLE_LOG_LEVEL = "WARNING"  # Reduce Arelle logging noise
+ARELLE_WORK_OFFLINE = True  # Resolve taxonomy files locally only; an unmapped import fails the load
+TAXONOMY_PACKAGE_DIRS = []  # Extra unpacked taxonomy packages (e.g. SEC dei, srt) whose META-INF/catalog.xml remaps URLs
+BASE_SCHEMAS_DIR = TAXONOMIES_DIR / "base"  # Other schemas mirrored as <host>/<path>, e.g. xbrl.sec.gov/dei/2025/dei-2025.xsd
 
 # API Settings
 API_TITLE = "XBRL Search API"
 API_VERSION = "1.0.0"
 API_DESCRIPTION = "Search and analyze XBRL financial documents"
 
+# Taxonomy reload settings
+TAXONOMY_WATCH_INTERVAL_SECONDS = 0  # Poll the taxonomy directory and reload on change (0 disables)
+ADMIN_TOKEN = None  # Admin endpoints require a matching X-Admin-Token header; disabled (403) while unset
+
 # Server Settings
 HOST = "0.0.0.0"
 PORT = 8000
@@ -58,6 +113,8 @@ class SimpleSettings:
         
         # Taxonomy Settings
         self.taxonomy_path = US_GAAP_ENTRY_POINT
+        self.taxonomy_versions = TAXONOMY_VERSIONS
+        self.default_taxonomy_version = DEFAULT_TAXONOMY_VERSION
         
         # SEC Settings
         self.sec_base_url = SEC_BASE_URL
@@ -66,14 +123,53 @@ class SimpleSettings:
         self.sec_submissions_url = SEC_SUBMISSIONS_URL
         self.sec_user_agent = SEC_USER_AGENT
         self.sec_api_delay = SEC_API_DELAY
+        self.sec_rate_limit_burst = SEC_RATE_LIMIT_BURST
+        self.sec_rate_limit_state = SEC_RATE_LIMIT_STATE
+        self.sec_max_connections = SEC_MAX_CONNECTIONS
+        self.sec_request_timeout_seconds = SEC_REQUEST_TIMEOUT_SECONDS
+        self.sec_max_retries = SEC_MAX_RETRIES
+        self.sec_retry_backoff_seconds = SEC_RETRY_BACKOFF_SECONDS
         
         # Cache Settings
         self.cache_dir = CACHE_DIR
         self.cache_expiry_hours = CACHE_EXPIRY_HOURS
+        self.http_cache_dir = HTTP_CACHE_DIR
+        self.http_cache_ttl_policy = HTTP_CACHE_TTL_POLICY
+        self.http_cache_only = HTTP_CACHE_ONLY
+        
+        # Fact Database Settings
+        self.fact_db_path = FACT_DB_PATH
+        self.fact_ingest_workers = FACT_INGEST_WORKERS
+        self.frame_store_dir = FRAME_STORE_DIR
+        
+        # Filing Sweep Settings
+        self.sweep_results_dir = SWEEP_RESULTS_DIR
+        self.sweep_form_types = SWEEP_FORM_TYPES
+        self.sweep_concurrency = SWEEP_CONCURRENCY
+        
+        # Snapshot Settings
+        self.snapshot_dir = SNAPSHOT_DIR
+        self.use_taxonomy_snapshot = USE_TAXONOMY_SNAPSHOT
+        self.documentation_dir = DOCUMENTATION_DIR
+        self.taxonomy_extractor = TAXONOMY_EXTRACTOR
+        self.taxonomy_extractor_workers = TAXONOMY_EXTRACTOR_WORKERS
+        self.parse_cache_dir = PARSE_CACHE_DIR
+        self.taxonomy_retry_after_seconds = TAXONOMY_RETRY_AFTER_SECONDS
+        
+        # Reload Settings
+        self.taxonomy_watch_interval_seconds = TAXONOMY_WATCH_INTERVAL_SECONDS
+        self.admin_token = ADMIN_TOKEN
+        
+        # Search Cache Settings
+        self.search_cache_size = SEARCH_CACHE_SIZE
+        self.search_cache_ttl_seconds = SEARCH_CACHE_TTL_SECONDS
         
         # Logging
         self.log_level = LOG_LEVEL
         self.arelle_log_level = ARELLE_LOG_LEVEL
+        self.arelle_work_offline = ARELLE_WORK_OFFLINE
+        self.taxonomy_package_dirs = TAXONOMY_PACKAGE_DIRS
+        self.base_schemas_dir = BASE_SCHEMAS_DIR
 
 # Create settings instance
 settings = SimpleSettings()
@@ -0,0 +1,132 @@
+# backend/src/documentation_store.py
+"""
+Concept documentation kept on disk and read through a memory map.
+
+Documentation is the bulk of the concept text but is only shown on the
+detail view, so the texts are written once into a single UTF-8 blob with
+an offset table. Only the offsets stay resident. The blob is mapped on the
+first read and pages are faulted in by the OS as texts are requested.
+
+Blob files are content-addressed (named after a hash of their bytes), so
+rebuilding the same taxonomy reuses the existing file, and a snapshot only
+needs to record the file name and offsets.
+"""
+import hashlib
+import logging
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .config import DOCUMENTATION_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentationStore:
+    """Offset table over a memory-mapped documentation blob."""
+
+    def __init__(self, path: Path, offsets: np.ndarray):
+        self.path = Path(path)
+        self.offsets = offsets
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def write(cls, texts: Iterable[Optional[str]], directory: Path = DOCUMENTATION_DIR) -> "DocumentationStore":
+        """
+        Write documentation texts to a blob file.
+
+        Args:
+            texts: Documentation per concept ID; None or empty for none
+            directory: Directory holding blob files
+
+        Returns:
+            DocumentationStore over the written (or already present) blob
+        """
+        chunks = [(text or "").encode("utf-8") for text in texts]
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        blob = b"".join(chunks)
+
+        path = Path(directory) / f"documentation-{hashlib.sha256(blob).hexdigest()[:16]}.blob"
+        if not (path.exists() and path.stat().st_size == len(blob)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, path)
+
+        dtype = np.uint32 if offsets[-1] <= np.iinfo(np.uint32).max else np.int64
+        return cls(path, offsets.astype(dtype))
+
+    def is_available(self) -> bool:
+        """Whether the blob file is present and matches the offset table."""
+        return self.path.exists() and self.path.stat().st_size == int(self.offsets[-1])
+
+    def get(self, concept_id: int) -> Optional[str]:
+        """
+        Read the documentation of one concept.
+
+        Args:
+            concept_id: Dense concept ID
+
+        Returns:
+            Documentation text, or None if the concept has none
+        """
+        start, end = int(self.offsets[concept_id]), int(self.offsets[concept_id + 1])
+        if start == end:
+            return None
+        if self._map is None:
+            self.open()
+        return self._map[start:end].decode("utf-8")
+
+    def open(self):
+        """Map the blob now; a mapped blob stays readable after its file is pruned."""
+        with self._lock:
+            if self._map is None:
+                with open(self.path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def is_loaded(self) -> bool:
+        """Whether the blob has been mapped yet."""
+        return self._map is not None
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def blob_bytes(self) -> int:
+        """Size of the blob file."""
+        return int(self.offsets[-1])
+
+    def __getstate__(self):
+        # The map and lock are per process; only the file name and offsets persist
+        return {'path': self.path, 'offsets': self.offsets}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['offsets'])
+
+
+def prune_documentation(keep: Path, directory: Path = DOCUMENTATION_DIR) -> int:
+    """
+    Remove documentation blobs other than the one in use.
+
+    Args:
+        keep: Blob file to keep
+        directory: Directory holding blob files
+
+    Returns:
+        Number of files removed
+    """
+    removed = 0
+    for path in Path(directory).glob("documentation-*.blob"):
+        if path != Path(keep):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                # Windows refuses to delete a blob another loader still has mapped
+                logger.warning(f"Failed to remove documentation blob {path.name}: {e}")
+    return removed
@@ -0,0 +1,123 @@
+# backend/src/facet_index.py
+"""
+Bitmap index over concept metadata for faceted filtering.
+
+Each facet value owns a packed bitset over the dense concept ID space.
+Filters are resolved by OR-ing the bitsets of the requested values within a
+facet and AND-ing across facets, all as vectorized NumPy operations, before
+any text matching happens. Counts come straight from popcounts.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+FACETS = ('period_type', 'balance_type', 'data_type', 'is_abstract', 'substitution_group', 'is_deprecated')
+
+
+class FacetIndex:
+    """Packed bitsets per facet value."""
+
+    def __init__(self):
+        self.size = 0
+        self.bitmaps: Dict[str, Dict[Any, np.ndarray]] = {facet: {} for facet in FACETS}
+
+    @classmethod
+    def build(cls, documents: Iterable[Dict[str, Any]]) -> "FacetIndex":
+        """
+        Build the index.
+
+        Args:
+            documents: One concept dict per concept ID
+
+        Returns:
+            Populated FacetIndex
+        """
+        index = cls()
+        values: Dict[str, List[Any]] = {facet: [] for facet in FACETS}
+        for doc in documents:
+            for facet in FACETS:
+                value = doc.get(facet)
+                if facet in ('is_abstract', 'is_deprecated'):
+                    value = bool(value)
+                values[facet].append(value)
+            index.size += 1
+
+        for facet, column in values.items():
+            column_array = np.asarray(column, dtype=object)
+            for value in dict.fromkeys(column):
+                index.bitmaps[facet][value] = np.packbits(column_array == value)
+        return index
+
+    def all_bits(self) -> np.ndarray:
+        """Packed bitset with every concept set."""
+        return np.packbits(np.ones(self.size, dtype=bool))
+
+    def filter_bits(self, filters: Optional[Dict[str, Any]] = None, include_deprecated: bool = True) -> np.ndarray:
+        """
+        Resolve facet filters to a packed bitset.
+
+        Args:
+            filters: Mapping of facet name to a value or list of values;
+                None values are ignored
+            include_deprecated: Whether deprecated concepts may match
+
+        Returns:
+            Packed bitset of concepts passing every filter
+        """
+        bits = self.all_bits()
+        for facet, wanted in (filters or {}).items():
+            if wanted is None:
+                continue
+            if facet not in self.bitmaps:
+                raise ValueError(f"Unknown facet: {facet}")
+            wanted_values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            facet_bits = np.zeros_like(bits)
+            for value in wanted_values:
+                value_bits = self.bitmaps[facet].get(value)
+                if value_bits is not None:
+                    facet_bits |= value_bits
+            bits &= facet_bits
+
+        if not include_deprecated:
+            deprecated = self.bitmaps['is_deprecated'].get(True)
+            if deprecated is not None:
+                bits &= ~deprecated
+        return bits
+
+    def to_mask(self, bits: np.ndarray) -> np.ndarray:
+        """Unpack a bitset into a boolean array indexed by concept ID."""
+        return np.unpackbits(bits, count=self.size).view(bool)
+
+    def from_mask(self, mask: np.ndarray) -> np.ndarray:
+        """Pack a boolean array indexed by concept ID into a bitset."""
+        return np.packbits(mask)
+
+    @staticmethod
+    def count(bits: np.ndarray) -> int:
+        """Number of concepts set in a bitset."""
+        return int(np.bitwise_count(bits).sum())
+
+    def counts(self, bits: Optional[np.ndarray] = None, facets: Iterable[str] = FACETS) -> Dict[str, Dict[Any, int]]:
+        """
+        Count concepts per facet value.
+
+        Args:
+            bits: Optional bitset restricting which concepts are counted
+            facets: Facets to count
+
+        Returns:
+            Mapping of facet name to {value: count}, omitting zero counts
+        """
+        result = {}
+        for facet in facets:
+            facet_counts = {}
+            for value, value_bits in self.bitmaps[facet].items():
+                count = self.count(value_bits if bits is None else value_bits & bits)
+                if count:
+                    facet_counts[value] = count
+            result[facet] = facet_counts
+        return result
+
+    def memory_bytes(self) -> int:
+        """Memory held by the bitsets."""
+        return sum(bits.nbytes for values in self.bitmaps.values() for bits in values.values())
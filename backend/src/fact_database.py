@@ -0,0 +1,242 @@
+# backend/src/fact_database.py
+"""
+Local SQLite store of SEC companyfacts data.
+
+Each company's facts are written in one transaction together with its row
+in `companies`, which doubles as the ingestion checkpoint: a company is
+either fully present or absent, so an interrupted ingest resumes by
+skipping the CIKs already listed. Concept names are stored once in
+`concepts`, and `facts` is indexed on (cik, concept_id, period_end, form),
+so a company's series for one concept is a single index range scan.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .config import FACT_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    cik INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    fact_count INTEGER NOT NULL,
+    ingested_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS concepts (
+    id INTEGER PRIMARY KEY,
+    taxonomy TEXT NOT NULL,
+    name TEXT NOT NULL,
+    label TEXT,
+    UNIQUE (taxonomy, name)
+);
+CREATE INDEX IF NOT EXISTS concepts_name ON concepts (name);
+CREATE TABLE IF NOT EXISTS facts (
+    cik INTEGER NOT NULL,
+    concept_id INTEGER NOT NULL,
+    unit TEXT NOT NULL,
+    period_start TEXT,
+    period_end TEXT NOT NULL,
+    value REAL,
+    fy INTEGER,
+    fp TEXT,
+    form TEXT,
+    filed TEXT,
+    accession TEXT,
+    frame TEXT
+);
+CREATE INDEX IF NOT EXISTS facts_lookup ON facts (cik, concept_id, period_end, form);
+"""
+
+# (unit, period_start, period_end, value, fy, fp, form, filed, accession, frame)
+FactRow = Tuple[str, Optional[str], str, Optional[float], Optional[int], Optional[str], Optional[str],
+                Optional[str], Optional[str], Optional[str]]
+
+
+class FactDatabase:
+    """companyfacts store: one writer during ingestion, any number of readers while serving."""
+
+    def __init__(self, path: Path = FACT_DB_PATH, readonly: bool = False):
+        self.path = Path(path)
+        self.readonly = readonly
+        self._local = threading.local()
+        self._concept_ids: Dict[Tuple[str, str], int] = {}
+        if not readonly:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connection()
+            conn.executescript(_SCHEMA)
+            self._load_concept_ids()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread, opened on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            if self.readonly:
+                conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            else:
+                conn = sqlite3.connect(self.path)
+                conn.execute("PRAGMA journal_mode=WAL")  # Readers keep serving during an ingest
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _load_concept_ids(self):
+        rows = self._connection().execute("SELECT taxonomy, name, id FROM concepts")
+        self._concept_ids = {(taxonomy, name): concept_id for taxonomy, name, concept_id in rows}
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def ingested_ciks(self) -> Set[int]:
+        """CIKs whose facts are completely stored."""
+        return {cik for (cik,) in self._connection().execute("SELECT cik FROM companies")}
+
+    def _concept_id(self, conn: sqlite3.Connection, taxonomy: str, name: str, label: Optional[str]) -> int:
+        concept_id = self._concept_ids.get((taxonomy, name))
+        if concept_id is None:
+            cursor = conn.execute("INSERT INTO concepts (taxonomy, name, label) VALUES (?, ?, ?)", (taxonomy, name, label))
+            concept_id = self._concept_ids[(taxonomy, name)] = cursor.lastrowid
+        return concept_id
+
+    def write_company(self, company: Dict[str, Any]) -> int:
+        """
+        Replace one company's facts atomically.
+
+        Args:
+            company: Parsed companyfacts with cik, name and concepts, a list of
+                (taxonomy, concept name, label, [FactRow, ...])
+
+        Returns:
+            Number of facts written
+        """
+        conn = self._connection()
+        cik = company['cik']
+        count = 0
+        try:
+            with conn:
+                conn.execute("DELETE FROM facts WHERE cik = ?", (cik,))
+                for taxonomy, name, label, rows in company['concepts']:
+                    concept_id = self._concept_id(conn, taxonomy, name, label)
+                    conn.executemany("INSERT INTO facts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                     [(cik, concept_id, *row) for row in rows])
+                    count += len(rows)
+                conn.execute("INSERT OR REPLACE INTO companies VALUES (?, ?, ?, ?)",
+                             (cik, company['name'], count, time.time()))
+        except Exception:
+            # Concepts inserted by the rolled-back transaction are gone again
+            self._load_concept_ids()
+            raise
+        return count
+
+    def company(self, cik: int) -> Optional[Dict[str, Any]]:
+        """Stored company row, or None if the company was not ingested."""
+        row = self._connection().execute("SELECT name, fact_count, ingested_at FROM companies WHERE cik = ?",
+                                         (cik,)).fetchone()
+        if row is None:
+            return None
+        return {'cik': str(cik).zfill(10), 'name': row[0], 'fact_count': row[1], 'ingested_at': row[2]}
+
+    def _resolve_concept(self, concept: str) -> Optional[Tuple[int, str, str, Optional[str]]]:
+        """Concept by name or taxonomy:name; a bare name prefers us-gaap."""
+        taxonomy, _, name = concept.rpartition(":")
+        conn = self._connection()
+        if taxonomy:
+            rows = conn.execute("SELECT id, taxonomy, name, label FROM concepts WHERE taxonomy = ? AND name = ?",
+                                (taxonomy, name)).fetchall()
+        else:
+            rows = conn.execute("SELECT id, taxonomy, name, label FROM concepts WHERE name = ? "
+                                "ORDER BY taxonomy != 'us-gaap', taxonomy", (name,)).fetchall()
+        return rows[0] if rows else None
+
+    def concept_series(self, cik: int, concept: str, unit: Optional[str] = None, form: Optional[str] = None,
+                       latest_only: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Time series of one concept reported by one company.
+
+        Args:
+            cik: Company CIK
+            concept: Concept name, optionally prefixed with its taxonomy (dei:EntityCommonStockSharesOutstanding)
+            unit: Only facts in this unit (e.g. USD)
+            form: Only facts from this form type (e.g. 10-K)
+            latest_only: Keep only the most recently filed value per period; later
+                filings repeat (and sometimes restate) earlier periods
+
+        Returns:
+            Dictionary with the concept and its facts grouped by unit in period
+            order, or None if the concept is unknown
+        """
+        resolved = self._resolve_concept(concept)
+        if resolved is None:
+            return None
+        concept_id, taxonomy, name, label = resolved
+
+        sql = ("SELECT unit, period_start, period_end, value, fy, fp, form, filed, accession, frame FROM facts "
+               "WHERE cik = ? AND concept_id = ?")
+        params: List[Any] = [cik, concept_id]
+        if form is not None:
+            sql += " AND form = ?"
+            params.append(form)
+        if unit is not None:
+            sql += " AND unit = ?"
+            params.append(unit)
+        sql += " ORDER BY period_end, filed"
+
+        units: Dict[str, Dict[Tuple, Dict[str, Any]]] = {}
+        for row in self._connection().execute(sql, params):
+            fact = {'start': row[1], 'end': row[2], 'value': row[3], 'fy': row[4], 'fp': row[5], 'form': row[6],
+                    'filed': row[7], 'accession': row[8], 'frame': row[9]}
+            facts = units.setdefault(row[0], {})
+            # Rows arrive in filing order within a period, so the last one wins
+            facts[(row[1], row[2]) if latest_only else len(facts)] = fact
+
+        return {
+            'taxonomy': taxonomy,
+            'concept': name,
+            'label': label,
+            'units': {unit_name: list(facts.values()) for unit_name, facts in units.items()},
+        }
+
+    def company_names(self) -> Dict[int, str]:
+        """Name of every stored company by CIK."""
+        return dict(self._connection().execute("SELECT cik, name FROM companies"))
+
+    def concept_names(self) -> Dict[int, str]:
+        """taxonomy:name of every stored concept by ID."""
+        rows = self._connection().execute("SELECT id, taxonomy, name FROM concepts")
+        return {concept_id: f"{taxonomy}:{name}" for concept_id, taxonomy, name in rows}
+
+    def frame_facts(self, batch_size: int = 100000) -> Iterator[List[Tuple[int, str, str, int, float]]]:
+        """
+        Numeric facts SEC assigned to a calendar frame, oldest filing first.
+
+        Yields:
+            Batches of (concept_id, frame, unit, cik, value)
+        """
+        cursor = self._connection().execute("SELECT concept_id, frame, unit, cik, value FROM facts "
+                                            "WHERE frame IS NOT NULL AND value IS NOT NULL ORDER BY filed")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield rows
+
+    def stats(self) -> Dict[str, Any]:
+        """Row counts and file size."""
+        conn = self._connection()
+        return {
+            'companies': conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0],
+            'concepts': conn.execute("SELECT COUNT(*) FROM concepts").fetchone()[0],
+            'facts': conn.execute("SELECT COALESCE(SUM(fact_count), 0) FROM companies").fetchone()[0],
+            'size_bytes': self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+    def close(self):
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,233 @@
+# backend/src/filing_sweep.py
+"""
+Concurrent sweep of the latest filings of a company list (SP500_LIST by default).
+
+For each company the sweep resolves the ticker to a CIK, looks up the
+latest filing of every requested form type from one submissions request,
+then downloads, parses and classifies those filings. Companies run
+concurrently; the SEC client's shared token bucket keeps the whole sweep
+within the EDGAR rate limit, so concurrency only hides latency.
+
+Each finished company is written to <output_dir>/<TICKER>.json, which is
+also the checkpoint: a restarted sweep skips every company that already
+has a result file. Companies that fail are logged and retried next run.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .classifier import FinancialStatementClassifier
+from .config import SWEEP_CONCURRENCY, SWEEP_FORM_TYPES, SWEEP_RESULTS_DIR
+from .sec_client import SECClient
+from .sp500_list import SP500_LIST
+
+logger = logging.getLogger(__name__)
+
+# Tickers become result file names, so only these characters are accepted
+TICKER_PATTERN = r"^[A-Za-z0-9.\-]+$"
+
+
+def result_path(output_dir: Path, ticker: str) -> Path:
+    """Result file of one company."""
+    return Path(output_dir) / f"{ticker.upper()}.json"
+
+
+def _write_result(path: Path, result: Dict[str, Any]):
+    tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+    tmp_path.write_text(json.dumps(result, indent=2))
+    os.replace(tmp_path, path)
+
+
+async def analyze_filing(client: SECClient, classifier: FinancialStatementClassifier, cik: str,
+                         filing: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Download one filing and classify its financial statements.
+
+    Args:
+        client: SEC client
+        classifier: Statement classifier
+        cik: Zero-padded CIK
+        filing: Filing with accession_number, primary_document and filing_date
+
+    Returns:
+        Dictionary with the filing and its statements, or None if it has no XBRL data
+
+    Raises:
+        httpx.HTTPError: If the filing could not be downloaded
+    """
+    filing_data = await client.get_filing_data(cik, filing['accession_number'], filing['primary_document'],
+                                               filing['filing_date'])
+    if not filing_data:
+        return None
+    classification_results = await asyncio.to_thread(classifier.classify_statements, filing_data['facts'],
+                                                     filing_data['roles'])
+    return {
+        **filing,
+        'form_type': filing_data['form_type'],
+        'period_end': filing_data['period_end'],
+        'statements': {
+            stmt_type: {
+                'statement_type': info.statement_type,
+                'confidence': info.confidence,
+                'primary_concepts': info.primary_concepts,
+                'role_uri': info.role_uri,
+            }
+            for stmt_type, info in classification_results.items()
+        },
+        'summary': classifier.get_statement_summary(classification_results),
+        'total_concepts': len(filing_data['facts']),
+        'total_facts': len(filing_data['fact_table']),
+    }
+
+
+class SweepJob:
+    """One sweep run with pollable progress."""
+
+    def __init__(self, tickers: Optional[List[str]] = None, form_types: Optional[List[str]] = None,
+                 output_dir: Path = SWEEP_RESULTS_DIR / "sp500", concurrency: int = SWEEP_CONCURRENCY,
+                 force: bool = False):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.tickers = [ticker.upper() for ticker in (tickers or SP500_LIST)]
+        invalid = [ticker for ticker in self.tickers if not re.match(TICKER_PATTERN, ticker)]
+        if invalid:
+            raise ValueError(f"Invalid tickers: {', '.join(invalid)}")
+        self.form_types = list(form_types or SWEEP_FORM_TYPES)
+        self.output_dir = Path(output_dir)
+        self.concurrency = concurrency
+        self.force = force
+        self.state = 'queued'
+        self.completed = 0
+        self.skipped = 0
+        self.failed: Dict[str, str] = {}
+        self.filings = 0
+        self.created_at = datetime.now().isoformat()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def remaining(self) -> int:
+        return len(self.tickers) - self.completed - self.skipped - len(self.failed)
+
+    def status(self) -> Dict[str, Any]:
+        """Progress, throughput and ETA."""
+        elapsed = ((self.finished or time.monotonic()) - self.started) if self.started is not None else 0.0
+        per_minute = self.completed / elapsed * 60 if elapsed > 0 else 0.0
+        eta = self.remaining / per_minute * 60 if per_minute > 0 and self.state == 'running' else None
+        return {
+            'job_id': self.job_id,
+            'state': self.state,
+            'created_at': self.created_at,
+            'output_dir': str(self.output_dir),
+            'form_types': self.form_types,
+            'total': len(self.tickers),
+            'completed': self.completed,
+            'skipped': self.skipped,
+            'failed': len(self.failed),
+            'remaining': self.remaining,
+            'filings': self.filings,
+            'elapsed_seconds': round(elapsed, 1),
+            'companies_per_minute': round(per_minute, 1),
+            'eta_seconds': round(eta) if eta is not None else None,
+            'errors': dict(list(self.failed.items())[:20]),
+            'error': self.error,
+        }
+
+    async def _sweep_company(self, client: SECClient, classifier: FinancialStatementClassifier, ticker: str,
+                             cik: str, name: str):
+        latest = await client.get_latest_filings(cik, self.form_types)
+        if not latest:
+            raise LookupError(f"no {'/'.join(self.form_types)} filings found")
+
+        forms = list(latest)
+        analyses = await asyncio.gather(*(analyze_filing(client, classifier, cik, latest[form]) for form in forms),
+                                        return_exceptions=True)
+        # A form that failed to download leaves no checkpoint, so the next run retries the company
+        errors = [f"{form}: {analysis}" for form, analysis in zip(forms, analyses) if isinstance(analysis, Exception)]
+        if errors:
+            raise RuntimeError(f"download failed for {'; '.join(errors)}")
+        filings = {form: analysis for form, analysis in zip(forms, analyses) if analysis is not None}
+        if not filings:
+            raise LookupError("no XBRL data in the latest filings")
+
+        _write_result(result_path(self.output_dir, ticker), {
+            'ticker': ticker,
+            'cik': cik,
+            'company_name': name,
+            'filings': filings,
+            'swept_at': datetime.now().isoformat(),
+        })
+        self.filings += len(filings)
+
+    async def run(self, client: SECClient, classifier: FinancialStatementClassifier) -> Dict[str, Any]:
+        """
+        Sweep every company not yet checkpointed.
+
+        Args:
+            client: SEC client (its rate limiter paces every request)
+            classifier: Statement classifier
+
+        Returns:
+            Final status
+        """
+        self.state = 'running'
+        self.started = time.monotonic()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            todo = []
+            for ticker in self.tickers:
+                if not self.force and result_path(self.output_dir, ticker).exists():
+                    self.skipped += 1
+                else:
+                    todo.append(ticker)
+
+            index = await client.get_company_index()
+            slots = asyncio.Semaphore(self.concurrency)
+
+            async def sweep_one(ticker: str):
+                company = index.lookup_ticker(ticker)
+                if company is None:
+                    self.failed[ticker] = "unknown ticker"
+                    return
+                async with slots:
+                    try:
+                        await self._sweep_company(client, classifier, ticker, company['cik'], company['name'])
+                        self.completed += 1
+                    except Exception as e:
+                        self.failed[ticker] = str(e)
+                        logger.warning(f"Sweep of {ticker} failed: {e}")
+                        return
+                if self.completed % 25 == 0:
+                    status = self.status()
+                    logger.info(f"Swept {self.completed + self.skipped}/{len(self.tickers)} companies, "
+                                f"{status['companies_per_minute']}/min, ETA {status['eta_seconds']}s")
+
+            await asyncio.gather(*(sweep_one(ticker) for ticker in todo))
+            self.state = 'completed'
+
+        except asyncio.CancelledError:
+            self.state = 'cancelled'
+            raise
+        except Exception as e:
+            self.state = 'failed'
+            self.error = str(e)
+            logger.error(f"Sweep {self.job_id} failed: {e}")
+        finally:
+            self.finished = time.monotonic()
+        return self.status()
+
+    def start(self, client: SECClient, classifier: FinancialStatementClassifier) -> asyncio.Task:
+        """Run the sweep as a background task."""
+        self.task = asyncio.create_task(self.run(client, classifier))
+        return self.task
+
+    def is_active(self) -> bool:
+        return self.state in ('queued', 'running')
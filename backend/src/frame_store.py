@@ -0,0 +1,300 @@
+# backend/src/frame_store.py
+"""
+Columnar store of companyfacts values for cross-sectional "frame" queries.
+
+A frame is one concept for one SEC calendar period (CY2024, CY2024Q3, or
+CY2024Q4I for an instant) across every company. The store is built from
+the local fact database and written as plain .npy columns: dictionary
+codes for concept, period, unit and CIK plus the float64 value, sorted by
+(concept, period, unit, CIK). A frame is therefore one contiguous slice,
+found by binary search in a small (concept, period) key index.
+
+Columns are opened with np.load(mmap_mode='r'), so a query only touches the
+pages of its slice and every worker process shares the same page cache
+instead of holding its own copy. Company universes (the S&P 500) are
+resolved to CIKs when the store is built, so a frame query never needs
+the network. Builds go to a new version directory and
+are switched in by rewriting the CURRENT pointer, so readers pick up a
+rebuild on their next query while older maps stay valid.
+"""
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .config import FRAME_STORE_DIR
+from .fact_database import FactDatabase
+
+logger = logging.getLogger(__name__)
+
+PERIOD_PATTERN = re.compile(r"^CY\d{4}(Q[1-4])?I?$")
+PERCENTILES = (10, 25, 50, 75, 90)
+
+_COLUMNS = ('concept', 'period', 'unit', 'cik', 'value', 'keys', 'starts')
+_POINTER = "CURRENT"
+_KEEP_VERSIONS = 2  # Current build plus the one before it, which open readers may still map
+
+
+def _code(values: List[str], codes: Dict[str, int], value: str) -> int:
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(values)
+        values.append(value)
+    return code
+
+
+def _cik_codes(ciks: np.ndarray, members: Iterable[int]) -> np.ndarray:
+    """Codes of the given CIKs in the sorted CIK column; CIKs not in it are dropped."""
+    wanted = np.fromiter(members, np.int64)
+    rows = np.searchsorted(ciks, wanted)
+    found = rows < len(ciks)
+    found[found] = ciks[rows[found]] == wanted[found]
+    return rows[found].astype(np.int32)
+
+
+def build_frame_store(db: FactDatabase, directory: Path = FRAME_STORE_DIR,
+                      universes: Optional[Dict[str, Iterable[int]]] = None) -> Path:
+    """
+    Write a new frame store version from the fact database.
+
+    Only facts SEC assigned to a calendar frame are kept; SEC assigns each
+    frame at most one fact per company, concept and unit, and the most
+    recently filed one wins if a company still has several.
+
+    Args:
+        db: Fact database to read
+        directory: Frame store directory
+        universes: Named company subsets (e.g. sp500) as CIKs, queryable by name
+
+    Returns:
+        Path of the version directory written
+    """
+    concepts, periods, units = [], [], []
+    concept_codes, period_codes, unit_codes = {}, {}, {}
+    companies = db.company_names()
+    ciks = np.array(sorted(companies), dtype=np.int64)
+    concept_of = {concept_id: _code(concepts, concept_codes, name) for concept_id, name in db.concept_names().items()}
+
+    columns = {'concept': [], 'period': [], 'unit': [], 'cik': [], 'value': []}
+    for rows in db.frame_facts():
+        columns['concept'].append(np.fromiter((concept_of[row[0]] for row in rows), np.int32, len(rows)))
+        columns['period'].append(np.fromiter((_code(periods, period_codes, row[1]) for row in rows), np.int32,
+                                             len(rows)))
+        columns['unit'].append(np.fromiter((_code(units, unit_codes, row[2]) for row in rows), np.int32, len(rows)))
+        columns['cik'].append(np.searchsorted(ciks, np.fromiter((row[3] for row in rows), np.int64, len(rows))))
+        columns['value'].append(np.fromiter((row[4] for row in rows), np.float64, len(rows)))
+    arrays = {name: np.concatenate(parts) if parts else np.zeros(0) for name, parts in columns.items()}
+    return write_frame_store(arrays, concepts, periods, units, ciks, [companies[cik] for cik in ciks.tolist()],
+                             directory, universes)
+
+
+def write_frame_store(columns: Dict[str, np.ndarray], concepts: List[str], periods: List[str], units: List[str],
+                      ciks: np.ndarray, names: List[str], directory: Path = FRAME_STORE_DIR,
+                      universes: Optional[Dict[str, Iterable[int]]] = None) -> Path:
+    """
+    Sort, deduplicate and write dictionary-encoded fact columns as a new version.
+
+    Args:
+        columns: Equal-length concept, period, unit and cik codes and values,
+            oldest filing first
+        concepts: taxonomy:name per concept code
+        periods: Calendar frame name per period code
+        units: Unit per unit code
+        ciks: Sorted CIKs; cik codes index into it
+        names: Company name per cik code
+        directory: Frame store directory
+        universes: Named company subsets as CIKs; CIKs not in the store are dropped
+
+    Returns:
+        Path of the version directory written
+    """
+    directory = Path(directory)
+    arrays = dict(columns)
+
+    # Stable sort keeps filing order within a (concept, period, unit, cik) group, so the last row is the latest
+    order = np.lexsort((arrays['cik'], arrays['unit'], arrays['period'], arrays['concept']))
+    arrays = {name: column[order] for name, column in arrays.items()}
+    group = np.stack([arrays['concept'], arrays['period'], arrays['unit'], arrays['cik']])
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = (group[:, 1:] != group[:, :-1]).any(axis=0)
+    arrays = {name: column[last] for name, column in arrays.items()}
+
+    frame_keys = arrays['concept'].astype(np.int64) * max(len(periods), 1) + arrays['period']
+    keys, starts = np.unique(frame_keys, return_index=True)
+    arrays['keys'] = keys
+    arrays['starts'] = np.append(starts, len(frame_keys)).astype(np.int64)
+    arrays['concept'] = arrays['concept'].astype(np.int32)
+    arrays['period'] = arrays['period'].astype(np.int16)
+    arrays['unit'] = arrays['unit'].astype(np.int16)
+    arrays['cik'] = arrays['cik'].astype(np.int32)
+
+    version = directory / f"v{time.time_ns()}"
+    version.mkdir(parents=True)
+    for name in _COLUMNS:
+        np.save(version / f"{name}.npy", arrays[name])
+    np.save(version / "ciks.npy", ciks)
+    for name, members in (universes or {}).items():
+        np.save(version / f"universe-{name}.npy", _cik_codes(ciks, members))
+    (version / "meta.json").write_text(json.dumps({
+        'concepts': concepts,
+        'periods': periods,
+        'units': units,
+        'names': names,
+        'universes': sorted(universes or {}),
+        'built_at': time.time(),
+    }))
+
+    pointer = directory / _POINTER
+    tmp_pointer = pointer.with_suffix(f".tmp{os.getpid()}")
+    tmp_pointer.write_text(version.name)
+    os.replace(tmp_pointer, pointer)
+
+    for old in sorted(path for path in directory.glob("v*") if path.is_dir())[:-_KEEP_VERSIONS]:
+        shutil.rmtree(old, ignore_errors=True)
+    logger.info(f"Built frame store {version} with {len(arrays['value'])} facts in {len(keys)} frames")
+    return version
+
+
+class FrameStore:
+    """Memory-mapped frame store version with vectorized frame queries."""
+
+    def __init__(self, version: Path):
+        self.version = Path(version)
+        columns = {name: np.load(self.version / f"{name}.npy", mmap_mode='r') for name in _COLUMNS}
+        self.concept = columns['concept']
+        self.period = columns['period']
+        self.unit = columns['unit']
+        self.cik = columns['cik']
+        self.value = columns['value']
+        self.keys = columns['keys']
+        self.starts = columns['starts']
+        self.ciks = np.load(self.version / "ciks.npy")
+
+        meta = json.loads((self.version / "meta.json").read_text())
+        self.concepts: List[str] = meta['concepts']
+        self.periods: List[str] = meta['periods']
+        self.units: List[str] = meta['units']
+        self.names: List[str] = meta['names']
+        self.built_at: float = meta['built_at']
+        self.universes: Dict[str, np.ndarray] = {
+            name: np.load(self.version / f"universe-{name}.npy") for name in meta.get('universes', [])
+        }
+        self.concept_codes = {concept: code for code, concept in enumerate(self.concepts)}
+        self.period_codes = {period: code for code, period in enumerate(self.periods)}
+        # Bare names resolve to us-gaap first, then any other taxonomy
+        for code, concept in sorted(enumerate(self.concepts), key=lambda item: item[1].startswith("us-gaap:")):
+            self.concept_codes[concept.partition(":")[2]] = code
+
+    @classmethod
+    def open(cls, directory: Path = FRAME_STORE_DIR) -> Optional["FrameStore"]:
+        """Open the current version, or return None if no store has been built."""
+        try:
+            name = (Path(directory) / _POINTER).read_text().strip()
+        except FileNotFoundError:
+            return None
+        return cls(Path(directory) / name)
+
+    def is_current(self) -> bool:
+        """Whether this is still the version CURRENT points at."""
+        try:
+            return (self.version.parent / _POINTER).read_text().strip() == self.version.name
+        except FileNotFoundError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def frame(self, concept: str, period: str, unit: Optional[str] = None, ciks: Optional[Iterable[int]] = None,
+              universe: Optional[str] = None, ascending: bool = False, limit: int = 100) -> Optional[Dict[str, Any]]:
+        """
+        Rank every company's value of one concept in one calendar period.
+
+        Args:
+            concept: Concept name, optionally prefixed with its taxonomy (us-gaap:Revenues)
+            period: SEC calendar frame such as CY2024, CY2024Q3 or CY2024Q4I
+            unit: Unit to rank (default: the unit most companies report in)
+            ciks: Only these companies (None for all)
+            universe: Only the companies of a universe stored with the build
+            ascending: Rank smallest first instead of largest first
+            limit: Maximum ranked rows to return; stats cover the whole frame
+
+        Returns:
+            Dictionary with the frame, its stats and ranked rows, or None if
+            the concept or period is not in the store
+
+        Raises:
+            ValueError: If the period is not a calendar frame name
+            KeyError: If the universe was not stored with this build
+        """
+        if not PERIOD_PATTERN.match(period):
+            raise ValueError(f"Period must be a calendar frame such as CY2024, CY2024Q3 or CY2024Q4I: {period}")
+        if universe is not None and universe not in self.universes:
+            raise KeyError(f"Universe {universe} was not resolved when the frame store was built")
+        concept_code = self.concept_codes.get(concept)
+        period_code = self.period_codes.get(period)
+        if concept_code is None or period_code is None:
+            return None
+        key = concept_code * max(len(self.periods), 1) + period_code
+        position = int(np.searchsorted(self.keys, key))
+        if position == len(self.keys) or self.keys[position] != key:
+            return None
+        start, stop = int(self.starts[position]), int(self.starts[position + 1])
+
+        units = self.unit[start:stop]
+        available = {self.units[code]: int(count) for code, count in zip(*np.unique(units, return_counts=True))}
+        if unit is None:
+            unit = max(available, key=available.get)
+        mask = units == self.units.index(unit) if unit in available else np.zeros(stop - start, dtype=bool)
+        if ciks is not None:
+            mask &= np.isin(self.cik[start:stop], _cik_codes(self.ciks, ciks))
+        if universe is not None:
+            mask &= np.isin(self.cik[start:stop], self.universes[universe])
+
+        codes = self.cik[start:stop][mask]
+        values = self.value[start:stop][mask]
+        order = np.argsort(values if ascending else -values, kind='stable')
+        count = len(values)
+        # Share of the frame each company beats (or undercuts, when ranking ascending)
+        percentile_ranks = 100.0 * (count - 1 - np.arange(count)) / max(count - 1, 1)
+
+        stats = {'count': count}
+        if count:
+            quantiles = np.percentile(values, PERCENTILES)
+            stats.update({
+                'sum': float(values.sum()),
+                'mean': float(values.mean()),
+                'min': float(values.min()),
+                'max': float(values.max()),
+                **{f"p{p}": float(q) for p, q in zip(PERCENTILES, quantiles)},
+            })
+
+        top = order[:limit]
+        rows = [
+            {
+                'rank': rank + 1,
+                'cik': str(int(self.ciks[code])).zfill(10),
+                'company_name': self.names[code],
+                'value': float(value),
+                'percentile': round(float(pct), 2),
+            }
+            for rank, code, value, pct in zip(range(len(top)), codes[top].tolist(), values[top].tolist(),
+                                              percentile_ranks[:limit].tolist())
+        ]
+        return {
+            'concept': self.concepts[concept_code],
+            'period': period,
+            'unit': unit,
+            'units': available,
+            'stats': stats,
+            'rows': rows,
+        }
+
+    def memory_bytes(self) -> int:
+        """Size of the mapped columns (resident only as their pages are read)."""
+        return sum(getattr(self, name).nbytes for name in _COLUMNS)
@@ -0,0 +1,156 @@
+# backend/src/fuzzy_index.py
+"""
+Typo-tolerant term lookup using a SymSpell-style deletion dictionary.
+
+Every vocabulary term contributes the strings reachable by deleting up to
+MAX_EDIT_DISTANCE characters from its prefix. Those deletes are stored as
+sorted 32-bit hashes beside the term IDs they came from, so a lookup only
+generates the deletes of the misspelled word, binary-searches them and
+verifies the few candidates with a bounded edit distance. No lookup ever
+scans the vocabulary.
+"""
+import sys
+import zlib
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+MAX_EDIT_DISTANCE = 2
+PREFIX_LENGTH = 7
+MIN_CORRECTABLE_LENGTH = 4
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """All strings reachable from word by deleting up to max_distance characters."""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            if len(item) <= 1:
+                continue
+            for i in range(len(item)):
+                next_frontier.add(item[:i] + item[i + 1:])
+        next_frontier -= results
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+def _hash(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance, giving up past max_distance.
+
+    Returns:
+        The distance, or max_distance + 1 if it exceeds max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+class FuzzyIndex:
+    """Deletion-dictionary index over the search vocabulary."""
+
+    def __init__(self):
+        self.terms: List[str] = []
+        self.frequencies = np.zeros(0, dtype=np.int32)
+        self.delete_hashes = np.zeros(0, dtype=np.uint32)
+        self.delete_terms = np.zeros(0, dtype=np.int32)
+
+    @classmethod
+    def build(cls, terms: Iterable[str], frequencies: Iterable[int]) -> "FuzzyIndex":
+        """
+        Build the index.
+
+        Args:
+            terms: Vocabulary terms, indexed by term ID
+            frequencies: Document frequency per term, used to break ties
+
+        Returns:
+            Populated FuzzyIndex
+        """
+        index = cls()
+        index.terms = terms if isinstance(terms, list) else list(terms)
+        index.frequencies = np.asarray(list(frequencies), dtype=np.int32)
+
+        hashes = []
+        term_ids = []
+        for term_id, term in enumerate(index.terms):
+            if len(term) < MIN_CORRECTABLE_LENGTH - MAX_EDIT_DISTANCE or not term.isalpha():
+                continue
+            for delete in _deletes(term[:PREFIX_LENGTH], MAX_EDIT_DISTANCE):
+                hashes.append(_hash(delete))
+                term_ids.append(term_id)
+
+        order = np.argsort(np.asarray(hashes, dtype=np.uint32), kind="stable")
+        index.delete_hashes = np.asarray(hashes, dtype=np.uint32)[order]
+        index.delete_terms = np.asarray(term_ids, dtype=np.int32)[order]
+        return index
+
+    def _candidates(self, word: str) -> np.ndarray:
+        """Term IDs sharing a prefix delete with word (includes hash collisions)."""
+        query_hashes = np.fromiter((_hash(d) for d in _deletes(word[:PREFIX_LENGTH], MAX_EDIT_DISTANCE)), dtype=np.uint32)
+        lo = np.searchsorted(self.delete_hashes, query_hashes, side="left")
+        hi = np.searchsorted(self.delete_hashes, query_hashes, side="right")
+        slices = [self.delete_terms[a:b] for a, b in zip(lo, hi) if b > a]
+        if not slices:
+            return self.delete_terms[:0]
+        return np.unique(np.concatenate(slices))
+
+    def correct(self, word: str, max_distance: int = MAX_EDIT_DISTANCE) -> Optional[Tuple[str, int]]:
+        """
+        Find the closest vocabulary term to a misspelled word.
+
+        Args:
+            word: Normalized query token
+            max_distance: Maximum edit distance to accept
+
+        Returns:
+            Tuple of (term, distance), or None if nothing is close enough.
+            Ties are broken by document frequency.
+        """
+        if len(word) < MIN_CORRECTABLE_LENGTH or self.delete_hashes.size == 0:
+            return None
+
+        best = None
+        best_key = None
+        for term_id in self._candidates(word):
+            term = self.terms[term_id]
+            distance = edit_distance(word, term, max_distance)
+            if distance > max_distance:
+                continue
+            key = (distance, -int(self.frequencies[term_id]), term)
+            if best_key is None or key < best_key:
+                best, best_key = (term, distance), key
+        return best
+
+    def __setstate__(self, state):
+        # Share term strings with the search index and other taxonomy versions
+        self.__dict__.update(state)
+        self.terms = [sys.intern(term) for term in self.terms]
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the deletion arrays."""
+        return self.delete_hashes.nbytes + self.delete_terms.nbytes + self.frequencies.nbytes
@@ -0,0 +1,256 @@
+# backend/src/http_cache.py
+"""
+On-disk cache of SEC EDGAR responses.
+
+Bodies are stored zlib-compressed under the SHA-256 of their content, so a
+response served under several URLs (or unchanged across refreshes) is kept
+once. A small JSON entry per URL records which body it maps to, when it was
+stored and its ETag/Last-Modified validators. How long an entry is fresh
+depends on the endpoint: filed documents never change, while submissions
+lists change with every filing. Expired entries are revalidated with a
+conditional request, so an unchanged resource costs a 304 and no body.
+
+In cache-only mode no request is sent at all; cached entries are served
+regardless of age, which replays a previous session offline.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+from .config import CACHE_EXPIRY_HOURS, HTTP_CACHE_DIR, HTTP_CACHE_ONLY, HTTP_CACHE_TTL_POLICY
+
+logger = logging.getLogger(__name__)
+
+_VALIDATOR_HEADERS = ('ETag', 'Last-Modified', 'Content-Type')
+
+
+class CacheOnlyMiss(LookupError):
+    """Raised in cache-only mode for a URL that was never cached."""
+
+
+@dataclass
+class CachedResponse:
+    """Response body with the headers needed to revalidate it."""
+    url: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    source: str = 'miss'  # 'hit', 'revalidated', 'stale' or 'miss'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class HttpCache:
+    """Content-addressed, compressed response store with per-endpoint TTLs."""
+
+    def __init__(self, directory: Path = HTTP_CACHE_DIR,
+                 ttl_policy: Sequence[Tuple[str, Optional[float]]] = HTTP_CACHE_TTL_POLICY,
+                 default_ttl_seconds: Optional[float] = CACHE_EXPIRY_HOURS * 3600,
+                 cache_only: bool = HTTP_CACHE_ONLY):
+        self.directory = Path(directory)
+        self.ttl_policy = [(re.compile(pattern), ttl) for pattern, ttl in ttl_policy]
+        self.default_ttl_seconds = default_ttl_seconds
+        self.cache_only = cache_only
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.stale = 0
+        self.misses = 0
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """Freshness lifetime of a URL in seconds (None = never expires); the first matching rule wins."""
+        for pattern, ttl in self.ttl_policy:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl_seconds
+
+    def _entry_path(self, url: str) -> Path:
+        return self.directory / "entries" / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _body_path(self, digest: str) -> Path:
+        return self.directory / "bodies" / digest[:2] / f"{digest}.z"
+
+    def _write_atomic(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp{os.getpid()}-{threading.get_ident()}")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _read_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(self._entry_path(url).read_bytes())
+            body = zlib.decompress(self._body_path(entry['body']).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable HTTP cache entry for {url}: {e}")
+            return None
+        entry['content'] = body
+        return entry
+
+    def _store(self, url: str, status_code: int, content: bytes, headers: Dict[str, str]):
+        digest = hashlib.sha256(content).hexdigest()
+        try:
+            body_path = self._body_path(digest)
+            if not body_path.exists():
+                self._write_atomic(body_path, zlib.compress(content, 6))
+            entry = {'url': url, 'status_code': status_code, 'body': digest, 'size': len(content),
+                     'stored_at': time.time(), 'headers': headers}
+            self._write_atomic(self._entry_path(url), json.dumps(entry).encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Failed to write HTTP cache entry for {url}: {e}")
+
+    def _touch(self, url: str, entry: Dict[str, Any], headers: Dict[str, str]):
+        """Restart an entry's freshness lifetime after a 304, keeping any updated validators."""
+        stored = {key: value for key, value in entry.items() if key != 'content'}
+        stored['stored_at'] = time.time()
+        stored['headers'] = {**entry['headers'], **headers}
+        try:
+            self._write_atomic(self._entry_path(url), json.dumps(stored).encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Failed to update HTTP cache entry for {url}: {e}")
+
+    def _count(self, source: str):
+        with self._lock:
+            if source == 'hit':
+                self.hits += 1
+            elif source == 'revalidated':
+                self.revalidated += 1
+            elif source == 'stale':
+                self.stale += 1
+            else:
+                self.misses += 1
+
+    def _response(self, url: str, entry: Dict[str, Any], source: str) -> CachedResponse:
+        self._count(source)
+        return CachedResponse(url, entry['status_code'], entry['content'], dict(entry['headers']), source)
+
+    def _begin(self, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[CachedResponse], Dict[str, str]]:
+        """Serve a URL from the cache if possible, else the conditional headers to revalidate it with."""
+        entry = self._read_entry(url)
+        if entry is not None:
+            ttl = self.ttl_for(url)
+            if ttl is None or time.time() - entry['stored_at'] < ttl:
+                return entry, self._response(url, entry, 'hit'), {}
+
+        if self.cache_only:
+            if entry is None:
+                raise CacheOnlyMiss(f"Not in the HTTP cache (cache-only mode): {url}")
+            return entry, self._response(url, entry, 'stale'), {}
+
+        conditional = {}
+        if entry is not None:
+            if entry['headers'].get('ETag'):
+                conditional['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                conditional['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return entry, None, conditional
+
+    def _fallback(self, url: str, entry: Optional[Dict[str, Any]], error: Exception) -> CachedResponse:
+        """Serve the cached copy when the request failed or the server answered 5xx."""
+        if entry is None:
+            raise error
+        logger.warning(f"Request for {url} failed, serving cached copy: {error}")
+        return self._response(url, entry, 'stale')
+
+    def _finish(self, url: str, entry: Optional[Dict[str, Any]], response: Any) -> CachedResponse:
+        """Record the server's answer: refresh the entry on a 304, else store the new body."""
+        headers = {name: response.headers[name] for name in _VALIDATOR_HEADERS if name in response.headers}
+        if response.status_code == 304 and entry is not None:
+            self._touch(url, entry, headers)
+            return self._response(url, entry, 'revalidated')
+
+        if response.status_code >= 500:
+            # An outage that outlasted the retries is treated like a failed request
+            try:
+                response.raise_for_status()
+            except Exception as e:
+                return self._fallback(url, entry, e)
+        response.raise_for_status()
+        self._store(url, response.status_code, response.content, headers)
+        self._count('miss')
+        return CachedResponse(url, response.status_code, response.content, headers, 'miss')
+
+    async def fetch_async(self, url: str, send: Callable[[str, Dict[str, str]], Awaitable[Any]]) -> CachedResponse:
+        """
+        Get a URL through the cache.
+
+        Cache files are read and written on a worker thread so the event
+        loop never waits on the disk.
+
+        Args:
+            url: Absolute URL
+            send: Coroutine function performing the request, given the URL
+                and extra request headers; returns an httpx Response-like object
+
+        Returns:
+            CachedResponse; source tells whether it came from a fresh entry,
+            a 304 revalidation, an expired entry served without a network
+            call, or a new download
+
+        Raises:
+            CacheOnlyMiss: In cache-only mode, if the URL was never cached
+            HTTPError: If the server answers with an error status (for a 5xx,
+                only when there is no cached copy to serve)
+        """
+        entry, cached, conditional = await asyncio.to_thread(self._begin, url)
+        if cached is not None:
+            return cached
+        try:
+            response = await send(url, conditional)
+        except Exception as e:
+            return self._fallback(url, entry, e)
+        return await asyncio.to_thread(self._finish, url, entry, response)
+
+    def prune(self) -> int:
+        """
+        Remove bodies no entry refers to any more.
+
+        Returns:
+            Number of body files removed
+        """
+        referenced = set()
+        for path in (self.directory / "entries").glob("*.json"):
+            try:
+                referenced.add(json.loads(path.read_bytes())['body'])
+            except Exception:
+                continue
+        removed = 0
+        for path in (self.directory / "bodies").glob("*/*.z"):
+            if path.stem not in referenced:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters since startup and the cache's size on disk."""
+        entries = sum(1 for _ in (self.directory / "entries").glob("*.json"))
+        bodies = list((self.directory / "bodies").glob("*/*.z"))
+        with self._lock:
+            lookups = self.hits + self.revalidated + self.stale + self.misses
+            served = self.hits + self.revalidated + self.stale
+            return {
+                'entries': entries,
+                'bodies': len(bodies),
+                'disk_bytes': sum(path.stat().st_size for path in bodies),
+                'cache_only': self.cache_only,
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'stale': self.stale,
+                'misses': self.misses,
+                'hit_rate': served / lookups if lookups else 0.0
+            }
@@ -0,0 +1,351 @@
+# backend/src/instance_parser.py
+"""
+Streaming fact extraction from XBRL instances and inline XBRL documents.
+
+A filing's facts are read in one lxml iterparse pass instead of building an
+Arelle model: each element is handled when it closes and then cleared, so
+memory stays bounded by the fact table rather than the document tree.
+Facts land in a columnar FactTable (concept, context, unit, decimals and
+float64 value), with concept, context and unit strings stored once each.
+Only numeric values are kept; text facts are counted, except short dei
+cover-page facts (registrant name, document type, period end) which the
+API reports alongside the analysis.
+"""
+import io
+import logging
+import math
+import re
+from array import array
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+import numpy as np
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+XBRLI_NS = "http://www.xbrl.org/2003/instance"
+LINK_NS = "http://www.xbrl.org/2003/linkbase"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+IX_NAMESPACES = ("http://www.xbrl.org/2013/inlineXBRL", "http://www.xbrl.org/2008/inlineXBRL")
+
+DECIMALS_INF = 32767
+DECIMALS_NONE = -32768  # Non-numeric facts, or precision given instead of decimals
+
+_CONTEXT = f"{{{XBRLI_NS}}}context"
+_UNIT = f"{{{XBRLI_NS}}}unit"
+_SCHEMA_REF = f"{{{LINK_NS}}}schemaRef"
+_HREF = f"{{{XLINK_NS}}}href"
+_NON_FRACTION = {f"{{{ns}}}nonFraction" for ns in IX_NAMESPACES}
+_NON_NUMERIC = {f"{{{ns}}}nonNumeric" for ns in IX_NAMESPACES}
+_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+_NOT_FACTS = (XBRLI_NS, LINK_NS) + IX_NAMESPACES
+_INLINE_TAGS = [_CONTEXT, _UNIT, _SCHEMA_REF, *_NON_FRACTION, *_NON_NUMERIC]
+_SNIFF_BYTES = 1 << 16  # The inline XBRL namespace is declared on the html root
+
+_COVER_FACTS = {'dei:EntityRegistrantName', 'dei:DocumentType', 'dei:DocumentPeriodEndDate',
+                'dei:EntityCentralIndexKey', 'dei:DocumentFiscalYearFocus', 'dei:DocumentFiscalPeriodFocus'}
+_MAX_COVER_TEXT = 256
+
+_NUMBER_CHARS = re.compile(r"[^0-9.\-]")
+_SCALES: Dict[str, float] = {}
+_RELEASE_EVERY = 256  # Handled elements between sweeps of already-closed markup
+
+
+class FactTable:
+    """Columnar facts of one filing; string columns index into the lookup lists."""
+
+    def __init__(self):
+        self.concepts: List[str] = []
+        self.context_ids: List[str] = []
+        self.unit_ids: List[str] = []
+        self.concept = np.zeros(0, dtype=np.int32)
+        self.context = np.zeros(0, dtype=np.int32)
+        self.unit = np.zeros(0, dtype=np.int16)  # -1 for facts without a unit
+        self.decimals = np.zeros(0, dtype=np.int16)
+        self.value = np.zeros(0, dtype=np.float64)  # NaN for text and nil facts
+        self.contexts: Dict[str, Dict[str, Any]] = {}  # id -> {'start', 'end', 'dimensions'}
+        self.units: Dict[str, str] = {}  # id -> measure, e.g. iso4217:USD or iso4217:USD/shares
+        self.cover: Dict[str, str] = {}  # Short dei cover-page facts
+        self.schema_refs: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def concept_summary(self) -> Dict[str, Dict[str, int]]:
+        """Fact and numeric-fact counts per concept."""
+        counts = np.bincount(self.concept, minlength=len(self.concepts))
+        numeric = np.bincount(self.concept[~np.isnan(self.value)], minlength=len(self.concepts))
+        return {name: {'facts': int(counts[i]), 'numeric': int(numeric[i])}
+                for i, name in enumerate(self.concepts) if counts[i]}
+
+    def facts_for(self, concept: str) -> List[Dict[str, Any]]:
+        """
+        Facts of one concept.
+
+        Args:
+            concept: Prefixed concept name, e.g. us-gaap:Assets
+
+        Returns:
+            List of {context, period_start, period_end, unit, decimals, value}
+        """
+        if concept not in self.concepts:
+            return []
+        rows = np.flatnonzero(self.concept == self.concepts.index(concept))
+        facts = []
+        for row in rows.tolist():
+            context_id = self.context_ids[self.context[row]]
+            context = self.contexts.get(context_id, {})
+            unit = int(self.unit[row])
+            decimals = int(self.decimals[row])
+            value = float(self.value[row])
+            facts.append({
+                'context': context_id,
+                'period_start': context.get('start'),
+                'period_end': context.get('end'),
+                'dimensional': bool(context.get('dimensions')),
+                'unit': self.units.get(self.unit_ids[unit], self.unit_ids[unit]) if unit >= 0 else None,
+                'decimals': None if decimals == DECIMALS_NONE else ('INF' if decimals == DECIMALS_INF else decimals),
+                'value': None if math.isnan(value) else value,
+            })
+        return facts
+
+    def memory_bytes(self) -> int:
+        """Bytes held by the numeric columns."""
+        return sum(a.nbytes for a in (self.concept, self.context, self.unit, self.decimals, self.value))
+
+
+def _parse_decimals(value: Optional[str]) -> int:
+    if value is None:
+        return DECIMALS_NONE
+    if value == "INF":
+        return DECIMALS_INF
+    try:
+        return max(-32767, min(32766, int(value)))
+    except ValueError:
+        return DECIMALS_NONE
+
+
+def _parse_number(text: Optional[str]) -> float:
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _parse_inline_number(elem) -> float:
+    """Value of an ix:nonFraction, applying its format, scale and sign."""
+    if elem.get(_NIL) == "true":
+        return math.nan
+    text = (elem.text if len(elem) == 0 else "".join(elem.itertext())) or ""
+    number_format = elem.get("format", "")
+    if "comma-decimal" in number_format or "numcommadecimal" in number_format:
+        text = text.replace(".", "").replace(" ", "").replace(",", ".")
+    try:
+        value = float(text.replace(",", ""))
+    except ValueError:
+        text = text.strip()
+        if "zero" in number_format or text in ("-", "—", "–", ""):
+            value = 0.0
+        else:
+            value = _parse_number(_NUMBER_CHARS.sub("", text))
+    scale = elem.get("scale")
+    if scale and scale != "0":
+        factor = _SCALES.get(scale)
+        if factor is None:
+            try:
+                factor = _SCALES[scale] = 10.0 ** int(scale)
+            except ValueError:
+                factor = 1.0
+        value *= factor
+    return -value if elem.get("sign") == "-" else value
+
+
+def _parse_context(elem) -> Dict[str, Any]:
+    start = end = None
+    dimensions = 0
+    for child in elem.iter():
+        if not isinstance(child.tag, str):
+            continue
+        local = etree.QName(child).localname
+        if local == "instant" or local == "endDate":
+            end = (child.text or "").strip()
+        elif local == "startDate":
+            start = (child.text or "").strip()
+        elif local in ("explicitMember", "typedMember"):
+            dimensions += 1
+    return {'start': start, 'end': end, 'dimensions': dimensions}
+
+
+def _parse_unit(elem) -> str:
+    numerator, denominator = [], []
+    for child in elem.iter(f"{{{XBRLI_NS}}}measure"):
+        parent = etree.QName(child.getparent()).localname
+        (denominator if parent == "unitDenominator" else numerator).append((child.text or "").strip())
+    measure = "*".join(numerator)
+    return f"{measure}/{'*'.join(denominator)}" if denominator else measure
+
+
+def _release_preceding(elem):
+    """Free everything before an element that has already closed, at every level of the tree."""
+    node = elem
+    parent = node.getparent()
+    while parent is not None:
+        while node.getprevious() is not None:
+            del parent[0]
+        node = parent
+        parent = node.getparent()
+
+
+def parse_instance(source: Union[bytes, BinaryIO]) -> FactTable:
+    """
+    Extract the facts of an XBRL instance or inline XBRL document.
+
+    The format is detected from the elements themselves, so the same pass
+    handles both. Tuples are not expanded; their member facts are read like
+    top-level facts.
+
+    Args:
+        source: Document bytes or a binary file object
+
+    Returns:
+        FactTable with every fact in document order
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    table = FactTable()
+    # Insertion-ordered dicts hand out dense IDs: setdefault(key, len(d))
+    concepts: Dict[str, int] = {}
+    context_ids: Dict[str, int] = {}
+    unit_ids: Dict[str, int] = {}
+    decimals_cache: Dict[Optional[str], int] = {}
+    concept_col, context_col = array('i'), array('i')
+    unit_col, decimals_col = array('h'), array('h')
+    value_col = array('d')
+
+    def add_fact(name: str, elem, unit_ref: Optional[str], value: float):
+        concept_col.append(concepts.setdefault(name, len(concepts)))
+        context_ref = elem.get("contextRef")
+        context_col.append(context_ids.setdefault(context_ref, len(context_ids)))
+        if unit_ref is None:
+            unit_col.append(-1)
+            decimals_col.append(DECIMALS_NONE)
+        else:
+            unit_col.append(unit_ids.setdefault(unit_ref, len(unit_ids)))
+            decimals = elem.get("decimals")
+            if decimals not in decimals_cache:
+                decimals_cache[decimals] = _parse_decimals(decimals)
+            decimals_col.append(decimals_cache[decimals])
+        value_col.append(value)
+
+    head = source.read(_SNIFF_BYTES)
+    source.seek(0)
+    inline = any(ns.encode() in head for ns in IX_NAMESPACES)
+    # Inline documents are mostly XHTML markup; let lxml skip it without a Python round-trip
+    tags = _INLINE_TAGS if inline else None
+    names_by_tag: Dict[str, Optional[str]] = {}
+    handled = 0
+
+    for _, elem in etree.iterparse(source, events=("end",), tag=tags, huge_tree=True, recover=True):
+        tag = elem.tag
+        if tag in _NON_FRACTION:
+            add_fact(elem.get("name"), elem, elem.get("unitRef"), _parse_inline_number(elem))
+        elif tag in _NON_NUMERIC:
+            name = elem.get("name")
+            add_fact(name, elem, None, math.nan)
+            if name in _COVER_FACTS:
+                table.cover[name] = " ".join("".join(elem.itertext()).split())[:_MAX_COVER_TEXT]
+        elif tag == _CONTEXT:
+            table.contexts[elem.get("id")] = _parse_context(elem)
+        elif tag == _UNIT:
+            table.units[elem.get("id")] = _parse_unit(elem)
+        elif tag == _SCHEMA_REF:
+            table.schema_refs.append(elem.get(_HREF))
+            continue
+        elif elem.get("contextRef") is not None:
+            if tag in names_by_tag:
+                name = names_by_tag[tag]
+            else:
+                qname = etree.QName(elem)
+                name = names_by_tag[tag] = None if qname.namespace in _NOT_FACTS else (
+                    f"{elem.prefix}:{qname.localname}" if elem.prefix else qname.localname)
+            if name is None:
+                continue
+            unit_ref = elem.get("unitRef")
+            if unit_ref is not None:
+                add_fact(name, elem, unit_ref, _parse_number(elem.text) if elem.get(_NIL) != "true" else math.nan)
+            else:
+                add_fact(name, elem, None, math.nan)
+                if name in _COVER_FACTS:
+                    table.cover[name] = (elem.text or "").strip()[:_MAX_COVER_TEXT]
+        else:
+            # Markup and context/unit children are freed by the next sweep
+            continue
+        elem.clear(keep_tail=True)
+        handled += 1
+        if handled % _RELEASE_EVERY == 0:
+            _release_preceding(elem)
+
+    table.concepts = list(concepts)
+    table.context_ids = list(context_ids)
+    table.unit_ids = list(unit_ids)
+    table.concept = np.frombuffer(concept_col, dtype=np.int32).copy()
+    table.context = np.frombuffer(context_col, dtype=np.int32).copy()
+    table.unit = np.frombuffer(unit_col, dtype=np.int16).copy()
+    table.decimals = np.frombuffer(decimals_col, dtype=np.int16).copy()
+    table.value = np.frombuffer(value_col, dtype=np.float64).copy()
+    return table
+
+
+def find_instance_document(names: List[str], primary_document: Optional[str] = None) -> Optional[str]:
+    """
+    Pick the XBRL instance among a filing's documents.
+
+    SEC extracts an instance (<name>_htm.xml) from every inline XBRL filing,
+    which is smaller than the XHTML and parses faster; older filings ship a
+    plain .xml instance next to their linkbases.
+
+    Args:
+        names: File names listed in the filing's index.json
+        primary_document: Inline XBRL primary document, used if no instance is listed
+
+    Returns:
+        File name of the instance, or None if the filing has no XBRL
+    """
+    extracted = [name for name in names if name.endswith("_htm.xml")]
+    if extracted:
+        return extracted[0]
+    # The instance is named after the extension schema; R1.xml etc. are SEC's rendered statements
+    schema_stems = {name[:-len(".xsd")] for name in names if name.endswith(".xsd")}
+    matching = [name for name in names if name.endswith(".xml") and name[:-len(".xml")] in schema_stems]
+    if matching:
+        return matching[0]
+    instances = [name for name in names if name.endswith(".xml") and name != "FilingSummary.xml"
+                 and not re.search(r"_(cal|def|lab|pre)\.xml$", name) and not re.fullmatch(r"R\d+\.xml", name)]
+    if instances:
+        return instances[0]
+    return primary_document if primary_document in names else None
+
+
+def parse_extension_roles(source: Union[bytes, BinaryIO]) -> Dict[str, Dict[str, str]]:
+    """
+    Read the presentation roles a filing's extension schema defines.
+
+    Args:
+        source: Extension schema bytes or a binary file object
+
+    Returns:
+        Mapping of role URI to {'id', 'definition'}, e.g. definition
+        "100010 - Statement - CONSOLIDATED BALANCE SHEETS"
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    roles = {}
+    for _, elem in etree.iterparse(source, events=("end",), tag=f"{{{LINK_NS}}}roleType"):
+        definition = elem.find(f"{{{LINK_NS}}}definition")
+        roles[elem.get("roleURI")] = {
+            'id': elem.get("id", ""),
+            'definition': (definition.text or "").strip() if definition is not None else "",
+        }
+        elem.clear()
+    return roles
@@ -2,20 +2,31 @@
 Main FastAPI application for XBRL Search.
 Provides endpoints for searching and analyzing XBRL documents.
 """
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Dict, List, Optional, Any, Tuple
 import asyncio
+import base64
+import hashlib
+import hmac
+import json
 import logging
 from datetime import datetime
 
 # from .config import settings  # Temporarily commented out
+from .config import (TAXONOMY_RETRY_AFTER_SECONDS, TAXONOMY_WATCH_INTERVAL_SECONDS, ADMIN_TOKEN, SWEEP_CONCURRENCY,
+                     SWEEP_RESULTS_DIR)
 from .taxonomy_loader import TaxonomyLoader
+from .taxonomy_registry import TaxonomyRegistry
 from .sec_client import SECClient
+from .fact_database import FactDatabase
+from .frame_store import FrameStore
+from .filing_sweep import TICKER_PATTERN, SweepJob
 from .classifier import FinancialStatementClassifier, StatementInfo
+from .taxonomy_export import EXPORT_FORMATS, stream_concepts
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -35,15 +46,20 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Serve static files (frontend)
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
 
 # Global instances
-taxonomy_loader = None
+taxonomy_registry = None
+taxonomy_watch_task = None
 sec_client = None
 classifier = None
+fact_database = None
+frame_store = None
+sweep_jobs: Dict[str, SweepJob] = {}
 
 
 # Pydantic models for API
@@ -52,6 +68,58 @@ class SearchQuery(BaseModel):
     query: str = Field(..., description="Search term or concept name")
     limit: int = Field(default=10, ge=1, le=100, description="Maximum results to return")
     include_deprecated: bool = Field(default=False, description="Include deprecated concepts")
+    fuzzy: bool = Field(default=False, description="Correct misspelled terms before searching")
+    period_type: Optional[str] = Field(default=None, description="Filter by period type (instant or duration)")
+    balance_type: Optional[str] = Field(default=None, description="Filter by balance type (debit or credit)")
+    data_type: Optional[str] = Field(default=None, description="Filter by data type, e.g. xbrli:monetaryItemType")
+    is_abstract: Optional[bool] = Field(default=None, description="Filter by abstractness")
+    substitution_group: Optional[str] = Field(default=None, description="Filter by substitution group, e.g. xbrli:item")
+    label_role: Optional[str] = Field(
+        default=None,
+        pattern="^(terseLabel|verboseLabel|totalLabel|periodStartLabel|periodEndLabel|negatedLabel)$",
+        description="Match and return only labels of this role, e.g. terseLabel"
+    )
+    include_documentation: bool = Field(default=False, description="Include each result's documentation")
+    cursor: Optional[str] = Field(default=None, description="X-Next-Cursor value from the previous page")
+    
+    def facet_filters(self) -> Dict[str, Any]:
+        """Facet filters set on this query."""
+        filters = {
+            'period_type': self.period_type,
+            'balance_type': self.balance_type,
+            'data_type': self.data_type,
+            'is_abstract': self.is_abstract,
+            'substitution_group': self.substitution_group,
+        }
+        return {facet: value for facet, value in filters.items() if value is not None}
+    
+    def search_arguments(self) -> Dict[str, Any]:
+        """Keyword arguments for TaxonomyLoader.search_concepts."""
+        return {
+            'query': self.query,
+            'limit': self.limit,
+            'include_deprecated': self.include_deprecated,
+            'fuzzy': self.fuzzy,
+            'filters': self.facet_filters(),
+            'label_role': self.label_role,
+            'include_documentation': self.include_documentation
+        }
+    
+    def cache_key(self) -> tuple:
+        """Normalized key for the search result cache; covers every field."""
+        fields = self.model_dump()
+        query = " ".join(fields.pop('query').lower().split())
+        return (query,) + tuple(sorted(fields.items()))
+    
+    def fingerprint(self, taxonomy_hash: Optional[str]) -> str:
+        """Identify the ranking a cursor belongs to: everything but the page size and position."""
+        key = tuple(item for item in self.cache_key() if item[0] not in ('cursor', 'limit'))
+        return hashlib.sha256(repr((key, taxonomy_hash)).encode("utf-8")).hexdigest()[:16]
+
+
+class BatchSearchQuery(BaseModel):
+    """Model for batch concept search queries."""
+    queries: List[SearchQuery] = Field(..., min_length=1, max_length=10000, description="Searches to run")
 
 
 class CompanySearchQuery(BaseModel):
@@ -70,6 +138,28 @@ class ConceptInfo(BaseModel):
     period_type: Optional[str] = None
     balance_type: Optional[str] = None
     is_deprecated: bool = False
+    corrections: Optional[Dict[str, str]] = Field(default=None, description="Misspelled terms and the corrections used")
+
+
+class SuggestionInfo(BaseModel):
+    """Model for search-as-you-type suggestions."""
+    name: str
+    label: str
+    is_abstract: bool = False
+
+
+class SimilarConceptInfo(BaseModel):
+    """Model for a concept similar to a requested one."""
+    name: str
+    label: str
+    is_deprecated: bool = False
+    score: float = Field(..., description="Cosine similarity of labels and documentation")
+
+
+class SimilarConceptsBatchQuery(BaseModel):
+    """Model for batch similar-concept queries."""
+    concepts: List[str] = Field(..., min_length=1, max_length=1000, description="Concept names")
+    k: int = Field(default=10, ge=1, le=100, description="Similar concepts per concept")
 
 
 class FilingInfo(BaseModel):
@@ -82,6 +172,16 @@ class FilingInfo(BaseModel):
     primary_document: str
 
 
+class SweepRequest(BaseModel):
+    """Model for filing sweep jobs."""
+    name: str = Field(default="sp500", pattern=r"^[\w-]+$", description="Sweep name; results go to its own directory")
+    tickers: Optional[List[Annotated[str, StringConstraints(pattern=TICKER_PATTERN)]]] = Field(
+        default=None, description="Tickers to sweep (default: the S&P 500 list)")
+    form_types: Optional[List[str]] = Field(default=None, description="Form types to analyze (default: 10-K, 10-Q)")
+    concurrency: int = Field(default=SWEEP_CONCURRENCY, ge=1, le=64, description="Companies in flight at once")
+    force: bool = Field(default=False, description="Re-sweep companies that already have results")
+
+
 class StatementInfoResponse(BaseModel):
     """Model for statement classification response."""
     statement_type: str
@@ -91,13 +191,49 @@ class StatementInfoResponse(BaseModel):
 
 
 # Dependency to ensure services are initialized
-async def get_taxonomy_loader():
-    """Get taxonomy loader instance."""
-    global taxonomy_loader
-    if taxonomy_loader is None:
-        taxonomy_loader = TaxonomyLoader()
-        await asyncio.to_thread(taxonomy_loader.load_taxonomy)
-    return taxonomy_loader
+async def get_taxonomy_registry() -> TaxonomyRegistry:
+    """Get the taxonomy registry instance."""
+    global taxonomy_registry
+    if taxonomy_registry is None:
+        taxonomy_registry = TaxonomyRegistry()
+    return taxonomy_registry
+
+
+async def get_taxonomy_version(
+    version: Optional[str] = Query(None, description="Taxonomy version, e.g. 2024; defaults to the configured default"),
+    registry: TaxonomyRegistry = Depends(get_taxonomy_registry)
+) -> str:
+    """Resolve the requested taxonomy version, or answer 404 for an unknown one."""
+    try:
+        return registry.resolve(version)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+
+
+async def get_taxonomy_loader(
+    version: str = Depends(get_taxonomy_version),
+    registry: TaxonomyRegistry = Depends(get_taxonomy_registry)
+):
+    """Get the loader of the requested version, or answer 503 with Retry-After while it is still loading."""
+    loader = await registry.start_load(version)
+    if not loader.is_loaded:
+        status = loader.load_status()
+        if status['phase'] == 'failed':
+            raise HTTPException(status_code=503, detail=f"Taxonomy {version} load failed: {status.get('error')}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Taxonomy {version} is loading ({status['phase']})",
+            headers={"Retry-After": str(TAXONOMY_RETRY_AFTER_SECONDS)}
+        )
+    return loader
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(default=None)):
+    """Check the admin token; admin endpoints stay closed until one is configured."""
+    if ADMIN_TOKEN is None:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled; set ADMIN_TOKEN to enable them")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Admin token required")
 
 
 async def get_sec_client():
@@ -116,14 +252,34 @@ async def get_classifier():
     return classifier
 
 
+async def get_fact_database():
+    """Get the read-only companyfacts database."""
+    global fact_database
+    if fact_database is None:
+        fact_database = FactDatabase(readonly=True)
+    return fact_database
+
+
+async def get_frame_store():
+    """Get the current frame store version, reopening it after a rebuild."""
+    global frame_store
+    if frame_store is None or not frame_store.is_current():
+        frame_store = await asyncio.to_thread(FrameStore.open)
+    return frame_store
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
+    global taxonomy_watch_task
     logger.info("Starting XBRL Search API...")
     try:
-        # Initialize taxonomy loader
-        await get_taxonomy_loader()
-        logger.info("Taxonomy loaded successfully")
+        # Load every taxonomy version in the background, default first, so /health answers right away
+        registry = await get_taxonomy_registry()
+        for version in sorted(registry.versions, key=lambda v: v != registry.default_version):
+            await registry.start_load(version)
+        if TAXONOMY_WATCH_INTERVAL_SECONDS:
+            taxonomy_watch_task = asyncio.create_task(registry.watch(TAXONOMY_WATCH_INTERVAL_SECONDS))
         
         # Initialize other services
         await get_sec_client()
@@ -135,6 +291,18 @@ async def startup_event():
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the taxonomy file watcher and running sweeps, and close SEC connections."""
+    if taxonomy_watch_task is not None:
+        taxonomy_watch_task.cancel()
+    for job in sweep_jobs.values():
+        if job.task is not None:
+            job.task.cancel()
+    if sec_client is not None:
+        await sec_client.aclose()
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -149,16 +317,20 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    global taxonomy_loader, sec_client, classifier
+    global taxonomy_registry, sec_client, classifier
     
+    taxonomies = taxonomy_registry.status() if taxonomy_registry is not None else {}
     health_status = {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "services": {
-            "taxonomy_loader": taxonomy_loader is not None,
+            "taxonomy_loader": taxonomy_registry is not None
+                               and taxonomies[taxonomy_registry.default_version]['phase'] == 'ready',
             "sec_client": sec_client is not None,
             "classifier": classifier is not None
-        }
+        },
+        "taxonomies": taxonomies,
+        "companies": sec_client.companies_indexed if sec_client is not None else 0
     }
     
     if not all(health_status["services"].values()):
@@ -167,43 +339,245 @@ async def health_check():
     return health_status
 
 
+@app.post("/admin/taxonomy/reload", status_code=202, dependencies=[Depends(require_admin)])
+async def reload_taxonomy(
+    force: bool = Query(False, description="Reload even if the taxonomy files are unchanged"),
+    version: str = Depends(get_taxonomy_version),
+    registry: TaxonomyRegistry = Depends(get_taxonomy_registry)
+):
+    """Build a new generation of a taxonomy version in the background and swap it in when ready."""
+    loader = await registry.start_reload(version, force=force)
+    if loader is None:
+        raise HTTPException(status_code=409, detail=f"Taxonomy {version} is still loading")
+    
+    return registry.status()[version]['reload']
+
+
+@app.get("/taxonomy/versions")
+async def get_taxonomy_versions(registry: TaxonomyRegistry = Depends(get_taxonomy_registry)):
+    """List the configured taxonomy versions with their load status."""
+    return {
+        "default_version": registry.default_version,
+        "versions": registry.status()
+    }
+
+
+@app.get("/taxonomy/crosswalk")
+async def get_taxonomy_crosswalk(
+    from_version: str = Query(..., description="Older taxonomy version"),
+    to_version: str = Query(..., description="Newer taxonomy version"),
+    limit: Optional[int] = Query(None, ge=0, description="Maximum concept names listed per change type"),
+    registry: TaxonomyRegistry = Depends(get_taxonomy_registry)
+):
+    """Concepts added, removed and newly deprecated between two loaded taxonomy versions."""
+    try:
+        for version in (from_version, to_version):
+            registry.resolve(version)
+        crosswalk = await asyncio.to_thread(registry.crosswalk, from_version, to_version)
+        return crosswalk.to_dict(limit=limit)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def encode_cursor(query: SearchQuery, taxonomy_hash: Optional[str], last_result: Dict[str, Any]) -> str:
+    """Build an opaque cursor pointing after the given result."""
+    payload = {'f': query.fingerprint(taxonomy_hash), 's': last_result['score'], 'i': last_result['id']}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(query: SearchQuery, taxonomy_hash: Optional[str]) -> Optional[Tuple[float, int]]:
+    """
+    Decode a query's cursor into the (score, concept ID) to continue after.
+    
+    Raises:
+        HTTPException: 400 if the cursor is malformed, belongs to another
+            query or predates a taxonomy reload
+    """
+    if not query.cursor:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(query.cursor.encode("ascii")))
+        fingerprint, score, concept_id = payload['f'], float(payload['s']), int(payload['i'])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if fingerprint != query.fingerprint(taxonomy_hash):
+        raise HTTPException(status_code=400, detail="Cursor does not match this query or the loaded taxonomy")
+    return score, concept_id
+
+
+def to_concept_infos(results: List[Dict[str, Any]]) -> List[ConceptInfo]:
+    """Convert search results to ConceptInfo models."""
+    concept_infos = []
+    for concept in results:
+        concept_info = ConceptInfo(
+            name=concept.get('name', ''),
+            label=concept.get('label', ''),
+            documentation=concept.get('documentation'),
+            data_type=concept.get('data_type'),
+            period_type=concept.get('period_type'),
+            balance_type=concept.get('balance_type'),
+            is_deprecated=concept.get('is_deprecated', False),
+            corrections=concept.get('corrections')
+        )
+        concept_infos.append(concept_info)
+    return concept_infos
+
+
 @app.post("/search/concepts", response_model=List[ConceptInfo])
 async def search_concepts(
     query: SearchQuery,
+    response: Response,
     loader: TaxonomyLoader = Depends(get_taxonomy_loader)
 ):
     """
     Search for XBRL concepts in the taxonomy.
     
-    Returns matching concepts with their metadata.
+    Returns matching concepts with their metadata. Results are cached per
+    normalized query, so repeated searches skip the index entirely.
+    
+    Results are ranked by score, then by a stable concept ID. When more
+    results may follow, the X-Next-Cursor response header carries a cursor;
+    send it back as `cursor` with the same query to get the next page.
+    """
+    after = decode_cursor(query, loader.taxonomy_hash)
+    cache_key = query.cache_key()
+    cached = loader.search_cache.get(cache_key)
+    if cached is not None:
+        concept_infos, next_cursor = cached
+    else:
+        try:
+            results = await asyncio.to_thread(
+                loader.search_concepts,
+                **query.search_arguments(),
+                after=after
+            )
+            
+            concept_infos = to_concept_infos(results)
+            next_cursor = encode_cursor(query, loader.taxonomy_hash, results[-1]) if len(results) == query.limit else None
+            loader.search_cache.put(cache_key, (concept_infos, next_cursor))
+            
+        except Exception as e:
+            logger.error(f"Error searching concepts: {e}")
+            raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return concept_infos
+
+
+@app.post("/search/concepts/batch", response_model=List[List[ConceptInfo]])
+async def search_concepts_batch(
+    batch: BatchSearchQuery,
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Run many concept searches in one request.
+    
+    Returns one result list per query, in request order. Cached results are
+    reused; the rest run in a single call that resolves shared tokens once.
+    Batch results are not added to the cache, so bulk jobs do not evict the
+    interactive working set.
     """
+    results: List[Optional[List[ConceptInfo]]] = []
+    pending = []
+    for position, query in enumerate(batch.queries):
+        cached = loader.search_cache.get(query.cache_key())
+        results.append(cached[0] if cached is not None else None)
+        if cached is None:
+            pending.append(position)
+    
+    arguments = [
+        dict(batch.queries[position].search_arguments(), after=decode_cursor(batch.queries[position], loader.taxonomy_hash))
+        for position in pending
+    ]
     try:
-        results = await asyncio.to_thread(
-            loader.search_concepts,
-            query.query,
-            limit=query.limit,
-            include_deprecated=query.include_deprecated
-        )
+        if pending:
+            searched = await asyncio.to_thread(loader.search_concepts_batch, arguments)
+            for position, concepts in zip(pending, searched):
+                results[position] = to_concept_infos(concepts)
         
-        # Convert results to ConceptInfo models
-        concept_infos = []
-        for concept in results:
-            concept_info = ConceptInfo(
-                name=concept.get('name', ''),
-                label=concept.get('label', ''),
-                documentation=concept.get('documentation'),
-                data_type=concept.get('data_type'),
-                period_type=concept.get('period_type'),
-                balance_type=concept.get('balance_type'),
-                is_deprecated=concept.get('is_deprecated', False)
-            )
-            concept_infos.append(concept_info)
+        return results
         
-        return concept_infos
+    except Exception as e:
+        logger.error(f"Error running batch search: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch search failed: {str(e)}")
+
+
+@app.get("/search/cache/stats")
+async def get_search_cache_stats(
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Get search result cache statistics.
+    
+    Returns hits, misses, evictions, expirations and the hit rate.
+    """
+    return loader.search_cache.stats()
+
+
+@app.get("/search/suggest", response_model=List[SuggestionInfo])
+async def suggest_concepts(
+    q: str = Query(..., description="Text typed so far"),
+    limit: int = Query(default=10, ge=1, le=20, description="Maximum suggestions to return"),
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Suggest concepts for a partially typed query.
+    
+    Backed by a prefix index, so it is cheap enough to call on every keystroke.
+    """
+    try:
+        # Prefix lookups are sub-millisecond; no need for a thread hop
+        suggestions = loader.suggest_concepts(q, limit=limit)
+        return [SuggestionInfo(**suggestion) for suggestion in suggestions]
         
     except Exception as e:
-        logger.error(f"Error searching concepts: {e}")
-        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+        logger.error(f"Error suggesting concepts: {e}")
+        raise HTTPException(status_code=500, detail=f"Suggest failed: {str(e)}")
+
+
+@app.get("/search/references")
+async def search_references(
+    topic: str = Query(..., description="Codification topic, e.g. 842"),
+    subtopic: Optional[str] = Query(default=None, description="Subtopic within the topic, e.g. 20"),
+    section: Optional[str] = Query(default=None, description="Section within the subtopic, e.g. 50"),
+    paragraph: Optional[str] = Query(default=None, description="Paragraph within the section"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum concepts to return"),
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Find the concepts that cite a part of the Accounting Standards Codification.
+    
+    For example `?topic=842&subtopic=20&section=50` lists the concepts that
+    reference ASC 842-20-50.
+    """
+    try:
+        # Path lookups are two bisections over a sorted key list; no thread hop
+        return loader.search_references(topic, subtopic, section, paragraph, limit=limit)
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching references: {e}")
+        raise HTTPException(status_code=500, detail=f"Reference search failed: {str(e)}")
+
+
+@app.get("/sec/cache/stats")
+async def get_sec_cache_stats(
+    client: SECClient = Depends(get_sec_client)
+):
+    """
+    Get SEC response cache statistics.
+    
+    Returns fresh hits, 304 revalidations, stale serves and misses, the
+    number and compressed size of cached responses, and how many requests
+    were retried or coalesced with an identical one in flight.
+    """
+    stats = await asyncio.to_thread(client.http_cache.stats)
+    stats.update(retried=client.retries, coalesced=client.coalesced)
+    return stats
 
 
 @app.post("/search/companies", response_model=List[FilingInfo])
@@ -214,11 +588,11 @@ async def search_companies(
     """
     Search for company filings from SEC EDGAR database.
     
-    Returns recent filings for the specified company.
+    Resolves the ticker or company name through the cached company index and
+    returns the latest filing of each matching company.
     """
     try:
-        filings = await asyncio.to_thread(
-            client.search_company_filings,
+        filings = await client.search_company_filings(
             query.company_name,
             form_type=query.filing_type,
             limit=query.limit
@@ -248,21 +622,21 @@ async def search_companies(
 async def analyze_filing(
     cik: str,
     accession_number: str,
+    primary_document: Optional[str] = Query(default=None,
+                                            description="Inline XBRL document to parse if the filing lists no instance"),
     client: SECClient = Depends(get_sec_client),
     classifier_service: FinancialStatementClassifier = Depends(get_classifier)
 ):
     """
     Analyze a specific SEC filing and classify its financial statements.
     
+    The filing's XBRL instance is downloaded and its facts extracted in one
+    streaming pass; statement roles come from its extension schema.
     Returns detailed analysis including statement classification and key concepts.
     """
     try:
         # Get filing data
-        filing_data = await asyncio.to_thread(
-            client.get_filing_data,
-            cik,
-            accession_number
-        )
+        filing_data = await client.get_filing_data(cik, accession_number, primary_document)
         
         if not filing_data:
             raise HTTPException(status_code=404, detail="Filing not found")
@@ -297,9 +671,11 @@ async def analyze_filing(
             "company_name": filing_data.get('company_name'),
             "filing_date": filing_data.get('filing_date'),
             "form_type": filing_data.get('form_type'),
+            "period_end": filing_data.get('period_end'),
             "statements": statements,
             "summary": summary,
             "total_concepts": len(facts),
+            "total_facts": len(filing_data['fact_table']),
             "analysis_timestamp": datetime.now().isoformat()
         }
         
@@ -310,15 +686,149 @@ async def analyze_filing(
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
+@app.get("/companies/{cik}/concepts/{concept}")
+async def get_company_concept(
+    cik: str,
+    concept: str,
+    unit: Optional[str] = Query(default=None, description="Only facts in this unit, e.g. USD"),
+    form: Optional[str] = Query(default=None, description="Only facts from this form type, e.g. 10-K"),
+    latest_only: bool = Query(default=True, description="Keep only the most recently filed value per period"),
+    db: FactDatabase = Depends(get_fact_database)
+):
+    """
+    Get one company's reported values of a concept from the local fact database.
+    
+    Served from the SQLite store filled by `python -m backend.src.cli
+    ingest-companyfacts`; the concept may be prefixed with its taxonomy
+    (dei:EntityCommonStockSharesOutstanding), otherwise us-gaap is preferred.
+    """
+    if not db.exists():
+        raise HTTPException(status_code=404,
+                            detail="Fact database not built; run python -m backend.src.cli ingest-companyfacts")
+    try:
+        cik_number = int(cik)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid CIK: {cik}")
+    
+    try:
+        def query():
+            company = db.company(cik_number)
+            if company is None:
+                return None, None
+            return company, db.concept_series(cik_number, concept, unit=unit, form=form, latest_only=latest_only)
+        
+        company, series = await asyncio.to_thread(query)
+        
+        if company is None:
+            raise HTTPException(status_code=404, detail=f"Company {cik} has not been ingested")
+        if series is None:
+            raise HTTPException(status_code=404, detail=f"Concept not found: {concept}")
+        
+        return {
+            "cik": company['cik'],
+            "company_name": company['name'],
+            **series
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting company concept: {e}")
+        raise HTTPException(status_code=500, detail=f"Company concept lookup failed: {str(e)}")
+
+
+@app.get("/frames/{concept}/{period}")
+async def get_frame(
+    concept: str,
+    period: str,
+    unit: Optional[str] = Query(default=None, description="Unit to rank (default: the most reported unit)"),
+    universe: str = Query(default="all", pattern="^(all|sp500)$", description="Companies to include"),
+    order: str = Query(default="desc", pattern="^(asc|desc)$", description="Rank largest (desc) or smallest first"),
+    limit: int = Query(default=100, ge=1, le=10000, description="Maximum ranked companies to return"),
+    store: Optional[FrameStore] = Depends(get_frame_store)
+):
+    """
+    Rank every company's value of one concept for one calendar period.
+    
+    Periods are SEC calendar frames: CY2024 for a year, CY2024Q3 for a
+    quarter, CY2024Q4I for an instant. Served from the memory-mapped frame
+    store built by `python -m backend.src.cli build-frames`, which also
+    resolves the S&P 500 to CIKs; stats cover the whole filtered frame,
+    rows are capped at `limit`.
+    """
+    if store is None:
+        raise HTTPException(status_code=404,
+                            detail="Frame store not built; run python -m backend.src.cli build-frames")
+    if universe != "all" and universe not in store.universes:
+        raise HTTPException(status_code=404,
+                            detail=f"Frame store was built without the {universe} universe; "
+                                   "rerun python -m backend.src.cli build-frames with SEC access")
+    try:
+        result = store.frame(concept, period, unit=unit, universe=None if universe == "all" else universe,
+                             ascending=order == "asc", limit=limit)
+        if result is None:
+            raise HTTPException(status_code=404, detail=f"No frame for {concept} in {period}")
+        
+        return {**result, "universe": universe}
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting frame: {e}")
+        raise HTTPException(status_code=500, detail=f"Frame query failed: {str(e)}")
+
+
+@app.post("/jobs/sweep", status_code=202, dependencies=[Depends(require_admin)])
+async def start_sweep(
+    request: SweepRequest,
+    client: SECClient = Depends(get_sec_client),
+    classifier_service: FinancialStatementClassifier = Depends(get_classifier)
+):
+    """
+    Start analyzing the latest filings of the S&P 500 (or given tickers) in the background.
+    
+    Companies already swept under the same name are skipped, so posting the
+    same sweep again resumes it. Poll GET /jobs/{job_id} for progress.
+    """
+    output_dir = SWEEP_RESULTS_DIR / request.name
+    if any(job.is_active() and job.output_dir == output_dir for job in sweep_jobs.values()):
+        raise HTTPException(status_code=409, detail=f"Sweep {request.name} is already running")
+    
+    job = SweepJob(tickers=request.tickers, form_types=request.form_types, output_dir=output_dir,
+                   concurrency=request.concurrency, force=request.force)
+    sweep_jobs[job.job_id] = job
+    job.start(client, classifier_service)
+    return job.status()
+
+
+@app.get("/jobs")
+async def list_jobs():
+    """Status of every sweep started since the API came up."""
+    return [job.status() for job in sweep_jobs.values()]
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Progress, throughput and ETA of one sweep."""
+    job = sweep_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job.status()
+
+
 @app.get("/concepts/{concept_name}")
 async def get_concept_details(
     concept_name: str,
-    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader),
+    registry: TaxonomyRegistry = Depends(get_taxonomy_registry)
 ):
     """
     Get detailed information about a specific concept.
     
-    Returns comprehensive concept metadata and relationships.
+    Returns comprehensive concept metadata and relationships, plus the
+    versions in which the concept was added, removed or deprecated.
     """
     try:
         concept_details = await asyncio.to_thread(
@@ -329,6 +839,7 @@ async def get_concept_details(
         if not concept_details:
             raise HTTPException(status_code=404, detail="Concept not found")
         
+        concept_details['version_changes'] = registry.concept_changes(concept_name)
         return concept_details
         
     except HTTPException:
@@ -338,6 +849,171 @@ async def get_concept_details(
         raise HTTPException(status_code=500, detail=f"Failed to get concept details: {str(e)}")
 
 
+@app.get("/concepts/{concept_name}/relationships")
+async def get_concept_relationships(
+    concept_name: str,
+    arcrole: Optional[List[str]] = Query(default=None, description="Arcrole URI or short name, e.g. summation-item; repeatable"),
+    direction: str = Query(default="descendants", pattern="^(descendants|ancestors|both)$"),
+    depth: int = Query(default=1, ge=1, le=20, description="Levels to traverse"),
+    elr: Optional[str] = Query(default=None, description="Extended link role to stay within"),
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Get the calculation, presentation and definition relationships of a concept.
+    
+    Walks the precomputed adjacency arrays breadth-first up to `depth` levels.
+    """
+    try:
+        relationships = loader.get_concept_relationships(
+            concept_name,
+            arcroles=arcrole,
+            direction=direction,
+            depth=depth,
+            elr=elr
+        )
+        
+        if relationships is None:
+            raise HTTPException(status_code=404, detail="Concept not found")
+        
+        return relationships
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error getting concept relationships: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get concept relationships: {str(e)}")
+
+
+@app.get("/concepts/{concept_name}/similar", response_model=List[SimilarConceptInfo])
+async def get_similar_concepts(
+    concept_name: str,
+    k: int = Query(default=10, ge=1, le=100, description="Number of similar concepts"),
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Find concepts similar to a concept.
+    
+    Similarity is the cosine of TF-IDF vectors over labels and documentation.
+    """
+    try:
+        similar = await asyncio.to_thread(loader.find_similar_concepts, concept_name, k)
+        
+        if similar is None:
+            raise HTTPException(status_code=404, detail="Concept not found")
+        
+        return [SimilarConceptInfo(**concept) for concept in similar]
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error finding similar concepts: {e}")
+        raise HTTPException(status_code=500, detail=f"Similarity search failed: {str(e)}")
+
+
+@app.post("/concepts/similar/batch", response_model=Dict[str, Optional[List[SimilarConceptInfo]]])
+async def get_similar_concepts_batch(
+    query: SimilarConceptsBatchQuery,
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Find similar concepts for many concepts at once.
+    
+    Unknown concept names map to null.
+    """
+    try:
+        return await asyncio.to_thread(loader.find_similar_concepts_batch, query.concepts, query.k)
+        
+    except Exception as e:
+        logger.error(f"Error finding similar concepts: {e}")
+        raise HTTPException(status_code=500, detail=f"Similarity search failed: {str(e)}")
+
+
+@app.get("/taxonomy/facets")
+async def get_taxonomy_facets(
+    query: Optional[str] = Query(default=None, description="Search term to count matches for"),
+    include_deprecated: bool = Query(default=True, description="Count deprecated concepts"),
+    period_type: Optional[str] = Query(default=None),
+    balance_type: Optional[str] = Query(default=None),
+    data_type: Optional[str] = Query(default=None),
+    is_abstract: Optional[bool] = Query(default=None),
+    substitution_group: Optional[str] = Query(default=None),
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Get per-facet concept counts for a query.
+    
+    Returns counts by period type, balance type, data type, abstractness,
+    substitution group and deprecation for concepts matching the query and filters.
+    """
+    filters = {
+        'period_type': period_type,
+        'balance_type': balance_type,
+        'data_type': data_type,
+        'is_abstract': is_abstract,
+        'substitution_group': substitution_group,
+    }
+    try:
+        return await asyncio.to_thread(
+            loader.get_facet_counts,
+            query,
+            include_deprecated=include_deprecated,
+            filters=filters
+        )
+        
+    except Exception as e:
+        logger.error(f"Error getting facet counts: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get facet counts: {str(e)}")
+
+
+@app.get("/taxonomy/export")
+async def export_taxonomy(
+    request: Request,
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    include_deprecated: bool = Query(default=True, description="Export deprecated concepts"),
+    period_type: Optional[str] = Query(default=None),
+    balance_type: Optional[str] = Query(default=None),
+    data_type: Optional[str] = Query(default=None),
+    is_abstract: Optional[bool] = Query(default=None),
+    substitution_group: Optional[str] = Query(default=None),
+    loader: TaxonomyLoader = Depends(get_taxonomy_loader)
+):
+    """
+    Export concepts matching facet filters as NDJSON or CSV.
+    
+    The export is streamed in concept ID order and gzip-compressed on the
+    fly when the client accepts gzip, so memory use does not depend on
+    the number of concepts exported.
+    """
+    filters = {
+        'period_type': period_type,
+        'balance_type': balance_type,
+        'data_type': data_type,
+        'is_abstract': is_abstract,
+        'substitution_group': substitution_group,
+    }
+    try:
+        concepts = loader.iter_concepts(include_deprecated=include_deprecated, filters=filters)
+    except Exception as e:
+        logger.error(f"Error exporting taxonomy: {e}")
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+    
+    compress = "gzip" in request.headers.get("accept-encoding", "")
+    headers = {
+        "Content-Disposition": f'attachment; filename="us-gaap-concepts.{format}"',
+        "Vary": "Accept-Encoding"
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    
+    return StreamingResponse(
+        stream_concepts(concepts, format, compress=compress),
+        media_type=EXPORT_FORMATS[format],
+        headers=headers
+    )
+
+
 @app.get("/taxonomy/stats")
 async def get_taxonomy_stats(
     loader: TaxonomyLoader = Depends(get_taxonomy_loader)
@@ -0,0 +1,86 @@
+# backend/src/parse_cache.py
+"""
+Per-file cache of parsed taxonomy files.
+
+A taxonomy release or patch usually touches a handful of schemas and
+linkbases. The extractor's per-file parse results are stored on disk keyed
+by the parser and a hash of the file's bytes, so a reload parses only the
+files whose content changed and reads the rest back. Entries not used by
+the latest load are pruned afterwards.
+"""
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional, Set
+
+from .config import PARSE_CACHE_DIR, SNAPSHOT_FORMAT_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """Content-addressed store of parse results, one pickle per file."""
+
+    def __init__(self, directory: Path = PARSE_CACHE_DIR):
+        self.directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+        self._used: Set[Path] = set()
+
+    def entry_path(self, parser_name: str, path: Path) -> Path:
+        """Cache file for a parser applied to the current contents of a file."""
+        digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()[:24]
+        return self.directory / f"{parser_name}-v{SNAPSHOT_FORMAT_VERSION}-{digest}.pkl"
+
+    def get(self, entry: Path) -> Optional[Any]:
+        """
+        Read a cached parse result.
+
+        Args:
+            entry: Cache file from entry_path
+
+        Returns:
+            The parse result, or None on a miss
+        """
+        self._used.add(entry)
+        try:
+            with open(entry, "rb") as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {entry.name}: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, entry: Path, result: Any):
+        """Store a parse result atomically."""
+        self._used.add(entry)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry)
+        except Exception as e:
+            logger.warning(f"Failed to write parse cache entry {entry.name}: {e}")
+
+    def prune(self) -> int:
+        """
+        Remove entries not read or written since this cache was created.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for path in self.directory.glob("*.pkl"):
+            if path not in self._used:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
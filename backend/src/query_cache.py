@@ -0,0 +1,90 @@
+# backend/src/query_cache.py
+"""
+Bounded LRU cache with time-to-live for query results.
+
+Entries are kept in an OrderedDict in recency order, so lookups, inserts and
+evictions are all O(1). Expired entries are dropped when they are next read.
+Every operation holds a lock because FastAPI serves requests from several
+threads.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from .config import SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL_SECONDS
+
+
+class QueryCache:
+    """LRU + TTL cache with hit, miss and eviction counters."""
+
+    def __init__(self, max_size: int = SEARCH_CACHE_SIZE, ttl_seconds: float = SEARCH_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Normalized query key
+
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and hit rate since startup."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
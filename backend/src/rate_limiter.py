@@ -0,0 +1,76 @@
+# backend/src/rate_limiter.py
+"""
+Token-bucket rate limiter shared across processes.
+
+SEC's fair-access policy caps a client at 10 requests per second across
+everything it runs, so every uvicorn worker must draw from one bucket. The
+bucket's state (tokens left and when they were counted) lives in a 16-byte
+file updated under a file lock; the lock is held only to read and rewrite
+those bytes. Each caller reserves a token and sleeps until it is due, so
+waiting callers are served in order and never busy-poll the lock.
+"""
+import asyncio
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from filelock import FileLock
+
+from .config import SEC_API_DELAY, SEC_RATE_LIMIT_BURST, SEC_RATE_LIMIT_STATE
+
+_STATE = struct.Struct("<dd")
+
+
+class TokenBucket:
+    """Rate limiter whose bucket is shared by every process using the same state file."""
+
+    def __init__(self, rate: float = 1 / SEC_API_DELAY, capacity: float = SEC_RATE_LIMIT_BURST,
+                 state_path: Optional[Path] = SEC_RATE_LIMIT_STATE):
+        self.rate = rate
+        self.capacity = capacity
+        self.state_path = Path(state_path) if state_path is not None else None
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(f"{self.state_path}.lock") if self.state_path is not None else None
+        self._tokens = capacity
+        self._updated = time.time()
+
+    def _read_state(self):
+        try:
+            with open(self.state_path, "rb") as f:
+                return _STATE.unpack(f.read(_STATE.size))
+        except (FileNotFoundError, struct.error):
+            return self.capacity, 0.0
+
+    def _write_state(self, tokens: float, updated: float):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, "wb") as f:
+            f.write(_STATE.pack(tokens, updated))
+
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt if none is left.
+
+        Returns:
+            Seconds to wait before the token may be used
+        """
+        with self._lock:
+            if self._file_lock is None:
+                self._tokens, self._updated, wait = self._take(self._tokens, self._updated)
+                return wait
+            with self._file_lock:
+                tokens, updated, wait = self._take(*self._read_state())
+                self._write_state(tokens, updated)
+                return wait
+
+    def _take(self, tokens: float, updated: float):
+        now = time.time()
+        tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate) - 1
+        return tokens, now, max(0.0, -tokens / self.rate)
+
+    async def acquire(self):
+        """Wait for a token without blocking the event loop."""
+        wait = await asyncio.to_thread(self.reserve)
+        if wait > 0:
+            await asyncio.sleep(wait)
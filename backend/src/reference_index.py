@@ -0,0 +1,212 @@
+# backend/src/reference_index.py
+"""
+Index over the reference linkbases: codification citations and notes.
+
+Distinct references are stored once as interned (part, value) tuples and
+linked to concepts through CSR arrays, so the change-note and
+implementation-note references that dominate the linkbases cost a few
+bytes per concept. Codification references are also keyed by their
+Topic / SubTopic / Section / Paragraph path. The sorted path keys make
+any leading prefix of the hierarchy (a topic, a topic and subtopic, ...)
+one contiguous range that is found with two bisections.
+
+As in the relationship index, concepts missing from the concept store get
+node IDs after the store's IDs.
+"""
+import sys
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Reference parts that locate a paragraph of the codification, outermost first
+CODIFICATION_LEVELS = ('Topic', 'SubTopic', 'Section', 'Paragraph')
+
+_PATH_SEPARATOR = "\x00"
+
+
+def role_name(role: str) -> str:
+    """Short name of a reference role URI, e.g. 'disclosureRef'."""
+    return role.rstrip("/").rsplit("/", 1)[-1]
+
+
+def codification_prefix(levels: Sequence[Optional[str]]) -> str:
+    """
+    Path key prefix for a codification lookup.
+
+    Args:
+        levels: Topic, subtopic, section and paragraph values; trailing
+            values may be None
+
+    Raises:
+        ValueError: If no topic is given or a level is given without the
+            levels above it
+    """
+    given = [level.strip() if level is not None else None for level in levels]
+    while given and not given[-1]:
+        given.pop()
+    if not given:
+        raise ValueError("A topic is required")
+    for name, level in zip(CODIFICATION_LEVELS, given):
+        if not level:
+            raise ValueError(f"{name} is required when a lower level is given")
+    return "".join(level + _PATH_SEPARATOR for level in given)
+
+
+class ReferenceIndex:
+    """Concept references with a codification path lookup."""
+
+    def __init__(self):
+        self.size = 0
+        self.external_names: List[str] = []
+        self.external_ids: Dict[str, int] = {}
+        self.roles: List[str] = []
+        self.part_names: List[str] = []
+        self.references: List[Tuple[int, Tuple[Tuple[int, str], ...]]] = []
+        self.concept_indptr = np.zeros(1, dtype=np.int32)
+        self.concept_refs = np.zeros(0, dtype=np.int32)
+        self.paths: List[str] = []
+        self.path_indptr = np.zeros(1, dtype=np.int32)
+        self.path_nodes = np.zeros(0, dtype=np.int32)
+
+    @classmethod
+    def build(cls, references: Iterable[Tuple[str, str, Tuple[Tuple[str, str], ...]]],
+              concept_ids: Dict[str, int]) -> "ReferenceIndex":
+        """
+        Build the index.
+
+        Args:
+            references: (concept name, role, parts) tuples from
+                taxonomy_extractor.extract_references
+            concept_ids: Mapping of concept name to dense concept ID
+
+        Returns:
+            Populated ReferenceIndex
+        """
+        index = cls()
+        base = len(concept_ids)
+        role_codes: Dict[str, int] = {}
+        part_codes: Dict[str, int] = {}
+        reference_ids: Dict[Tuple[int, Tuple[Tuple[int, str], ...]], int] = {}
+        links = set()
+        path_links = set()
+
+        for name, role, parts in references:
+            node = concept_ids.get(name)
+            if node is None:
+                node = index.external_ids.get(name)
+                if node is None:
+                    node = index.external_ids[name] = base + len(index.external_names)
+                    index.external_names.append(name)
+
+            key = (
+                role_codes.setdefault(role, len(role_codes)),
+                tuple((part_codes.setdefault(part, len(part_codes)), sys.intern(value)) for part, value in parts)
+            )
+            reference_id = reference_ids.get(key)
+            if reference_id is None:
+                reference_id = reference_ids[key] = len(index.references)
+                index.references.append(key)
+            links.add((node, reference_id))
+
+            values = dict(parts)
+            if values.get(CODIFICATION_LEVELS[0]):
+                path = "".join(values.get(level, "") + _PATH_SEPARATOR for level in CODIFICATION_LEVELS)
+                path_links.add((path, node))
+
+        index.size = base + len(index.external_names)
+        index.roles = list(role_codes)
+        index.part_names = list(part_codes)
+
+        if links:
+            pairs = np.array(sorted(links), dtype=np.int32)
+            index.concept_refs = pairs[:, 1].copy()
+            counts = np.bincount(pairs[:, 0], minlength=index.size)
+            index.concept_indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+        else:
+            index.concept_indptr = np.zeros(index.size + 1, dtype=np.int32)
+
+        ordered = sorted(path_links)
+        index.paths = sorted({path for path, _ in ordered})
+        index.path_nodes = np.array([node for _, node in ordered], dtype=np.int32)
+        position = {path: i for i, path in enumerate(index.paths)}
+        path_counts = np.bincount([position[path] for path, _ in ordered], minlength=len(index.paths))
+        index.path_indptr = np.concatenate(([0], np.cumsum(path_counts))).astype(np.int32)
+        return index
+
+    def node_id(self, name: str, concept_ids: Dict[str, int]) -> Optional[int]:
+        """Node ID of a concept name, whether stored or external."""
+        concept_id = concept_ids.get(name)
+        return concept_id if concept_id is not None else self.external_ids.get(name)
+
+    def node_name(self, node: int, concept_names: Sequence[str]) -> str:
+        """Concept name of a node ID."""
+        base = self.size - len(self.external_names)
+        return concept_names[node] if node < base else self.external_names[node - base]
+
+    def reference_count(self, node: int) -> int:
+        """Number of distinct references attached to a node."""
+        if node >= self.size:
+            return 0
+        return int(self.concept_indptr[node + 1] - self.concept_indptr[node])
+
+    def references_for(self, node: int) -> List[Dict[str, str]]:
+        """
+        Materialize the references of a node.
+
+        Args:
+            node: Node ID
+
+        Returns:
+            One dict per reference with its short 'role' name and its parts
+        """
+        if node >= self.size:
+            return []
+        results = []
+        for reference_id in self.concept_refs[self.concept_indptr[node]:self.concept_indptr[node + 1]].tolist():
+            role_code, parts = self.references[reference_id]
+            reference = {'role': role_name(self.roles[role_code])}
+            for part_code, value in parts:
+                reference[self.part_names[part_code]] = value
+            results.append(reference)
+        return results
+
+    def lookup(self, topic: str, subtopic: Optional[str] = None, section: Optional[str] = None,
+               paragraph: Optional[str] = None) -> Dict[int, List[str]]:
+        """
+        Find the concepts that cite a part of the codification.
+
+        Args:
+            topic: Codification topic, e.g. '842'
+            subtopic: Optional subtopic within the topic, e.g. '20'
+            section: Optional section within the subtopic, e.g. '50'
+            paragraph: Optional paragraph within the section, e.g. '1'
+
+        Returns:
+            Mapping of node ID (ascending) to the matching citations, such
+            as '842-20-50-1'
+
+        Raises:
+            ValueError: If a level is given without the levels above it
+        """
+        prefix = codification_prefix((topic, subtopic, section, paragraph))
+        start = bisect_left(self.paths, prefix)
+        end = bisect_left(self.paths, prefix + "\uffff", lo=start)
+
+        matches: Dict[int, List[str]] = {}
+        for path_id in range(start, end):
+            citation = "-".join(level for level in self.paths[path_id].split(_PATH_SEPARATOR) if level)
+            for node in self.path_nodes[self.path_indptr[path_id]:self.path_indptr[path_id + 1]].tolist():
+                matches.setdefault(node, []).append(citation)
+        return dict(sorted(matches.items()))
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the references and lookup arrays."""
+        string_bytes = sum(len(name) + 49 for name in self.external_names)
+        string_bytes += sum(len(path) + 49 for path in self.paths)
+        values = {id(value): value for _, parts in self.references for _, value in parts}
+        string_bytes += sum(len(value) + 49 for value in values.values())
+        # Each reference is a tuple of (part code, value) pair tuples
+        tuple_bytes = sum(56 + 72 * len(parts) for _, parts in self.references)
+        arrays = (self.concept_indptr, self.concept_refs, self.path_indptr, self.path_nodes)
+        return string_bytes + tuple_bytes + sum(array.nbytes for array in arrays)
@@ -0,0 +1,228 @@
+# backend/src/relationship_index.py
+"""
+Adjacency index over calculation, presentation and definition relationships.
+
+Arcs are compiled per arcrole into CSR arrays keyed by concept ID: forward
+edges sorted by (source, ELR, order) with their target, ELR code, order and
+weight, plus a reverse index for ancestor lookups. Networks (arcrole + ELR)
+are the ELR-code runs inside each source's slice. Traversal is then a few
+array slices per visited concept.
+
+Concepts referenced by a linkbase but not present in the concept store
+(e.g. srt or dei members) get node IDs after the store's IDs, so their
+relationships are kept.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DIRECTIONS = ('descendants', 'ancestors', 'both')
+
+
+def arcrole_name(arcrole: str) -> str:
+    """Short name of an arcrole URI, e.g. 'summation-item'."""
+    return arcrole.rstrip("/").rsplit("/", 1)[-1]
+
+
+class ArcGraph:
+    """CSR adjacency of one arcrole, in both directions."""
+
+    def __init__(self, size: int, sources: np.ndarray, targets: np.ndarray, elrs: np.ndarray,
+                 orders: np.ndarray, weights: np.ndarray):
+        order = np.lexsort((targets, orders, elrs, sources))
+        sources = sources[order]
+        self.targets = targets[order].astype(np.int32)
+        self.elrs = elrs[order].astype(np.uint16)
+        self.orders = orders[order].astype(np.float32)
+        self.weights = weights[order].astype(np.float32)
+        self.indptr = np.concatenate(([0], np.cumsum(np.bincount(sources, minlength=size)))).astype(np.int32)
+
+        reverse = np.argsort(self.targets, kind="stable")
+        self.reverse_sources = sources[reverse].astype(np.int32)
+        self.reverse_edges = reverse.astype(np.int32)
+        self.reverse_indptr = np.concatenate(([0], np.cumsum(np.bincount(self.targets, minlength=size)))).astype(np.int32)
+
+    def __len__(self) -> int:
+        return int(self.targets.size)
+
+    def out_edges(self, node: int) -> List[Tuple[int, int, float, float]]:
+        """(target, ELR code, order, weight) of the edges leaving a node."""
+        start, end = self.indptr[node], self.indptr[node + 1]
+        if start == end:
+            return []
+        return list(zip(self.targets[start:end].tolist(), self.elrs[start:end].tolist(),
+                        self.orders[start:end].tolist(), self.weights[start:end].tolist()))
+
+    def in_edges(self, node: int) -> List[Tuple[int, int, float, float]]:
+        """(source, ELR code, order, weight) of the edges arriving at a node."""
+        start, end = self.reverse_indptr[node], self.reverse_indptr[node + 1]
+        if start == end:
+            return []
+        positions = self.reverse_edges[start:end]
+        return list(zip(self.reverse_sources[start:end].tolist(), self.elrs[positions].tolist(),
+                        self.orders[positions].tolist(), self.weights[positions].tolist()))
+
+    def memory_bytes(self) -> int:
+        return sum(array.nbytes for array in (self.targets, self.elrs, self.orders, self.weights, self.indptr,
+                                               self.reverse_sources, self.reverse_edges, self.reverse_indptr))
+
+
+class RelationshipIndex:
+    """Per-arcrole relationship graphs over concept IDs."""
+
+    def __init__(self):
+        self.size = 0
+        self.external_names: List[str] = []
+        self.external_ids: Dict[str, int] = {}
+        self.arcroles: List[str] = []
+        self.elrs: List[str] = []
+        self.graphs: Dict[str, ArcGraph] = {}
+
+    @classmethod
+    def build(cls, arcs: Iterable[Tuple[str, str, str, str, float, float, bool]],
+              concept_ids: Dict[str, int]) -> "RelationshipIndex":
+        """
+        Compile arcs into adjacency arrays.
+
+        Args:
+            arcs: (arcrole, ELR, from name, to name, order, weight, prohibited)
+                tuples from taxonomy_extractor.extract_relationships
+            concept_ids: Mapping of concept name to dense concept ID
+
+        Returns:
+            Populated RelationshipIndex
+        """
+        index = cls()
+        base = len(concept_ids)
+        elr_codes: Dict[str, int] = {}
+
+        def node(name: str) -> int:
+            concept_id = concept_ids.get(name)
+            if concept_id is not None:
+                return concept_id
+            concept_id = index.external_ids.get(name)
+            if concept_id is None:
+                concept_id = index.external_ids[name] = base + len(index.external_names)
+                index.external_names.append(name)
+            return concept_id
+
+        # Later prohibiting arcs remove the arcs they match
+        edges: Dict[str, Dict[Tuple[int, int, int], Tuple[float, float]]] = {}
+        for arcrole, elr, from_name, to_name, order, weight, prohibited in arcs:
+            elr_code = elr_codes.setdefault(elr, len(elr_codes))
+            key = (node(from_name), node(to_name), elr_code)
+            arcrole_edges = edges.setdefault(arcrole, {})
+            if prohibited:
+                arcrole_edges.pop(key, None)
+            else:
+                arcrole_edges[key] = (order, weight)
+
+        index.size = base + len(index.external_names)
+        index.elrs = list(elr_codes)
+        index.arcroles = sorted(edges)
+        for arcrole in index.arcroles:
+            keys = list(edges[arcrole])
+            values = list(edges[arcrole].values())
+            if not keys:
+                continue
+            key_array = np.asarray(keys, dtype=np.int64)
+            value_array = np.asarray(values, dtype=np.float64)
+            index.graphs[arcrole] = ArcGraph(index.size, key_array[:, 0], key_array[:, 1], key_array[:, 2],
+                                             value_array[:, 0], value_array[:, 1])
+        return index
+
+    def node_id(self, name: str, concept_ids: Dict[str, int]) -> Optional[int]:
+        """Node ID of a concept name, whether stored or external."""
+        concept_id = concept_ids.get(name)
+        return concept_id if concept_id is not None else self.external_ids.get(name)
+
+    def node_name(self, node: int, concept_names: Sequence[str]) -> str:
+        """Concept name of a node ID."""
+        base = self.size - len(self.external_names)
+        return concept_names[node] if node < base else self.external_names[node - base]
+
+    def resolve_arcroles(self, arcroles: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Match arcrole URIs or short names (e.g. 'parent-child') to indexed arcroles.
+
+        Raises:
+            ValueError: If a requested arcrole is not indexed
+        """
+        if not arcroles:
+            return list(self.graphs)
+        resolved = []
+        for wanted in arcroles:
+            matches = [arcrole for arcrole in self.graphs if wanted in (arcrole, arcrole_name(arcrole))]
+            if not matches:
+                raise ValueError(f"Unknown arcrole: {wanted}")
+            resolved.extend(match for match in matches if match not in resolved)
+        return resolved
+
+    def traverse(self, node: int, arcroles: Optional[Iterable[str]] = None, direction: str = 'descendants',
+                 depth: int = 1, elr: Optional[str] = None) -> List[Tuple[str, int, int, int, float, float, int]]:
+        """
+        Breadth-first traversal from a concept.
+
+        Args:
+            node: Starting node ID
+            arcroles: Arcrole URIs or short names to follow (all if empty)
+            direction: 'descendants', 'ancestors' or 'both'
+            depth: Number of levels to follow
+            elr: Optional extended link role to stay within
+
+        Returns:
+            List of (arcrole, from node, to node, ELR code, order, weight,
+            level) edges in traversal order
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown direction: {direction}")
+        elr_code = None
+        if elr is not None:
+            if elr not in self.elrs:
+                return []
+            elr_code = self.elrs.index(elr)
+
+        results = []
+        for arcrole in self.resolve_arcroles(arcroles):
+            graph = self.graphs[arcrole]
+            if direction in ('descendants', 'both'):
+                results.extend(self._walk(graph, arcrole, node, depth, elr_code, forward=True))
+            if direction in ('ancestors', 'both'):
+                results.extend(self._walk(graph, arcrole, node, depth, elr_code, forward=False))
+        return results
+
+    @staticmethod
+    def _walk(graph: ArcGraph, arcrole: str, start: int, depth: int, elr_code: Optional[int],
+              forward: bool) -> List[Tuple[str, int, int, int, float, float, int]]:
+        edges = []
+        visited = {start}
+        queue = deque([(start, 0)])
+        while queue:
+            current, level = queue.popleft()
+            if level >= depth:
+                continue
+            for neighbour, edge_elr, order, weight in (graph.out_edges(current) if forward else graph.in_edges(current)):
+                if elr_code is not None and edge_elr != elr_code:
+                    continue
+                source, target = (current, neighbour) if forward else (neighbour, current)
+                edges.append((arcrole, source, target, edge_elr, order, weight, level + 1))
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    queue.append((neighbour, level + 1))
+        return edges
+
+    def counts(self, node: int) -> Dict[str, Dict[str, int]]:
+        """Number of parent and child edges per arcrole short name."""
+        result = {}
+        for arcrole, graph in self.graphs.items():
+            parents = int(graph.reverse_indptr[node + 1] - graph.reverse_indptr[node])
+            children = int(graph.indptr[node + 1] - graph.indptr[node])
+            if parents or children:
+                result[arcrole_name(arcrole)] = {'parents': parents, 'children': children}
+        return result
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the adjacency arrays."""
+        name_bytes = sum(len(name) + 49 for name in self.external_names)
+        return name_bytes + sum(graph.memory_bytes() for graph in self.graphs.values())
@@ -0,0 +1,348 @@
+# backend/src/search_index.py
+"""
+Inverted token index with BM25 ranking for concept search.
+
+Concept names are split on CamelCase boundaries and indexed together with
+labels, alternate-role labels and documentation. Per-term BM25F impacts are precomputed at build
+time, so a query is a handful of vectorized score accumulations followed by
+a bounded top-k selection over the full candidate set. The most frequent
+terms also keep their impacts as dense vectors, because adding a dense
+vector is far cheaper than scattering thousands of postings.
+"""
+import re
+import sys
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Relative importance of each indexed field
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'label': 2.0,
+    'role_labels': 1.5,
+    'documentation': 0.5,
+}
+
+# Score multiplier for terms reached through prefix expansion
+PREFIX_MATCH_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 64
+MIN_PREFIX_LENGTH = 2
+
+# Bonus for concepts whose name or label equals the whole query
+EXACT_MATCH_BONUS = 100.0
+
+# Row count of the stripe layout used to bound top-k selection
+TOP_K_STRIPES = 64
+
+# Terms in at least this fraction of concepts get a dense impact vector...
+DENSE_POSTING_MIN_FRACTION = 1 / 16
+# ...up to this many terms (size * 4 bytes each)
+MAX_DENSE_POSTINGS = 64
+
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+    'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'which', 'with',
+})
+
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+_WORD_RE = re.compile(r"[A-Za-z]+|\d+")
+
+
+def split_camel_case(name: str) -> List[str]:
+    """Split a CamelCase concept name into its word segments."""
+    return _CAMEL_RE.findall(name)
+
+
+def normalize_token(token: str) -> str:
+    """Lowercase a token and strip a simple plural suffix."""
+    token = token.lower()
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Tokenize free text for indexing or querying.
+
+    CamelCase runs are split, so "AssetsCurrent" and "assets current"
+    produce the same tokens.
+    """
+    if not text:
+        return []
+    tokens = []
+    for word in _WORD_RE.findall(text):
+        for part in split_camel_case(word) or [word]:
+            token = normalize_token(part)
+            if token not in STOP_WORDS:
+                tokens.append(token)
+    return tokens
+
+
+def normalize_phrase(text: Optional[str]) -> str:
+    """Normalize a whole name or label for exact-match lookups."""
+    return " ".join(tokenize(text))
+
+
+class SearchIndex:
+    """Inverted index over concept names, labels and documentation."""
+
+    def __init__(self):
+        self.size = 0
+        self.terms: List[str] = []
+        self.term_ids: Dict[str, int] = {}
+        self.postings: List[Tuple[np.ndarray, np.ndarray]] = []
+        self.dense_postings: Dict[int, np.ndarray] = {}
+        self.doc_freqs = np.zeros(0, dtype=np.int32)
+        self.exact_matches: Dict[str, List[int]] = {}
+
+    @classmethod
+    def build(cls, documents: Iterable[Dict[str, Optional[str]]]) -> "SearchIndex":
+        """
+        Build the index.
+
+        Args:
+            documents: One dict per concept ID with any of 'name', 'label',
+                'role_labels' and 'documentation' text
+
+        Returns:
+            Populated SearchIndex
+        """
+        index = cls()
+        field_counts = {field: [] for field in FIELD_WEIGHTS}
+        exact = {}
+
+        for doc_id, doc in enumerate(documents):
+            for field in FIELD_WEIGHTS:
+                counts = {}
+                for token in tokenize(doc.get(field)):
+                    counts[token] = counts.get(token, 0) + 1
+                field_counts[field].append(counts)
+
+            for key in {normalize_phrase(doc.get('name')), normalize_phrase(doc.get('label'))}:
+                if key:
+                    exact.setdefault(key, []).append(doc_id)
+            index.size = doc_id + 1
+
+        if index.size == 0:
+            return index
+
+        avg_lengths = {
+            field: max(sum(sum(c.values()) for c in counts) / index.size, 1.0)
+            for field, counts in field_counts.items()
+        }
+
+        # BM25F: combine length-normalized, weighted term frequencies per doc
+        term_docs: Dict[str, Tuple[List[int], List[float]]] = {}
+        for doc_id in range(index.size):
+            combined = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                counts = field_counts[field][doc_id]
+                if not counts:
+                    continue
+                length = sum(counts.values())
+                norm = 1.0 - BM25_B + BM25_B * length / avg_lengths[field]
+                for token, tf in counts.items():
+                    combined[token] = combined.get(token, 0.0) + weight * tf / norm
+            for token, tf in combined.items():
+                ids, tfs = term_docs.setdefault(token, ([], []))
+                ids.append(doc_id)
+                tfs.append(tf)
+
+        index.terms = sorted(term_docs)
+        index.term_ids = {term: i for i, term in enumerate(index.terms)}
+        doc_freqs = []
+        for term in index.terms:
+            ids, tfs = term_docs[term]
+            tf = np.asarray(tfs, dtype=np.float32)
+            df = len(ids)
+            idf = np.log(1.0 + (index.size - df + 0.5) / (df + 0.5))
+            impacts = (idf * tf * (BM25_K1 + 1.0) / (tf + BM25_K1)).astype(np.float32)
+            index.postings.append((np.asarray(ids, dtype=np.int32), impacts))
+            doc_freqs.append(df)
+
+        index.doc_freqs = np.asarray(doc_freqs, dtype=np.int32)
+        index.exact_matches = exact
+
+        frequent = np.flatnonzero(index.doc_freqs >= DENSE_POSTING_MIN_FRACTION * index.size)
+        for term_id in frequent[np.argsort(-index.doc_freqs[frequent], kind="stable")][:MAX_DENSE_POSTINGS]:
+            ids, impacts = index.postings[term_id]
+            dense = np.zeros(index.size, dtype=np.float32)
+            dense[ids] = impacts
+            index.dense_postings[int(term_id)] = dense
+        return index
+
+    def expand_token(self, token: str) -> List[Tuple[int, float]]:
+        """
+        Resolve a query token to index terms.
+
+        Args:
+            token: Normalized query token
+
+        Returns:
+            List of (term ID, weight) pairs: the exact term, plus the most
+            frequent terms that start with the token
+        """
+        matches = []
+        exact_id = self.term_ids.get(token)
+        if exact_id is not None:
+            matches.append((exact_id, 1.0))
+
+        if len(token) < MIN_PREFIX_LENGTH:
+            return matches
+
+        start = bisect_left(self.terms, token)
+        end = bisect_left(self.terms, token + "\uffff", lo=start)
+        candidates = [i for i in range(start, end) if i != exact_id]
+        if len(candidates) > MAX_PREFIX_EXPANSIONS:
+            freqs = self.doc_freqs[candidates]
+            top = np.argpartition(-freqs, MAX_PREFIX_EXPANSIONS)[:MAX_PREFIX_EXPANSIONS]
+            candidates = [candidates[i] for i in sorted(top)]
+        matches.extend((term_id, PREFIX_MATCH_WEIGHT) for term_id in candidates)
+        return matches
+
+    def resolve_token(self, token: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Resolve a query token to weighted postings.
+
+        Args:
+            token: Normalized query token
+
+        Returns:
+            List of (concept IDs, impacts) with expansion weights applied;
+            concept IDs are None when impacts is a dense vector. Prefix
+            expansions are merged into a single posting.
+        """
+        expansions = self.expand_token(token)
+        if len(expansions) == 1:
+            term_id, weight = expansions[0]
+            dense = self.dense_postings.get(term_id)
+            if dense is not None:
+                return [(None, dense if weight == 1.0 else dense * weight)]
+            ids, impacts = self.postings[term_id]
+            return [(ids, impacts if weight == 1.0 else impacts * weight)]
+        if not expansions:
+            return []
+
+        merged = np.bincount(
+            np.concatenate([self.postings[term_id][0] for term_id, _ in expansions]),
+            weights=np.concatenate([self.postings[term_id][1] * weight for term_id, weight in expansions]),
+            minlength=self.size
+        ).astype(np.float32)
+        ids = np.flatnonzero(merged)
+        if ids.size >= DENSE_POSTING_MIN_FRACTION * self.size:
+            return [(None, merged)]
+        return [(ids.astype(np.int32), merged[ids])]
+
+    def score(self, query: str,
+              token_cache: Optional[Dict[str, List[Tuple[np.ndarray, np.ndarray]]]] = None) -> Optional[np.ndarray]:
+        """
+        Score every concept against a query.
+
+        Args:
+            query: Free-text query
+            token_cache: Optional dict of already resolved tokens, shared
+                across the queries of a batch so each token is resolved once
+
+        Returns:
+            Score array indexed by concept ID, or None if nothing matched
+        """
+        tokens = tokenize(query)
+        if not tokens or self.size == 0:
+            return None
+
+        scores = None
+        for token in dict.fromkeys(tokens):
+            if token_cache is None:
+                resolved = self.resolve_token(token)
+            else:
+                resolved = token_cache.get(token)
+                if resolved is None:
+                    resolved = token_cache[token] = self.resolve_token(token)
+            for ids, impacts in resolved:
+                if scores is None:
+                    scores = np.zeros(self.size, dtype=np.float32)
+                if ids is None:
+                    scores += impacts
+                else:
+                    scores[ids] += impacts
+
+        exact_ids = self.exact_matches.get(" ".join(tokens))
+        if exact_ids:
+            if scores is None:
+                scores = np.zeros(self.size, dtype=np.float32)
+            scores[exact_ids] += EXACT_MATCH_BONUS
+
+        return scores
+
+    def top_k(self, scores: np.ndarray, limit: int, mask: Optional[np.ndarray] = None,
+              after: Optional[Tuple[float, int]] = None) -> List[Tuple[int, float]]:
+        """
+        Select the best-scoring concepts.
+
+        Args:
+            scores: Score array from score()
+            limit: Number of results to return
+            mask: Optional boolean array of allowed concept IDs
+            after: Optional (score, concept ID) of the last result of the
+                previous page; only concepts ranked after it are returned
+
+        Returns:
+            List of (concept ID, score), best first, ties broken by ID
+        """
+        if mask is not None:
+            scores = scores * mask
+        if after is not None:
+            # Keyset pagination over the (score desc, ID asc) order
+            after_score = np.float32(after[0])
+            ties = np.flatnonzero(scores == after_score)
+            scores = np.where(scores < after_score, scores, 0)
+            ties = ties[ties > after[1]]
+            scores[ties] = after_score
+
+        # The limit-th largest of the maxima of disjoint stripes is a lower
+        # bound on the limit-th largest score, so it prunes the candidate set
+        # to a handful with one cheap vectorized pass
+        threshold = 0
+        if scores.size >= TOP_K_STRIPES * limit:
+            usable = scores.size // TOP_K_STRIPES * TOP_K_STRIPES
+            stripe_max = scores[:usable].reshape(TOP_K_STRIPES, -1).max(axis=0)
+            threshold = np.partition(stripe_max, stripe_max.size - limit)[stripe_max.size - limit]
+        candidates = np.flatnonzero(scores >= threshold) if threshold > 0 else np.flatnonzero(scores > 0)
+        if candidates.size == 0:
+            return []
+
+        candidate_scores = scores[candidates]
+        if candidates.size > limit:
+            # Keep everything tied with the k-th score so the ID tie-break
+            # stays deterministic
+            kth = np.partition(candidate_scores, candidates.size - limit)[candidates.size - limit]
+            keep = candidate_scores >= kth
+            candidates = candidates[keep]
+            candidate_scores = candidate_scores[keep]
+
+        order = np.lexsort((candidates, -candidate_scores))[:limit]
+        return [(int(candidates[i]), float(candidate_scores[i])) for i in order]
+
+    def __setstate__(self, state):
+        # Share term strings with the other taxonomy versions loaded in the process
+        self.__dict__.update(state)
+        self.terms = [sys.intern(term) for term in self.terms]
+        self.term_ids = {term: term_id for term_id, term in enumerate(self.terms)}
+        self.exact_matches = {sys.intern(phrase): ids for phrase, ids in self.exact_matches.items()}
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the terms and postings."""
+        term_bytes = sum(len(term) + 49 for term in self.terms)
+        posting_bytes = sum(ids.nbytes + impacts.nbytes for ids, impacts in self.postings)
+        posting_bytes += sum(dense.nbytes for dense in self.dense_postings.values())
+        return term_bytes + posting_bytes + self.doc_freqs.nbytes
+
+    def term_count(self) -> int:
+        """Number of distinct indexed terms."""
+        return len(self.terms)
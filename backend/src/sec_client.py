@@ -1,108 +1,262 @@
 # backend/src/sec_client.py
-import requests
-import time
+import asyncio
+import httpx
 import logging
+import random
 from typing import Optional, Tuple, Dict, List
-from .config import SEC_USER_AGENT, SEC_BASE_URL, SEC_ARCHIVES_URL, SEC_API_DELAY
+from .company_index import COMPANY_TICKERS_CACHE, CompanyIndex, company_tickers_expired, load_company_index
+from .config import (SEC_USER_AGENT, SEC_BASE_URL, SEC_ARCHIVES_URL, SEC_COMPANY_FACTS_URL, SEC_MAX_CONNECTIONS,
+                     SEC_MAX_RETRIES, SEC_REQUEST_TIMEOUT_SECONDS, SEC_RETRY_BACKOFF_SECONDS)
+from .http_cache import CachedResponse, HttpCache
+from .instance_parser import find_instance_document, parse_extension_roles, parse_instance
+from .rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
 class SECClient:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": SEC_USER_AGENT})
-        self.last_request_time = 0
-    
-    def _rate_limit(self):
-        """Ensure we don't exceed SEC rate limits"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < SEC_API_DELAY:
-            time.sleep(SEC_API_DELAY - elapsed)
-        self.last_request_time = time.time()
-    
-    def get_cik_by_ticker(self, ticker: str) -> Optional[str]:
+    """Async EDGAR client: pooled keep-alive connections, a shared rate limit, retries and response caching"""
+    
+    def __init__(self, http_cache: Optional[HttpCache] = None, rate_limiter: Optional[TokenBucket] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.http_cache = http_cache if http_cache is not None else HttpCache()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else TokenBucket()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._company_index: Optional[CompanyIndex] = None
+        self._company_index_lock: Optional[asyncio.Lock] = None
+        self.retries = 0
+        self.coalesced = 0
+    
+    def _http(self) -> httpx.AsyncClient:
+        """Connection pool, created on first use inside the running event loop"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": SEC_USER_AGENT},
+                timeout=SEC_REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=SEC_MAX_CONNECTIONS,
+                                    max_keepalive_connections=SEC_MAX_CONNECTIONS),
+                follow_redirects=True,
+                transport=self._transport
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Full-jitter exponential backoff, never shorter than a 429's Retry-After"""
+        delay = random.uniform(0, SEC_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+        if response is not None:
+            try:
+                delay = max(delay, float(response.headers.get("Retry-After", 0)))
+            except ValueError:
+                pass
+        return delay
+    
+    async def _send(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """Send a rate-limited GET, retrying 429s, 5xx and connection errors"""
+        for attempt in range(SEC_MAX_RETRIES + 1):
+            await self.rate_limiter.acquire()
+            try:
+                response = await self._http().get(url, headers=headers)
+            except httpx.TransportError as e:
+                if attempt == SEC_MAX_RETRIES:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"Request for {url} failed ({e}); retrying in {delay:.2f}s")
+            else:
+                if response.status_code != 429 and response.status_code < 500 or attempt == SEC_MAX_RETRIES:
+                    return response
+                delay = self._backoff(attempt, response)
+                logger.warning(f"SEC answered {response.status_code} for {url}; retrying in {delay:.2f}s")
+            self.retries += 1
+            await asyncio.sleep(delay)
+    
+    async def _get(self, url: str) -> CachedResponse:
+        """GET a URL through the response cache; concurrent calls for one URL share a single request"""
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self.http_cache.fetch_async(url, self._send))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+        else:
+            self.coalesced += 1
+        # Shielded so one caller's cancellation does not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def get_company_index(self) -> CompanyIndex:
+        """Get the ticker/name index, loading or refreshing it when expired"""
+        index = self._company_index
+        if index is not None and not index.is_stale():
+            return index
+        if self._company_index_lock is None:
+            self._company_index_lock = asyncio.Lock()
+        async with self._company_index_lock:
+            if self._company_index is None or self._company_index.is_stale():
+                try:
+                    body = None
+                    if company_tickers_expired():
+                        try:
+                            body = (await self._get(f"{SEC_BASE_URL}/files/company_tickers.json")).content
+                        except Exception as e:
+                            if not COMPANY_TICKERS_CACHE.exists():
+                                raise
+                            logger.warning(f"Failed to refresh company tickers, using cached copy: {e}")
+                    # Only the parse and index build leave the event loop
+                    self._company_index = await asyncio.to_thread(load_company_index, body)
+                except Exception:
+                    # Keep serving an expired index rather than failing lookups
+                    if self._company_index is None:
+                        raise
+                    logger.warning("Company index refresh failed; keeping the previous index")
+            return self._company_index
+    
+    @property
+    def companies_indexed(self) -> int:
+        """Number of companies in the loaded index (0 before the first lookup)"""
+        return len(self._company_index) if self._company_index is not None else 0
+    
+    async def get_cik_by_ticker(self, ticker: str) -> Optional[str]:
         """Get CIK for a stock ticker"""
         try:
-            self._rate_limit()
-            
-            response = self.session.get(f"{SEC_BASE_URL}/files/company_tickers.json")
-            response.raise_for_status()
-            data = response.json()
-            
-            for entry in data.values():
-                if entry["ticker"].upper() == ticker.upper():
-                    return str(entry["cik_str"]).zfill(10)
-            
-            return None
+            company = (await self.get_company_index()).lookup_ticker(ticker)
+            return company['cik'] if company else None
             
         except Exception as e:
             logger.error(f"Error getting CIK for {ticker}: {e}")
             return None
     
-    def get_latest_filing(self, cik: str, form_type: str = "10-K") -> Optional[Tuple[str, str]]:
+    async def search_companies(self, query: str, limit: int = 10) -> List[Dict]:
+        """Resolve a ticker or company name to matching companies"""
+        return (await self.get_company_index()).search(query, limit=limit)
+    
+    async def get_latest_filing(self, cik: str, form_type: str = "10-K") -> Optional[Tuple[str, str]]:
         """Get latest filing for a CIK"""
+        filing = (await self.get_latest_filings(cik, [form_type])).get(form_type)
+        return (filing['accession_number'], filing['primary_document']) if filing else None
+    
+    async def get_latest_filings(self, cik: str, form_types: List[str]) -> Dict[str, Dict]:
+        """Get the latest filing of each form type for a CIK from one submissions request"""
         try:
-            self._rate_limit()
-            
-            response = self.session.get(f"{SEC_BASE_URL}/submissions/CIK{cik}.json")
-            response.raise_for_status()
-            data = response.json()
+            data = (await self._get(f"{SEC_BASE_URL}/submissions/CIK{cik}.json")).json()
             
             recent_filings = data["filings"]["recent"]
-            forms = recent_filings["form"]
-            accession_numbers = recent_filings["accessionNumber"]
-            primary_documents = recent_filings["primaryDocument"]
+            filing_dates = recent_filings.get("filingDate", [])
+            latest = {}
             
-            for i, form in enumerate(forms):
-                if form == form_type:
-                    accession = accession_numbers[i].replace("-", "")
-                    document = primary_documents[i]
-                    return accession, document
+            # Recent filings are listed newest first
+            for i, form in enumerate(recent_filings["form"]):
+                if form in form_types and form not in latest:
+                    latest[form] = {
+                        'accession_number': recent_filings["accessionNumber"][i].replace("-", ""),
+                        'primary_document': recent_filings["primaryDocument"][i],
+                        'filing_date': filing_dates[i] if i < len(filing_dates) else 'Unknown'
+                    }
             
-            return None
+            return latest
+            
+        except Exception as e:
+            logger.error(f"Error getting latest filings for CIK {cik}: {e}")
+            return {}
+    
+    async def get_company_facts(self, cik: str) -> Optional[bytes]:
+        """Get the raw companyfacts JSON of a CIK"""
+        try:
+            return (await self._get(f"{SEC_COMPANY_FACTS_URL}/CIK{cik}.json")).content
             
         except Exception as e:
-            logger.error(f"Error getting latest filing for CIK {cik}: {e}")
+            logger.error(f"Error getting company facts for CIK {cik}: {e}")
             return None
     
-    def search_company_filings(self, company_name: str, form_type: str = "10-K", limit: int = 5) -> List[Dict]:
-        """Search for company filings (placeholder implementation)"""
-        # This is a simplified implementation
-        # In a real app, you'd implement proper company search
+    async def search_company_filings(self, company_name: str, form_type: str = "10-K", limit: int = 5) -> List[Dict]:
+        """Search for the latest filing of each company matching a ticker or name"""
         try:
-            # For now, try to get CIK if company_name looks like a ticker
-            if len(company_name) <= 5 and company_name.isalpha():
-                cik = self.get_cik_by_ticker(company_name)
-                if cik:
-                    filing_info = self.get_latest_filing(cik, form_type)
-                    if filing_info:
-                        return [{
-                            'cik': cik,
-                            'company_name': company_name.upper(),
-                            'form_type': form_type,
-                            'filing_date': 'Unknown',
-                            'accession_number': filing_info[0],
-                            'primary_document': filing_info[1]
-                        }]
+            companies = await self.search_companies(company_name, limit=limit)
+            # Fetched concurrently; the shared rate limiter paces the requests
+            latest = await asyncio.gather(*(self.get_latest_filings(company['cik'], [form_type])
+                                            for company in companies))
             
-            return []
+            filings = []
+            for company, filing_info in zip(companies, latest):
+                if form_type in filing_info:
+                    filings.append({
+                        'cik': company['cik'],
+                        'company_name': company['name'],
+                        'form_type': form_type,
+                        **filing_info[form_type]
+                    })
+            
+            return filings
             
         except Exception as e:
             logger.error(f"Error searching company filings: {e}")
             return []
     
-    def get_filing_data(self, cik: str, accession_number: str) -> Optional[Dict]:
-        """Get filing data (placeholder implementation)"""
-        # This would parse XBRL data from the filing
-        # For now, return a placeholder structure
+    async def get_filing_date(self, cik: str, accession_number: str) -> Optional[str]:
+        """Look up a filing's date in the company's recent submissions"""
+        accession = accession_number.replace("-", "")
+        try:
+            data = (await self._get(f"{SEC_BASE_URL}/submissions/CIK{cik.zfill(10)}.json")).json()
+            recent = data["filings"]["recent"]
+            for number, filing_date in zip(recent["accessionNumber"], recent.get("filingDate", [])):
+                if number.replace("-", "") == accession:
+                    return filing_date
+        except Exception as e:
+            logger.warning(f"Error getting filing date for {cik}/{accession_number}: {e}")
+        return None
+    
+    async def get_filing_data(self, cik: str, accession_number: str, primary_document: Optional[str] = None,
+                              filing_date: Optional[str] = None) -> Optional[Dict]:
+        """Download a filing's XBRL instance and extract its facts and extension roles (None if it has none)"""
+        accession = accession_number.replace("-", "")
+        try:
+            index = (await self._get(self.get_filing_url(cik, accession, "index.json"))).json()
+            names = [item['name'] for item in index.get('directory', {}).get('item', [])]
+            document = find_instance_document(names, primary_document)
+            if document is None:
+                return None
+            
+            content = (await self._get(self.get_filing_url(cik, accession, document))).content
+        except httpx.HTTPStatusError as e:
+            # Only a missing filing means "no data"; other download failures raise so callers can retry
+            if e.response.status_code != 404:
+                raise
+            logger.warning(f"Filing {cik}/{accession_number} not found: {e}")
+            return None
+        
+        try:
+            fact_table = await asyncio.to_thread(parse_instance, content)
+        except Exception as e:
+            logger.error(f"Error parsing filing data for {cik}/{accession_number}: {e}")
+            return None
+        
+        # Roles come from the filing's own extension schema; remote schemas are base taxonomies
+        roles = {}
+        schema = next((ref for ref in fact_table.schema_refs if "://" not in ref), None)
+        if schema in names:
+            try:
+                schema_content = (await self._get(self.get_filing_url(cik, accession, schema))).content
+                roles = await asyncio.to_thread(parse_extension_roles, schema_content)
+            except Exception as e:
+                logger.warning(f"Failed to read extension schema {schema}: {e}")
+        
+        company = self._company_index.lookup_cik(cik) if self._company_index is not None else None
+        company_name = fact_table.cover.get('dei:EntityRegistrantName') or (company['name'] if company else 'Unknown')
         return {
-            'cik': cik,
+            'cik': cik.zfill(10),
             'accession_number': accession_number,
-            'company_name': 'Unknown',
-            'filing_date': 'Unknown',
-            'form_type': 'Unknown',
-            'facts': {},  # Would contain XBRL facts
-            'roles': {}   # Would contain role information
+            'company_name': company_name,
+            'filing_date': filing_date or await self.get_filing_date(cik, accession_number) or 'Unknown',
+            'form_type': fact_table.cover.get('dei:DocumentType', 'Unknown'),
+            'period_end': fact_table.cover.get('dei:DocumentPeriodEndDate'),
+            'instance_document': document,
+            'facts': fact_table.concept_summary(),
+            'fact_table': fact_table,
+            'roles': roles
         }
     
     def get_filing_url(self, cik: str, accession: str, document: str) -> str:
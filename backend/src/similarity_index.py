@@ -0,0 +1,211 @@
+# backend/src/similarity_index.py
+"""
+TF-IDF similarity between concepts.
+
+Labels and documentation are turned into a sparse, L2-normalized TF-IDF
+matrix. Rows are kept in CSR form (row = concept). Columns split by document
+frequency: the few very common terms, which hold most of the nonzeros, form
+a dense float32 block scored with a BLAS matrix product, and the long tail
+is kept in CSC form and scored with a gather plus bincount. A batch of
+concepts goes through the same two paths as one matrix product and one
+bincount over a flattened (query, concept) index space per chunk.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .search_index import tokenize
+
+# Queries per vectorized chunk in batch mode (bounds the dense score block)
+BATCH_CHUNK_SIZE = 64
+# Terms in at least this fraction of concepts are stored densely...
+DENSE_TERM_MIN_FRACTION = 0.02
+# ...up to this many columns (size * MAX_DENSE_TERMS * 4 bytes)
+MAX_DENSE_TERMS = 128
+
+
+def _gather(indptr: np.ndarray, columns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions of every entry in the given compressed rows or columns.
+
+    Returns:
+        Tuple of (positions into the data arrays, index into `columns` owning each)
+    """
+    starts = indptr[columns]
+    lengths = indptr[columns + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    owners = np.repeat(np.arange(columns.size), lengths)
+    offsets = np.cumsum(lengths) - lengths
+    positions = np.repeat(starts, lengths) + (np.arange(total) - np.repeat(offsets, lengths))
+    return positions, owners
+
+
+class SimilarityIndex:
+    """Sparse TF-IDF matrix over concept labels and documentation."""
+
+    def __init__(self):
+        self.size = 0
+        self.row_indptr = np.zeros(1, dtype=np.int32)
+        self.row_terms = np.zeros(0, dtype=np.int32)
+        self.row_weights = np.zeros(0, dtype=np.float32)
+        self.col_indptr = np.zeros(1, dtype=np.int32)
+        self.col_rows = np.zeros(0, dtype=np.int32)
+        self.col_weights = np.zeros(0, dtype=np.float32)
+        self.dense_slots = np.zeros(0, dtype=np.int32)
+        self.dense_block = np.zeros((0, 0), dtype=np.float32)
+
+    @classmethod
+    def build(cls, documents: Iterable[Dict], term_ids: Dict[str, int]) -> "SimilarityIndex":
+        """
+        Build the TF-IDF matrix.
+
+        Args:
+            documents: One dict per concept ID with 'label' and 'documentation'
+            term_ids: Term vocabulary to use as matrix columns
+
+        Returns:
+            Populated SimilarityIndex
+        """
+        index = cls()
+        indptr = [0]
+        terms = []
+        tfs = []
+        for doc in documents:
+            counts = {}
+            for token in tokenize(doc.get('label')) + tokenize(doc.get('documentation')):
+                term_id = term_ids.get(token)
+                if term_id is not None:
+                    counts[term_id] = counts.get(term_id, 0) + 1
+            for term_id in sorted(counts):
+                terms.append(term_id)
+                tfs.append(counts[term_id])
+            indptr.append(len(terms))
+            index.size += 1
+
+        row_indptr = np.asarray(indptr, dtype=np.int64)
+        row_terms = np.asarray(terms, dtype=np.int32)
+        tf = np.asarray(tfs, dtype=np.float32)
+
+        num_terms = max(len(term_ids), 1)
+        df = np.bincount(row_terms, minlength=num_terms).astype(np.float32)
+        idf = np.log((index.size + 1) / (df + 1)) + 1.0
+        weights = (1.0 + np.log(tf)) * idf[row_terms] if tf.size else tf
+
+        # L2-normalize rows so dot products are cosine similarities
+        row_ids = np.repeat(np.arange(index.size), np.diff(row_indptr))
+        norms = np.sqrt(np.bincount(row_ids, weights=weights * weights, minlength=index.size))
+        norms[norms == 0] = 1.0
+        weights = (weights / norms[row_ids]).astype(np.float32)
+
+        index.row_indptr = row_indptr.astype(np.int32)
+        index.row_terms = row_terms
+        index.row_weights = weights
+
+        # Most common terms go to the dense block, the rest to CSC
+        dense_terms = np.flatnonzero(df >= max(DENSE_TERM_MIN_FRACTION * index.size, 1))
+        dense_terms = np.sort(dense_terms[np.argsort(-df[dense_terms], kind="stable")[:MAX_DENSE_TERMS]])
+        index.dense_slots = np.full(num_terms, -1, dtype=np.int32)
+        index.dense_slots[dense_terms] = np.arange(dense_terms.size, dtype=np.int32)
+        slots = index.dense_slots[row_terms]
+        is_dense = slots >= 0
+        index.dense_block = np.zeros((index.size, dense_terms.size), dtype=np.float32)
+        index.dense_block[row_ids[is_dense], slots[is_dense]] = weights[is_dense]
+
+        sparse_terms = row_terms[~is_dense]
+        order = np.argsort(sparse_terms, kind="stable")
+        index.col_rows = row_ids[~is_dense][order].astype(np.int32)
+        index.col_weights = weights[~is_dense][order]
+        index.col_indptr = np.concatenate(([0], np.cumsum(np.bincount(sparse_terms, minlength=num_terms)))).astype(np.int32)
+        return index
+
+    def _row(self, concept_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.row_indptr[concept_id], self.row_indptr[concept_id + 1]
+        return self.row_terms[start:end], self.row_weights[start:end]
+
+    def _score_rows(self, query_slots: np.ndarray, terms: np.ndarray, weights: np.ndarray,
+                    num_queries: int) -> np.ndarray:
+        """
+        Dot products of sparse query rows with every concept.
+
+        Args:
+            query_slots: Query index of each (term, weight) entry
+            terms: Term ID of each entry
+            weights: Normalized weight of each entry
+            num_queries: Number of query rows
+
+        Returns:
+            Score matrix of shape (num_queries, size)
+        """
+        slots = self.dense_slots[terms]
+        is_dense = slots >= 0
+
+        # Common terms: one matrix product against the dense block
+        queries = np.zeros((num_queries, self.dense_block.shape[1]), dtype=np.float32)
+        queries[query_slots[is_dense], slots[is_dense]] = weights[is_dense]
+        scores = (queries @ self.dense_block.T).astype(np.float64)
+
+        # Rare terms: expand each into its CSC column and accumulate
+        sparse = ~is_dense
+        positions, owners = _gather(self.col_indptr, terms[sparse])
+        if positions.size:
+            flat = query_slots[sparse][owners] * self.size + self.col_rows[positions]
+            products = self.col_weights[positions] * weights[sparse][owners]
+            scores += np.bincount(flat, weights=products, minlength=num_queries * self.size).reshape(num_queries, self.size)
+        return scores
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int, exclude: int) -> List[Tuple[int, float]]:
+        scores[exclude] = 0.0
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        order = np.lexsort((candidates, -scores[candidates]))
+        return [(int(candidates[i]), float(scores[candidates[i]])) for i in order]
+
+    def similar(self, concept_id: int, k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Find the concepts most similar to one concept.
+
+        Args:
+            concept_id: Concept to compare against all others
+            k: Number of neighbours to return
+
+        Returns:
+            List of (concept ID, cosine similarity), most similar first
+        """
+        terms, weights = self._row(concept_id)
+        if terms.size == 0:
+            return []
+        return self._top_k(self._score_rows(np.zeros(terms.size, dtype=np.int64), terms, weights, 1)[0], k, concept_id)
+
+    def similar_batch(self, concept_ids: List[int], k: int = 10,
+                      chunk_size: int = BATCH_CHUNK_SIZE) -> List[List[Tuple[int, float]]]:
+        """
+        Find the top-k neighbours of many concepts at once.
+
+        Args:
+            concept_ids: Concepts to find neighbours for
+            k: Number of neighbours per concept
+            chunk_size: Queries multiplied per vectorized pass
+
+        Returns:
+            One neighbour list per input concept, in input order
+        """
+        results: List[List[Tuple[int, float]]] = []
+        for chunk_start in range(0, len(concept_ids), chunk_size):
+            chunk = np.asarray(concept_ids[chunk_start:chunk_start + chunk_size], dtype=np.int64)
+
+            row_positions, query_slots = _gather(self.row_indptr, chunk)
+            scores = self._score_rows(query_slots, self.row_terms[row_positions], self.row_weights[row_positions], chunk.size)
+
+            for slot, concept_id in enumerate(chunk):
+                results.append(self._top_k(scores[slot], k, int(concept_id)))
+        return results
+
+    def memory_bytes(self) -> int:
+        """Memory held by the CSR, CSC and dense arrays."""
+        return sum(array.nbytes for array in (self.row_indptr, self.row_terms, self.row_weights,
+                                               self.col_indptr, self.col_rows, self.col_weights,
+                                               self.dense_slots, self.dense_block))
@@ -0,0 +1,174 @@
+# backend/src/suggest_index.py
+"""
+Prefix index for search-as-you-type concept suggestions.
+
+Every label word and CamelCase name segment becomes a key in a sorted array.
+Each key's concept IDs are stored weight-ordered in one flat array, so all
+completions of a prefix occupy a single contiguous slice found with two
+binary searches. Results for very short prefixes, whose slices are large,
+are precomputed.
+"""
+import sys
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from .search_index import split_camel_case
+
+SUGGEST_MAX_RESULTS = 20
+PRECOMPUTED_PREFIX_LENGTH = 3
+
+_WORD_SPLIT = str.maketrans({c: " " for c in ",.;:()[]/-'\""})
+
+
+def suggestion_words(name: str, label: Optional[str]) -> Set[str]:
+    """Collect the lowercase label words and name segments of a concept."""
+    words = {part.lower() for part in split_camel_case(name)}
+    if label:
+        words.update(word.lower() for word in label.translate(_WORD_SPLIT).split())
+    return words
+
+
+def concept_weight(label: Optional[str], is_abstract: bool, is_deprecated: bool) -> float:
+    """
+    Static popularity weight of a concept.
+
+    Reportable, current concepts outrank abstracts and deprecated ones, and
+    shorter (more general) labels outrank longer ones.
+    """
+    weight = 1.0 / (1 + len((label or "").split()))
+    if not is_abstract:
+        weight += 2.0
+    if not is_deprecated:
+        weight += 1.0
+    return weight
+
+
+class SuggestIndex:
+    """Sorted-array prefix index over concept words."""
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.offsets = np.zeros(1, dtype=np.int32)
+        self.concept_ids = np.zeros(0, dtype=np.int32)
+        self.weights = np.zeros(0, dtype=np.float32)
+        self.precomputed: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def build(cls, documents: Iterable[Dict]) -> "SuggestIndex":
+        """
+        Build the index.
+
+        Args:
+            documents: One dict per concept ID with 'name', 'label',
+                'is_abstract' and 'is_deprecated'
+
+        Returns:
+            Populated SuggestIndex
+        """
+        index = cls()
+        key_ids: Dict[str, List[int]] = {}
+        weights = []
+
+        for concept_id, doc in enumerate(documents):
+            weights.append(concept_weight(doc.get('label'), doc.get('is_abstract', False), doc.get('is_deprecated', False)))
+            for word in suggestion_words(doc['name'], doc.get('label')):
+                key_ids.setdefault(word, []).append(concept_id)
+
+        index.weights = np.asarray(weights, dtype=np.float32)
+        index.keys = sorted(key_ids)
+
+        offsets = [0]
+        flat = []
+        for key in index.keys:
+            ids = sorted(key_ids[key], key=lambda i: (-weights[i], i))
+            flat.extend(ids)
+            offsets.append(len(flat))
+        index.offsets = np.asarray(offsets, dtype=np.int32)
+        index.concept_ids = np.asarray(flat, dtype=np.int32)
+
+        prefixes = {key[:length] for key in index.keys for length in range(1, PRECOMPUTED_PREFIX_LENGTH + 1)}
+        index.precomputed = {prefix: index._rank(index._prefix_slice(prefix), SUGGEST_MAX_RESULTS) for prefix in prefixes}
+        return index
+
+    def _key_range(self, prefix: str):
+        """Index range of the keys starting with prefix."""
+        lo = bisect_left(self.keys, prefix)
+        return lo, bisect_left(self.keys, prefix + "\uffff", lo=lo)
+
+    def _prefix_slice(self, prefix: str) -> np.ndarray:
+        """Concept IDs of every key starting with prefix (may repeat)."""
+        lo, hi = self._key_range(prefix)
+        if lo == hi:
+            return self.concept_ids[:0]
+        return self.concept_ids[self.offsets[lo]:self.offsets[hi]]
+
+    def _prefix_heads(self, prefix: str, limit: int) -> np.ndarray:
+        """
+        Best concept IDs per key starting with prefix.
+
+        Each key's IDs are stored weight-ordered, so the top results for the
+        whole prefix are among the first `limit` IDs of each key.
+        """
+        lo, hi = self._key_range(prefix)
+        if hi - lo > 64:
+            return self._prefix_slice(prefix)
+        heads = [self.concept_ids[self.offsets[i]:min(self.offsets[i] + limit, self.offsets[i + 1])] for i in range(lo, hi)]
+        return np.concatenate(heads) if heads else self.concept_ids[:0]
+
+    def _rank(self, ids: np.ndarray, limit: int) -> np.ndarray:
+        """Deduplicate concept IDs and order them by weight, then ID."""
+        ids = np.unique(ids)
+        if ids.size > limit:
+            weights = self.weights[ids]
+            kth = np.partition(weights, ids.size - limit)[ids.size - limit]
+            ids = ids[weights >= kth]
+        order = np.lexsort((ids, -self.weights[ids]))
+        return ids[order][:limit]
+
+    def suggest(self, text: str, limit: int = 10) -> List[int]:
+        """
+        Complete a partially typed query.
+
+        Every typed word, including the unfinished last one, must prefix
+        one of the concept's words.
+
+        Args:
+            text: Text typed so far
+            limit: Maximum number of concept IDs to return
+
+        Returns:
+            Concept IDs ordered by weight
+        """
+        words = text.lower().translate(_WORD_SPLIT).split()
+        if not words or not self.keys:
+            return []
+        limit = min(limit, SUGGEST_MAX_RESULTS)
+
+        if len(words) == 1:
+            precomputed = self.precomputed.get(words[0])
+            if precomputed is not None:
+                return precomputed[:limit].tolist()
+            return self._rank(self._prefix_heads(words[0], limit), limit).tolist()
+
+        # Start from the most selective word to keep intersections small
+        slices = sorted((self._prefix_slice(word) for word in words), key=len)
+        candidates = np.unique(slices[0])
+        for ids in slices[1:]:
+            if candidates.size == 0:
+                break
+            candidates = np.intersect1d(candidates, ids)
+        return self._rank(candidates, limit).tolist()
+
+    def __setstate__(self, state):
+        # Share key strings with the other taxonomy versions loaded in the process
+        self.__dict__.update(state)
+        self.keys = [sys.intern(key) for key in self.keys]
+        self.precomputed = {sys.intern(prefix): ids for prefix, ids in self.precomputed.items()}
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the index arrays and keys."""
+        key_bytes = sum(len(key) for key in self.keys) + 8 * len(self.keys)
+        precomputed_bytes = sum(ids.nbytes for ids in self.precomputed.values())
+        return key_bytes + self.offsets.nbytes + self.concept_ids.nbytes + self.weights.nbytes + precomputed_bytes
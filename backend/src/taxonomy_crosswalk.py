@@ -0,0 +1,102 @@
+# backend/src/taxonomy_crosswalk.py
+"""
+Concept crosswalk between two taxonomy versions.
+
+Records which concepts a newer version added, which it dropped, and which
+concepts it deprecated that were active in the older version. The sets are
+kept as concept ID arrays into each version's ConceptStore; names are
+materialized only when a crosswalk is listed.
+"""
+import sys
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .concept_store import ConceptStore
+
+
+def _contains(sorted_ids: np.ndarray, concept_id: int) -> bool:
+    position = int(np.searchsorted(sorted_ids, concept_id))
+    return position < len(sorted_ids) and int(sorted_ids[position]) == concept_id
+
+
+class TaxonomyCrosswalk:
+    """Added, removed and newly deprecated concepts from one version to the next."""
+
+    def __init__(self, from_version: str, to_version: str, old: ConceptStore, new: ConceptStore,
+                 added: np.ndarray, removed: np.ndarray, deprecated: np.ndarray):
+        self.from_version = from_version
+        self.to_version = to_version
+        self.old = old
+        self.new = new
+        self.added = added
+        self.removed = removed
+        self.deprecated = deprecated
+
+    @classmethod
+    def build(cls, from_version: str, to_version: str, old: ConceptStore, new: ConceptStore) -> "TaxonomyCrosswalk":
+        """
+        Compare two versions' concepts by name.
+
+        Args:
+            from_version: Older version label
+            to_version: Newer version label
+            old: Concepts of the older version
+            new: Concepts of the newer version
+
+        Returns:
+            TaxonomyCrosswalk; added and deprecated hold IDs in new, removed
+            holds IDs in old
+        """
+        old_ids = np.fromiter((old.ids.get(name, -1) for name in new.names), dtype=np.int64, count=len(new))
+        in_old = old_ids >= 0
+        in_new = np.fromiter((name in new.ids for name in old.names), dtype=bool, count=len(old))
+
+        was_deprecated = np.zeros(len(new), dtype=bool)
+        was_deprecated[in_old] = old.flags['is_deprecated'][old_ids[in_old]]
+        newly_deprecated = new.flags['is_deprecated'] & in_old & ~was_deprecated
+
+        return cls(
+            from_version, to_version, old, new,
+            added=np.flatnonzero(~in_old).astype(np.int32),
+            removed=np.flatnonzero(~in_new).astype(np.int32),
+            deprecated=np.flatnonzero(newly_deprecated).astype(np.int32),
+        )
+
+    def status_of(self, name: str) -> Optional[str]:
+        """'added', 'removed' or 'deprecated' for a concept that changed, else None."""
+        if name in self.new.ids:
+            concept_id = self.new.ids[name]
+            if _contains(self.added, concept_id):
+                return 'added'
+            if _contains(self.deprecated, concept_id):
+                return 'deprecated'
+            return None
+        return 'removed' if name in self.old.ids else None
+
+    def to_dict(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Summarize the crosswalk.
+
+        Args:
+            limit: Maximum names listed per change type (None for all)
+
+        Returns:
+            Dictionary with the versions, counts and concept names per change type
+        """
+        return {
+            'from_version': self.from_version,
+            'to_version': self.to_version,
+            'counts': {
+                'added': len(self.added),
+                'removed': len(self.removed),
+                'deprecated': len(self.deprecated),
+            },
+            'added': [self.new.names[i] for i in self.added[:limit].tolist()],
+            'removed': [self.old.names[i] for i in self.removed[:limit].tolist()],
+            'deprecated': [self.new.names[i] for i in self.deprecated[:limit].tolist()],
+        }
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by the ID arrays."""
+        return sum(sys.getsizeof(a) for a in (self.added, self.removed, self.deprecated))
@@ -0,0 +1,69 @@
+# backend/src/taxonomy_export.py
+"""
+Streaming serialization of concepts for bulk export.
+
+Concepts are written to a small text buffer that is flushed every
+EXPORT_CHUNK_ROWS rows and, when requested, fed through a streaming gzip
+compressor, so memory use does not grow with the size of the export.
+"""
+import csv
+import io
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator
+
+from .concept_store import CONCEPT_FIELDS
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+EXPORT_CHUNK_ROWS = 500
+
+
+def stream_concepts(concepts: Iterable[Dict[str, Any]], export_format: str = 'ndjson',
+                    compress: bool = False) -> Iterator[bytes]:
+    """
+    Serialize concepts as NDJSON or CSV, chunk by chunk.
+
+    Args:
+        concepts: Concept info dicts
+        export_format: 'ndjson' or 'csv'
+        compress: Whether to gzip the output on the fly
+
+    Yields:
+        Encoded (and optionally gzip-compressed) chunks
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {export_format}")
+
+    # wbits=31 selects the gzip container
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer = io.StringIO()
+    writer = None
+    if export_format == 'csv':
+        writer = csv.DictWriter(buffer, fieldnames=CONCEPT_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(data) if compressor else data
+
+    for row, concept in enumerate(concepts, start=1):
+        if writer is not None:
+            writer.writerow(concept)
+        else:
+            buffer.write(json.dumps(concept))
+            buffer.write("\n")
+        if row % EXPORT_CHUNK_ROWS == 0:
+            chunk = drain()
+            if chunk:
+                yield chunk
+
+    chunk = drain()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
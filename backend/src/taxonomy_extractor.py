@@ -0,0 +1,543 @@
+# backend/src/taxonomy_extractor.py
+"""
+Fast-path taxonomy extractor.
+
+Reads concept attributes straight from the taxonomy schemas and labels from
+the label linkbases with lxml iterparse, spreading files across a process
+pool. Produces the same concepts dict as the Arelle-backed TaxonomyLoader
+path without resolving a full DTS, but only for the package's own schemas:
+concepts of imported schemas (the XBRL base schemas, srt, dei) are left out.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from lxml import etree
+
+from .config import US_GAAP_TAXONOMY_DIR, TAXONOMY_EXTRACTOR_WORKERS
+from .parse_cache import ParseCache
+
+logger = logging.getLogger(__name__)
+
+XS_NS = "http://www.w3.org/2001/XMLSchema"
+XBRLI_NS = "http://www.xbrl.org/2003/instance"
+LINK_NS = "http://www.xbrl.org/2003/linkbase"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+STANDARD_LABEL_ROLE = "http://www.xbrl.org/2003/role/label"
+DOCUMENTATION_LABEL_ROLE = "http://www.xbrl.org/2003/role/documentation"
+
+# Alternate label roles kept per concept and indexed for search, by short name
+LABEL_ROLES = {
+    'terseLabel': "http://www.xbrl.org/2003/role/terseLabel",
+    'verboseLabel': "http://www.xbrl.org/2003/role/verboseLabel",
+    'totalLabel': "http://www.xbrl.org/2003/role/totalLabel",
+    'periodStartLabel': "http://www.xbrl.org/2003/role/periodStartLabel",
+    'periodEndLabel': "http://www.xbrl.org/2003/role/periodEndLabel",
+    'negatedLabel': "http://www.xbrl.org/2009/role/negatedLabel",
+}
+
+# Deprecation is recorded in labels of these roles and in the -depcon- networks: the
+# target of every dep-* arc, and the children of the deprecated presentation network
+DEPRECATED_LABEL_ROLES = (
+    "http://www.xbrl.org/2009/role/deprecatedLabel",
+    "http://www.xbrl.org/2009/role/deprecatedDateLabel",
+)
+DEPRECATION_ARCROLE_PREFIX = "http://www.xbrl.org/2009/arcrole/dep-"
+DEPRECATED_ELR_SUFFIX = "/role/deprecated/deprecated"
+PARENT_CHILD_ARCROLE = "http://www.xbrl.org/2003/arcrole/parent-child"
+DEPRECATION_FILE_MARKER = '-depcon-'
+
+# Directories that make up the "all" entry point DTS
+SCHEMA_DIRS = ('elts', 'dis', 'stm')
+
+_XS_ELEMENT = f"{{{XS_NS}}}element"
+_LINK_LABEL_LINK = f"{{{LINK_NS}}}labelLink"
+_LINK_LOC = f"{{{LINK_NS}}}loc"
+_LINK_LABEL = f"{{{LINK_NS}}}label"
+_LINK_LABEL_ARC = f"{{{LINK_NS}}}labelArc"
+_XLINK_HREF = f"{{{XLINK_NS}}}href"
+_XLINK_LABEL = f"{{{XLINK_NS}}}label"
+_XLINK_ROLE = f"{{{XLINK_NS}}}role"
+_XLINK_FROM = f"{{{XLINK_NS}}}from"
+_XLINK_TO = f"{{{XLINK_NS}}}to"
+_XLINK_ARCROLE = f"{{{XLINK_NS}}}arcrole"
+
+# Relationship linkbases: extended link tag -> arc tag
+RELATIONSHIP_LINKS = {
+    f"{{{LINK_NS}}}calculationLink": f"{{{LINK_NS}}}calculationArc",
+    f"{{{LINK_NS}}}presentationLink": f"{{{LINK_NS}}}presentationArc",
+    f"{{{LINK_NS}}}definitionLink": f"{{{LINK_NS}}}definitionArc",
+}
+RELATIONSHIP_FILE_MARKERS = ('-cal-', '-pre-', '-def-')
+
+_LINK_REFERENCE_LINK = f"{{{LINK_NS}}}referenceLink"
+_LINK_REFERENCE = f"{{{LINK_NS}}}reference"
+_LINK_REFERENCE_ARC = f"{{{LINK_NS}}}referenceArc"
+REFERENCE_FILE_MARKER = '-ref-'
+STANDARD_REFERENCE_ROLE = "http://www.xbrl.org/2003/role/reference"
+
+
+def discover_taxonomy_files(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR) -> Tuple[List[Path], List[Path]]:
+    """
+    Find the schema and label linkbase files of a taxonomy package.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+
+    Returns:
+        Tuple of (schema files, label linkbase files)
+    """
+    schema_files = []
+    label_files = []
+    for dir_name in SCHEMA_DIRS:
+        directory = Path(taxonomy_dir) / dir_name
+        if not directory.is_dir():
+            continue
+        schema_files.extend(sorted(directory.glob("*.xsd")))
+        label_files.extend(sorted(p for p in directory.glob("*.xml") if '-lab-' in p.name or '-doc-' in p.name))
+    return schema_files, label_files
+
+
+def discover_relationship_files(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR) -> List[Path]:
+    """
+    Find the calculation, presentation and definition linkbases of a taxonomy package.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+
+    Returns:
+        List of relationship linkbase files
+    """
+    files = []
+    for dir_name in SCHEMA_DIRS:
+        directory = Path(taxonomy_dir) / dir_name
+        if directory.is_dir():
+            files.extend(sorted(p for p in directory.glob("*.xml")
+                                if any(marker in p.name for marker in RELATIONSHIP_FILE_MARKERS)))
+    return files
+
+
+def discover_deprecation_files(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR) -> List[Path]:
+    """
+    Find the deprecation (depcon) linkbases of a taxonomy package.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+
+    Returns:
+        List of deprecation linkbase files
+    """
+    return [p for p in discover_relationship_files(taxonomy_dir) if DEPRECATION_FILE_MARKER in p.name]
+
+
+def discover_reference_files(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR) -> List[Path]:
+    """
+    Find the reference linkbases of a taxonomy package.
+
+    Reference linkbases (codification, change note and implementation note
+    references) may sit in any package directory, so the whole tree is searched.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+
+    Returns:
+        List of reference linkbase files, largest first
+    """
+    files = [p for p in Path(taxonomy_dir).rglob("*.xml") if REFERENCE_FILE_MARKER in p.name]
+    return sorted(files, key=lambda p: (-p.stat().st_size, str(p)))
+
+
+def element_name(element_id: str) -> str:
+    """Concept name from a schema element id such as 'us-gaap_Assets'."""
+    return element_id.partition("_")[2] or element_id
+
+
+def _qname_attr(value: Optional[str]) -> Optional[str]:
+    """Normalize a prefixed QName attribute value."""
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def parse_schema(path: Path) -> List[Dict[str, Any]]:
+    """
+    Extract global element declarations from a schema file.
+
+    Args:
+        path: Schema file to parse
+
+    Returns:
+        List of element attribute dicts, including the element id
+    """
+    elements = []
+    prefix = None
+    target_namespace = None
+
+    for event, elem in etree.iterparse(str(path), events=("start", "end"), remove_comments=True):
+        if event == "start":
+            if target_namespace is None and elem.tag == f"{{{XS_NS}}}schema":
+                target_namespace = elem.get("targetNamespace")
+                for ns_prefix, uri in elem.nsmap.items():
+                    if ns_prefix and uri == target_namespace:
+                        prefix = ns_prefix
+                        break
+            continue
+
+        if elem.tag != _XS_ELEMENT:
+            continue
+
+        parent = elem.getparent()
+        if parent is not None and parent.tag == f"{{{XS_NS}}}schema" and elem.get("name"):
+            name = elem.get("name")
+            elements.append({
+                'id': elem.get("id"),
+                'name': name,
+                'qname': f"{prefix}:{name}" if prefix else name,
+                'data_type': _qname_attr(elem.get("type")),
+                'period_type': elem.get(f"{{{XBRLI_NS}}}periodType"),
+                'balance_type': elem.get(f"{{{XBRLI_NS}}}balance"),
+                'is_abstract': elem.get("abstract", "false").strip() in ("true", "1"),
+                'substitution_group': _qname_attr(elem.get("substitutionGroup")),
+            })
+            # Global declarations are complete; free the subtree
+            elem.clear(keep_tail=False)
+
+    return elements
+
+
+def _lang_rank(lang: Optional[str]) -> int:
+    """Rank label languages, preferring English."""
+    if not lang:
+        return 1
+    lang = lang.lower()
+    if lang == "en-us":
+        return 0
+    if lang.startswith("en"):
+        return 1
+    return 2
+
+
+def parse_label_linkbase(path: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Extract labels from a label linkbase.
+
+    Args:
+        path: Label linkbase file to parse
+
+    Returns:
+        Mapping of schema element id to {label role: label text}
+    """
+    labels = {}
+    ranks = {}
+
+    for _, link in etree.iterparse(str(path), events=("end",), tag=_LINK_LABEL_LINK, remove_comments=True):
+        locators = {}
+        resources = {}
+        arcs = []
+
+        for child in link:
+            tag = child.tag
+            if tag == _LINK_LOC:
+                href = child.get(_XLINK_HREF, "")
+                locators[child.get(_XLINK_LABEL)] = href.rpartition("#")[2]
+            elif tag == _LINK_LABEL:
+                resources.setdefault(child.get(_XLINK_LABEL), []).append(
+                    (child.get(_XLINK_ROLE) or STANDARD_LABEL_ROLE, child.get(XML_LANG), child.text or "")
+                )
+            elif tag == _LINK_LABEL_ARC:
+                arcs.append((child.get(_XLINK_FROM), child.get(_XLINK_TO)))
+
+        for from_label, to_label in arcs:
+            element_id = locators.get(from_label)
+            if element_id is None:
+                continue
+            concept_labels = labels.setdefault(element_id, {})
+            for role, lang, text in resources.get(to_label, ()):
+                rank = _lang_rank(lang)
+                key = (element_id, role)
+                if key not in ranks or rank < ranks[key]:
+                    ranks[key] = rank
+                    concept_labels[role] = text
+
+        link.clear(keep_tail=False)
+        while link.getprevious() is not None:
+            del link.getparent()[0]
+
+    return labels
+
+
+def parse_relationship_linkbase(path: Path) -> List[Tuple[str, str, str, str, float, float, bool]]:
+    """
+    Extract the arcs of a calculation, presentation or definition linkbase.
+
+    Args:
+        path: Relationship linkbase file to parse
+
+    Returns:
+        List of (arcrole, ELR, from concept, to concept, order, weight,
+        prohibited) tuples; weight is 1.0 unless the arc sets one
+    """
+    arcs = []
+
+    for _, link in etree.iterparse(str(path), events=("end",), tag=tuple(RELATIONSHIP_LINKS), remove_comments=True):
+        arc_tag = RELATIONSHIP_LINKS[link.tag]
+        elr = link.get(_XLINK_ROLE)
+        locators = {}
+        link_arcs = []
+
+        for child in link:
+            tag = child.tag
+            if tag == _LINK_LOC:
+                href = child.get(_XLINK_HREF, "")
+                locators[child.get(_XLINK_LABEL)] = element_name(href.rpartition("#")[2])
+            elif tag == arc_tag:
+                link_arcs.append(child)
+
+        for arc in link_arcs:
+            from_name = locators.get(arc.get(_XLINK_FROM))
+            to_name = locators.get(arc.get(_XLINK_TO))
+            if from_name is None or to_name is None:
+                continue
+            arcs.append((
+                arc.get(_XLINK_ARCROLE),
+                elr,
+                from_name,
+                to_name,
+                float(arc.get("order", "1")),
+                float(arc.get("weight", "1")),
+                arc.get("use") == "prohibited",
+            ))
+
+        link.clear(keep_tail=False)
+        while link.getprevious() is not None:
+            del link.getparent()[0]
+
+    return arcs
+
+
+def parse_reference_linkbase(path: Path) -> List[Tuple[str, str, Tuple[Tuple[str, str], ...]]]:
+    """
+    Extract the concept references of a reference linkbase.
+
+    Args:
+        path: Reference linkbase file to parse
+
+    Returns:
+        List of (concept name, reference role, parts) tuples, where parts
+        are (part local name, text) pairs such as ('Topic', '842')
+    """
+    references = []
+
+    for _, link in etree.iterparse(str(path), events=("end",), tag=_LINK_REFERENCE_LINK, remove_comments=True):
+        locators = {}
+        resources = {}
+        arcs = []
+
+        for child in link:
+            tag = child.tag
+            if tag == _LINK_LOC:
+                href = child.get(_XLINK_HREF, "")
+                locators[child.get(_XLINK_LABEL)] = element_name(href.rpartition("#")[2])
+            elif tag == _LINK_REFERENCE:
+                parts = tuple((etree.QName(part).localname, (part.text or "").strip())
+                              for part in child if isinstance(part.tag, str))
+                resources.setdefault(child.get(_XLINK_LABEL), []).append(
+                    (child.get(_XLINK_ROLE) or STANDARD_REFERENCE_ROLE, parts)
+                )
+            elif tag == _LINK_REFERENCE_ARC:
+                arcs.append((child.get(_XLINK_FROM), child.get(_XLINK_TO)))
+
+        for from_label, to_label in arcs:
+            name = locators.get(from_label)
+            if name is None:
+                continue
+            for role, parts in resources.get(to_label, ()):
+                references.append((name, role, parts))
+
+        link.clear(keep_tail=False)
+        while link.getprevious() is not None:
+            del link.getparent()[0]
+
+    return references
+
+
+def is_deprecation_arc(arcrole: Optional[str], elr: Optional[str]) -> bool:
+    """Whether an arc marks its target concept as deprecated."""
+    if arcrole is None:
+        return False
+    return arcrole.startswith(DEPRECATION_ARCROLE_PREFIX) or (
+        arcrole == PARENT_CHILD_ARCROLE and elr is not None and elr.endswith(DEPRECATED_ELR_SUFFIX))
+
+
+def deprecated_concepts(arcs: Iterable[Tuple[str, str, str, str, float, float, bool]]) -> Set[str]:
+    """
+    Names of the concepts deprecated by the arcs of the deprecation linkbases.
+
+    Args:
+        arcs: Arcs as returned by parse_relationship_linkbase
+
+    Returns:
+        Set of deprecated concept names
+    """
+    return {to_name for arcrole, elr, _, to_name, _, _, prohibited in arcs
+            if not prohibited and is_deprecation_arc(arcrole, elr)}
+
+
+def build_concept_info(element: Dict[str, Any], labels: Dict[str, str], deprecated: bool = False) -> Dict[str, Any]:
+    """
+    Build a TaxonomyLoader concept dict from schema attributes and labels.
+
+    Args:
+        element: Element attributes from parse_schema
+        labels: Mapping of label role to text for the element
+        deprecated: Whether a deprecation linkbase marks the element deprecated
+
+    Returns:
+        Concept info dict in the TaxonomyLoader layout, with the
+        alternate-role labels under 'labels'
+    """
+    name = element['name']
+    standard_label = labels.get(STANDARD_LABEL_ROLE)
+    label = standard_label if standard_label and standard_label.strip() else name
+    documentation = labels.get(DOCUMENTATION_LABEL_ROLE) or standard_label or None
+
+    return {
+        'name': name,
+        'qname': element['qname'],
+        'label': label,
+        'documentation': documentation,
+        'data_type': element['data_type'],
+        'period_type': element['period_type'],
+        'balance_type': element['balance_type'],
+        'is_deprecated': deprecated or any(role in labels for role in DEPRECATED_LABEL_ROLES),
+        'is_abstract': element['is_abstract'],
+        'substitution_group': element['substitution_group'],
+        'labels': {role: labels[uri] for role, uri in LABEL_ROLES.items() if labels.get(uri, "").strip()}
+    }
+
+
+def parse_files(tasks: List[Tuple[Callable[[Path], Any], Path]], max_workers: Optional[int] = TAXONOMY_EXTRACTOR_WORKERS,
+                cache: Optional[ParseCache] = None) -> List[Any]:
+    """
+    Run per-file parsers, across a process pool when there is more than one file to parse.
+
+    Args:
+        tasks: (parser, path) pairs; parsers must be module-level functions
+        max_workers: Process pool size (None for CPU count, 0 to parse in-process)
+        cache: Optional parse cache; files whose content is cached are not parsed again
+
+    Returns:
+        Parse results in task order
+    """
+    results = [None] * len(tasks)
+    entries = [cache.entry_path(parser.__name__, path) for parser, path in tasks] if cache else None
+    pending = []
+    for i in range(len(tasks)):
+        if cache is not None:
+            results[i] = cache.get(entries[i])
+        if results[i] is None:
+            pending.append(i)
+
+    if max_workers == 0 or len(pending) <= 1:
+        for i in pending:
+            parser, path = tasks[i]
+            results[i] = parser(path)
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [(i, executor.submit(*tasks[i])) for i in pending]
+            for i, future in futures:
+                results[i] = future.result()
+
+    if cache is not None:
+        for i in pending:
+            cache.put(entries[i], results[i])
+        if len(pending) < len(tasks):
+            logger.info(f"Reused {len(tasks) - len(pending)} cached parse results, parsed {len(pending)} files")
+    return results
+
+
+def extract_concepts(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR, max_workers: Optional[int] = TAXONOMY_EXTRACTOR_WORKERS,
+                     cache: Optional[ParseCache] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract the concepts dict from a taxonomy package without Arelle.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+        max_workers: Process pool size (None for CPU count, 0 to parse in-process)
+        cache: Optional parse cache reused across loads
+
+    Returns:
+        Mapping of concept name to concept info
+    """
+    schema_files, label_files = discover_taxonomy_files(taxonomy_dir)
+    deprecation_files = discover_deprecation_files(taxonomy_dir)
+    logger.info(f"Extracting concepts from {len(schema_files)} schemas, {len(label_files)} label linkbases "
+                f"and {len(deprecation_files)} deprecation linkbases")
+
+    # Label linkbases go first; they are the largest files
+    results = parse_files([(parse_label_linkbase, path) for path in label_files]
+                          + [(parse_relationship_linkbase, path) for path in deprecation_files]
+                          + [(parse_schema, path) for path in schema_files], max_workers, cache)
+    label_results = results[:len(label_files)]
+    deprecation_results = results[len(label_files):len(label_files) + len(deprecation_files)]
+    schema_results = results[len(label_files) + len(deprecation_files):]
+    deprecated = deprecated_concepts(arc for arcs in deprecation_results for arc in arcs)
+
+    labels = {}
+    for result in label_results:
+        for element_id, roles in result.items():
+            labels.setdefault(element_id, {}).update(roles)
+
+    concepts = {}
+    for elements in schema_results:
+        for element in elements:
+            concepts[element['name']] = build_concept_info(element, labels.get(element['id'], {}),
+                                                           element['name'] in deprecated)
+
+    return concepts
+
+
+def extract_relationships(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR, max_workers: Optional[int] = TAXONOMY_EXTRACTOR_WORKERS,
+                          cache: Optional[ParseCache] = None) -> List[Tuple[str, str, str, str, float, float, bool]]:
+    """
+    Extract every calculation, presentation and definition arc of a taxonomy package.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+        max_workers: Process pool size (None for CPU count, 0 to parse in-process)
+        cache: Optional parse cache reused across loads
+
+    Returns:
+        List of arcs as returned by parse_relationship_linkbase
+    """
+    files = discover_relationship_files(taxonomy_dir)
+    logger.info(f"Extracting relationships from {len(files)} linkbases")
+    results = parse_files([(parse_relationship_linkbase, path) for path in files], max_workers, cache)
+
+    return [arc for arcs in results for arc in arcs]
+
+
+def extract_references(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR, max_workers: Optional[int] = TAXONOMY_EXTRACTOR_WORKERS,
+                       cache: Optional[ParseCache] = None) -> List[Tuple[str, str, Tuple[Tuple[str, str], ...]]]:
+    """
+    Extract every concept reference of a taxonomy package.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+        max_workers: Process pool size (None for CPU count, 0 to parse in-process)
+        cache: Optional parse cache reused across loads
+
+    Returns:
+        List of references as returned by parse_reference_linkbase
+    """
+    files = discover_reference_files(taxonomy_dir)
+    logger.info(f"Extracting references from {len(files)} linkbases")
+    results = parse_files([(parse_reference_linkbase, path) for path in files], max_workers, cache)
+
+    return [reference for references in results for reference in references]
@@ -1,25 +1,224 @@
 # backend/src/taxonomy_loader.py
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from pathlib import Path
-from arelle import Cntlr
-from .config import US_GAAP_ENTRY_POINT
+import numpy as np
+from .config import (US_GAAP_ENTRY_POINT, US_GAAP_TAXONOMY_DIR, USE_TAXONOMY_SNAPSHOT, TAXONOMY_EXTRACTOR,
+                     ARELLE_WORK_OFFLINE, TAXONOMY_PACKAGE_DIRS, BASE_SCHEMAS_DIR, SNAPSHOT_DIR, PARSE_CACHE_DIR,
+                     DOCUMENTATION_DIR)
+from .taxonomy_snapshot import compute_taxonomy_hash, load_snapshot, save_snapshot, prune_snapshots
+from .taxonomy_package import collect_remappings, configure_offline, timed_document_loads, log_load_timings
+from .taxonomy_extractor import (extract_concepts, extract_references, extract_relationships, is_deprecation_arc,
+                                 DEPRECATED_LABEL_ROLES, LABEL_ROLES, STANDARD_LABEL_ROLE, DOCUMENTATION_LABEL_ROLE)
+from .search_index import SearchIndex, tokenize
+from .fuzzy_index import FuzzyIndex
+from .facet_index import FacetIndex
+from .concept_store import ConceptStore
+from .documentation_store import prune_documentation
+from .suggest_index import SuggestIndex
+from .similarity_index import SimilarityIndex
+from .query_cache import QueryCache
+from .relationship_index import RelationshipIndex, arcrole_name
+from .reference_index import ReferenceIndex
+from .parse_cache import ParseCache
 
 logger = logging.getLogger(__name__)
 
+# Phases reported while a load runs, in order; 'failed' replaces whichever phase raised
+LOAD_PHASES = ('pending', 'loading_snapshot', 'loading_dts', 'extracting', 'indexing', 'ready', 'failed')
+
+
+def _freeze_filters(filters: Optional[Dict[str, Any]]) -> tuple:
+    """Hashable form of a facet filter dict."""
+    return tuple(sorted(
+        (facet, tuple(sorted(value, key=repr)) if isinstance(value, (list, tuple, set)) else value)
+        for facet, value in (filters or {}).items()
+    ))
+
+
 class TaxonomyLoader:
-    def __init__(self):
+    def __init__(self, entry_point: Path = US_GAAP_ENTRY_POINT, taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR,
+                 extractor: str = TAXONOMY_EXTRACTOR, documentation_dir: Optional[Path] = None):
+        if extractor not in ('arelle', 'lxml'):
+            raise ValueError(f"Unknown taxonomy extractor: {extractor}")
+        self.entry_point = Path(entry_point)
+        self.taxonomy_dir = Path(taxonomy_dir)
+        # Each taxonomy version keeps its own snapshots, so loading one never prunes another's
+        self.snapshot_dir = SNAPSHOT_DIR / self.taxonomy_dir.name
+        self.documentation_dir = (Path(documentation_dir) if documentation_dir is not None
+                                  else DOCUMENTATION_DIR / self.taxonomy_dir.name)
+        self.extractor = extractor
         self.controller = None
         self.model_xbrl = None
         self.concepts = {}
-        self.concept_labels = {}
+        self.concept_names = []
+        self.search_index = None
+        self.label_role_indexes = {}
+        self.suggest_index = None
+        self.fuzzy_index = None
+        self.facet_index = None
+        self.similarity_index = None
+        self.relationship_index = None
+        self.reference_index = None
+        self.search_cache = QueryCache()
+        self.taxonomy_hash = None
+        self.load_source = None
         self.is_loaded = False
+        self.generation = 0
+        self.load_phase = 'pending'
+        self.load_progress = {}
+        self.load_error = None
+        self._phase_started = time.monotonic()
+        self._document_timings = None
+        self._parse_cache = None
+        self._load_lock = threading.Lock()
     
-    def load_taxonomy(self):
-        """Load the US-GAAP taxonomy using Arelle."""
-        if self.is_loaded:
-            logger.info("Taxonomy already loaded")
-            return
+    def load_taxonomy(self, use_snapshot: bool = USE_TAXONOMY_SNAPSHOT):
+        """
+        Load the US-GAAP taxonomy.
+        
+        A snapshot matching the current taxonomy files is used when available;
+        otherwise concepts are extracted (with Arelle or the lxml fast path,
+        per the configured extractor) and a new snapshot is written. Progress
+        is reported by load_status() while this runs on another thread.
+        
+        Args:
+            use_snapshot: Whether to read and write the persisted snapshot
+                and the per-file parse cache
+        """
+        # Concurrent callers wait for the first one instead of loading again
+        with self._load_lock:
+            if self.is_loaded:
+                logger.info("Taxonomy already loaded")
+                return
+            
+            try:
+                self._load(use_snapshot)
+            except Exception as e:
+                self.load_error = str(e)
+                self._set_phase('failed')
+                raise
+    
+    def _load(self, use_snapshot: bool):
+        """Load from a snapshot or the taxonomy files; callers hold the load lock."""
+        # Cached search results belong to the previous taxonomy
+        self.search_cache.clear()
+        self.load_error = None
+        
+        self.taxonomy_hash = compute_taxonomy_hash(self.taxonomy_dir)
+        
+        if use_snapshot:
+            self._set_phase('loading_snapshot')
+            state = load_snapshot(self.taxonomy_hash, self.snapshot_dir)
+            # The snapshot refers to a documentation blob, which must still be on disk
+            if (state is not None and state.get('extractor') == self.extractor
+                    and state['concepts'].documentation.is_available()):
+                self._restore_state(state)
+                self.load_source = 'snapshot'
+                self.is_loaded = True
+                self._set_phase('ready')
+                logger.info(f"Loaded {len(self.concepts)} concepts from snapshot")
+                return
+        
+        # Files unchanged since an earlier load are read back instead of parsed
+        self._parse_cache = ParseCache(PARSE_CACHE_DIR / self.taxonomy_dir.name) if use_snapshot else None
+        try:
+            if self.extractor == 'lxml':
+                self._load_from_files()
+            else:
+                self._load_from_dts()
+            if self._parse_cache is not None:
+                self._parse_cache.prune()
+        finally:
+            self._parse_cache = None
+        self.load_source = self.extractor
+        # Searches can be served while the snapshot is written
+        self._set_phase('ready')
+        
+        if use_snapshot:
+            self.write_snapshot()
+    
+    def _set_phase(self, phase: str, **progress):
+        """Record the current load phase and its progress counters."""
+        self.load_phase = phase
+        self.load_progress = progress
+        self._phase_started = time.monotonic()
+        logger.info(f"Taxonomy load phase: {phase}" + (f" ({progress['step']})" if 'step' in progress else ""))
+    
+    def load_status(self) -> Dict[str, Any]:
+        """
+        Report how far the taxonomy load has got.
+        
+        Returns:
+            Dictionary with the phase, seconds spent in it, phase-specific
+            progress (documents loaded, concepts extracted, index step) and
+            the error of a failed load
+        """
+        status = {
+            'phase': self.load_phase,
+            'phase_seconds': round(time.monotonic() - self._phase_started, 3),
+            **self.load_progress
+        }
+        if self.load_phase == 'loading_dts' and self._document_timings is not None:
+            status['documents_loaded'] = len(self._document_timings)
+        elif self.load_phase == 'extracting':
+            status['concepts_extracted'] = len(self.concepts)
+        elif self.load_phase == 'ready':
+            status['concepts'] = len(self.concepts)
+            status['source'] = self.load_source
+        if self.load_error:
+            status['error'] = self.load_error
+        return status
+    
+    def write_snapshot(self):
+        """Persist the extracted state so later starts can skip the DTS load."""
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        try:
+            path = save_snapshot(self._snapshot_state(), self.taxonomy_hash, self.snapshot_dir)
+            prune_snapshots(keep=path, snapshot_dir=self.snapshot_dir)
+            # The kept snapshot's blob is the current one; blobs of pruned snapshots are orphans
+            prune_documentation(keep=self.concepts.documentation.path, directory=self.documentation_dir)
+            return path
+        except Exception as e:
+            logger.warning(f"Failed to write taxonomy snapshot: {e}")
+            return None
+    
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """Collect the derived state that goes into a snapshot."""
+        return {
+            'extractor': self.extractor,
+            'concepts': self.concepts,
+            'search_index': self.search_index,
+            'label_role_indexes': self.label_role_indexes,
+            'suggest_index': self.suggest_index,
+            'fuzzy_index': self.fuzzy_index,
+            'facet_index': self.facet_index,
+            'similarity_index': self.similarity_index,
+            'relationship_index': self.relationship_index,
+            'reference_index': self.reference_index,
+        }
+    
+    def _restore_state(self, state: Dict[str, Any]):
+        """Restore derived state from a snapshot."""
+        self.concepts = state['concepts']
+        self.search_index = state['search_index']
+        self.label_role_indexes = state['label_role_indexes']
+        self.suggest_index = state['suggest_index']
+        self.fuzzy_index = state['fuzzy_index']
+        self.facet_index = state['facet_index']
+        self.similarity_index = state['similarity_index']
+        self.relationship_index = state['relationship_index']
+        self.reference_index = state['reference_index']
+        self._build_concept_store()
+    
+    def _load_from_dts(self):
+        """Load the US-GAAP taxonomy DTS using Arelle."""
+        # Arelle is imported lazily so snapshot-backed starts never pay for it
+        from arelle import Cntlr
         
         try:
             logger.info("Loading US-GAAP taxonomy...")
@@ -27,19 +226,52 @@ class TaxonomyLoader:
             # Initialize Arelle controller
             self.controller = Cntlr.Cntlr()
             
+            # Resolve fasb.org / xbrl.org / sec.gov URLs to the bundled packages, never the network
+            remappings = collect_remappings([self.taxonomy_dir, *TAXONOMY_PACKAGE_DIRS], BASE_SCHEMAS_DIR)
+            unresolved = configure_offline(self.controller, remappings, work_offline=ARELLE_WORK_OFFLINE)
+            
             # Load the taxonomy
-            self.model_xbrl = self.controller.modelManager.load(str(US_GAAP_ENTRY_POINT))
+            self._set_phase('loading_dts')
+            with timed_document_loads() as timings:
+                self._document_timings = timings
+                self.model_xbrl = self.controller.modelManager.load(str(self.entry_point))
+            self._document_timings = None
+            log_load_timings(timings)
             
             if self.model_xbrl is None:
                 raise Exception("Failed to load taxonomy")
+            # Arelle drops unresolvable imports with their concepts; never index (or snapshot) a partial DTS
+            if unresolved:
+                missing = sorted(set(unresolved))
+                raise FileNotFoundError(
+                    f"{len(missing)} taxonomy files have no local copy (e.g. {', '.join(missing[:3])}); "
+                    f"mirror them under {BASE_SCHEMAS_DIR} as <host>/<path> or set ARELLE_WORK_OFFLINE = False")
             
             # Extract concepts and build search index
+            self._set_phase('extracting')
             self._extract_concepts()
-            self._build_label_index()
+            self._build_indexes()
+            
+            self.is_loaded = True
+            logger.info(f"Loaded {len(self.concepts)} concepts")
+            logger.info(f"Built search index with {self.search_index.term_count()} terms")
+            
+        except Exception as e:
+            logger.error(f"Failed to load taxonomy: {e}")
+            raise
+    
+    def _load_from_files(self):
+        """Load concepts by parsing the taxonomy schemas and label linkbases directly."""
+        try:
+            logger.info("Extracting US-GAAP taxonomy with lxml...")
+            
+            self._set_phase('extracting')
+            self.concepts = extract_concepts(self.taxonomy_dir, cache=self._parse_cache)
+            self._build_indexes()
             
             self.is_loaded = True
             logger.info(f"Loaded {len(self.concepts)} concepts")
-            logger.info(f"Built index with {len(self.concept_labels)} labels")
+            logger.info(f"Built search index with {self.search_index.term_count()} terms")
             
         except Exception as e:
             logger.error(f"Failed to load taxonomy: {e}")
@@ -52,19 +284,17 @@ class TaxonomyLoader:
         if not self.model_xbrl:
             return
         
+        deprecated = self._deprecated_concepts()
+        
         # Get all concepts from the DTS (Discoverable Taxonomy Set)
         for concept in self.model_xbrl.qnameConcepts.values():
             if concept is not None:
                 try:
                     # Safely get the label
                     label = concept.name  # Default to name
-                    if hasattr(concept, 'genLabel'):
-                        try:
-                            gen_label = concept.genLabel()
-                            if isinstance(gen_label, str) and gen_label.strip():
-                                label = gen_label
-                        except:
-                            pass
+                    standard_label = self._get_standard_label(concept)
+                    if standard_label and standard_label.strip():
+                        label = standard_label
                     
                     concept_info = {
                         'name': concept.name,
@@ -74,9 +304,10 @@ class TaxonomyLoader:
                         'data_type': self._get_data_type(concept),
                         'period_type': getattr(concept, 'periodType', None),
                         'balance_type': getattr(concept, 'balance', None),
-                        'is_deprecated': self._is_deprecated(concept),
+                        'is_deprecated': concept.qname in deprecated or self._has_deprecated_label(concept),
                         'is_abstract': getattr(concept, 'isAbstract', False),
-                        'substitution_group': self._get_substitution_group(concept)
+                        'substitution_group': self._get_substitution_group(concept),
+                        'labels': self._get_role_labels(concept)
                     }
                     
                     self.concepts[concept.name] = concept_info
@@ -84,36 +315,74 @@ class TaxonomyLoader:
                     logger.warning(f"Error processing concept {getattr(concept, 'name', 'unknown')}: {e}")
                     continue
     
-    def _build_label_index(self):
-        """Build an index for faster label-based searching."""
-        self.concept_labels = {}
+    def _build_indexes(self):
+        """Build every derived index from the extracted concepts, reporting each step."""
+        steps = [
+            ('search', self._build_search_index),
+            ('relationships', self._build_relationship_index),
+            ('references', self._build_reference_index),
+        ]
+        for completed, (step, build) in enumerate(steps):
+            self._set_phase('indexing', step=step, steps_completed=completed, steps_total=len(steps))
+            build()
+    
+    def _build_concept_store(self):
+        """Convert extracted concepts to the columnar store with dense integer IDs."""
+        if not isinstance(self.concepts, ConceptStore):
+            self.concepts = ConceptStore.from_dicts(self.concepts, documentation_dir=self.documentation_dir)
+        self.concept_names = self.concepts.names
+    
+    def _build_search_index(self):
+        """Build the inverted token index plus the suggestion, typo-correction, facet and similarity indexes."""
+        self._build_concept_store()
+        store = self.concepts
+        role_labels = list(store.role_labels.values())
+        self.search_index = SearchIndex.build(
+            {
+                'name': store.names[concept_id],
+                'label': store.labels[concept_id],
+                'role_labels': " ".join(labels[concept_id] for labels in role_labels if concept_id in labels),
+                'documentation': store.documentation.get(concept_id)
+            }
+            for concept_id in range(len(store))
+        )
+        # One small index per label role, for searches that target a role
+        self.label_role_indexes = {
+            role: SearchIndex.build({'label': labels.get(concept_id)} for concept_id in range(len(store)))
+            for role, labels in store.role_labels.items()
+        }
+        self.suggest_index = SuggestIndex.build(self.concepts.values())
+        self.fuzzy_index = FuzzyIndex.build(self.search_index.terms, self.search_index.doc_freqs)
+        self.facet_index = FacetIndex.build(self.concepts.values())
+        self.similarity_index = SimilarityIndex.build(self.concepts.values(), self.search_index.term_ids)
+    
+    def _build_relationship_index(self):
+        """
+        Compile calculation, presentation and definition arcs into adjacency arrays.
         
-        for concept_name, concept_info in self.concepts.items():
-            # Index by name (lowercase for case-insensitive search)
-            name_key = concept_name.lower()
-            if name_key not in self.concept_labels:
-                self.concept_labels[name_key] = []
-            self.concept_labels[name_key].append(concept_name)
-            
-            # Index by label if available
-            label = concept_info.get('label', '')
-            if label and isinstance(label, str) and label != concept_name:
-                label_key = label.lower()
-                if label_key not in self.concept_labels:
-                    self.concept_labels[label_key] = []
-                self.concept_labels[label_key].append(concept_name)
+        Arcs are read straight from the linkbases for both extractors, so
+        lookups never need the Arelle model.
+        """
+        arcs = extract_relationships(self.taxonomy_dir, cache=self._parse_cache)
+        self.relationship_index = RelationshipIndex.build(arcs, self.concepts.ids)
+        logger.info(f"Indexed {sum(len(g) for g in self.relationship_index.graphs.values())} relationships "
+                    f"across {len(self.relationship_index.graphs)} arcroles")
     
-    def _get_concept_documentation(self, concept) -> Optional[str]:
-        """Extract documentation/definition for a concept."""
+    def _build_reference_index(self):
+        """Index the codification, change note and implementation note references."""
+        references = extract_references(self.taxonomy_dir, cache=self._parse_cache)
+        self.reference_index = ReferenceIndex.build(references, self.concepts.ids)
+        logger.info(f"Indexed {len(self.reference_index.references)} distinct references "
+                    f"and {len(self.reference_index.paths)} codification paragraphs")
+    
+    def _get_standard_label(self, concept) -> Optional[str]:
+        """Get the standard label of a concept, falling back to its generic label."""
         try:
-            # Try to get documentation from various sources
-            if hasattr(concept, 'documentation') and concept.documentation:
-                doc = concept.documentation
-                if callable(doc):
-                    return None  # Skip callable objects
-                return str(doc)
+            label = concept.label(STANDARD_LABEL_ROLE, fallbackToQname=False)
+            if isinstance(label, str) and label.strip():
+                return label
             
-            if hasattr(concept, 'genLabel') and concept.genLabel:
+            if hasattr(concept, 'genLabel'):
                 label = concept.genLabel()
                 if isinstance(label, str):
                     return label
@@ -122,6 +391,30 @@ class TaxonomyLoader:
         except Exception:
             return None
     
+    def _get_role_labels(self, concept) -> Dict[str, str]:
+        """Get the alternate-role labels (terse, total, negated, ...) of a concept."""
+        labels = {}
+        for role, uri in LABEL_ROLES.items():
+            try:
+                label = concept.label(uri, fallbackToQname=False)
+            except Exception:
+                continue
+            if isinstance(label, str) and label.strip():
+                labels[role] = label
+        return labels
+    
+    def _get_concept_documentation(self, concept) -> Optional[str]:
+        """Extract documentation/definition for a concept."""
+        try:
+            # Documentation lives in documentation-role labels
+            doc = concept.label(DOCUMENTATION_LABEL_ROLE, fallbackToQname=False)
+            if isinstance(doc, str) and doc:
+                return doc
+            
+            return self._get_standard_label(concept)
+        except Exception:
+            return None
+    
     def _get_data_type(self, concept) -> Optional[str]:
         """Get the data type of a concept."""
         try:
@@ -131,18 +424,26 @@ class TaxonomyLoader:
         except:
             return None
     
-    def _is_deprecated(self, concept) -> bool:
-        """Check if a concept is deprecated."""
-        try:
-            # Check for deprecation indicators
-            if hasattr(concept, 'isDeprecated'):
-                return concept.isDeprecated
-            
-            # Check labels for deprecation indicators
-            name = concept.name.lower()
-            return 'deprecated' in name or 'obsolete' in name
-        except:
-            return False
+    def _deprecated_concepts(self) -> Set[Any]:
+        """QNames of the concepts the DTS's deprecation networks mark as deprecated."""
+        deprecated = set()
+        networks = {(arcrole, elr) for arcrole, elr, link, arc in self.model_xbrl.baseSets
+                    if elr is not None and link is not None and is_deprecation_arc(arcrole, elr)}
+        for arcrole, elr in networks:
+            for relationship in self.model_xbrl.relationshipSet(arcrole, elr).modelRelationships:
+                if relationship.toModelObject is not None:
+                    deprecated.add(relationship.toModelObject.qname)
+        return deprecated
+    
+    def _has_deprecated_label(self, concept) -> bool:
+        """Check for a deprecated or deprecatedDate label."""
+        for role in DEPRECATED_LABEL_ROLES:
+            try:
+                if concept.label(role, fallbackToQname=False):
+                    return True
+            except Exception:
+                continue
+        return False
     
     def _get_substitution_group(self, concept) -> Optional[str]:
         """Get the substitution group of a concept."""
@@ -153,73 +454,213 @@ class TaxonomyLoader:
         except:
             return None
     
-    def search_concepts(self, query: str, limit: int = 10, include_deprecated: bool = False) -> List[Dict[str, Any]]:
+    def correct_query(self, query: str,
+                      correction_cache: Optional[Dict[str, Optional[str]]] = None) -> Tuple[str, Dict[str, str]]:
+        """
+        Replace misspelled query terms with their closest indexed terms.
+        
+        Only tokens that match no indexed term, even by prefix, are corrected.
+        
+        Args:
+            query: Search term
+            correction_cache: Optional dict of token corrections already
+                looked up, shared across the queries of a batch
+            
+        Returns:
+            Tuple of (corrected query, mapping of misspelled token to correction)
+        """
+        corrections = {}
+        tokens = []
+        for token in tokenize(query):
+            if correction_cache is not None and token in correction_cache:
+                correction = correction_cache[token]
+            else:
+                correction = None
+                if not self.search_index.expand_token(token):
+                    match = self.fuzzy_index.correct(token)
+                    correction = match[0] if match is not None else None
+                if correction_cache is not None:
+                    correction_cache[token] = correction
+            if correction is not None:
+                corrections[token] = correction
+                token = correction
+            tokens.append(token)
+        
+        return " ".join(tokens), corrections
+    
+    def search_concepts(self, query: str, limit: int = 10, include_deprecated: bool = False,
+                        fuzzy: bool = False, filters: Optional[Dict[str, Any]] = None,
+                        after: Optional[Tuple[float, int]] = None, label_role: Optional[str] = None,
+                        include_documentation: bool = False) -> List[Dict[str, Any]]:
         """
-        Search for concepts by name or label.
+        Search for concepts by name, label or documentation.
+        
+        Every matching concept is ranked with BM25 before the top results
+        are selected.
         
         Args:
             query: Search term
             limit: Maximum number of results to return
             include_deprecated: Whether to include deprecated concepts
+            fuzzy: Whether to correct misspelled terms before searching
+            filters: Facet filters (see facet_index.FACETS), applied before
+                text matching
+            after: (score, id) of the last result of the previous page, to
+                continue the same ranking from there
+            label_role: Optional label role short name (see
+                taxonomy_extractor.LABEL_ROLES); only labels of that role are
+                matched and returned as the result labels
+            include_documentation: Whether to read each result's
+                documentation from the documentation blob
+            
+        Returns:
+            List of matching concepts, each with its concept ID and score;
+            with fuzzy search each result carries the corrections applied
+            
+        Raises:
+            ValueError: If label_role is not a known label role
+        """
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        return self._search(query, limit, include_deprecated, fuzzy, filters, after, label_role, include_documentation)
+    
+    def search_concepts_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run many searches in one call.
+        
+        Token resolution, typo corrections and facet masks are computed once
+        per distinct token or filter set and shared across the batch.
+        
+        Args:
+            queries: Keyword arguments for search_concepts, one dict per query
             
         Returns:
-            List of matching concepts
+            One result list per query, in request order
         """
         if not self.is_loaded:
             raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
         
+        token_caches = {}
+        correction_cache = {}
+        mask_cache = {}
+        seen = {}
+        results = []
+        for query in queries:
+            # Identical queries in one batch are answered once
+            key = tuple(sorted(
+                (arg, _freeze_filters(value) if arg == 'filters' else value) for arg, value in query.items()
+            ))
+            if key not in seen:
+                seen[key] = self._search(token_caches=token_caches, correction_cache=correction_cache,
+                                         mask_cache=mask_cache, **query)
+            results.append(seen[key])
+        return results
+    
+    def _search(self, query: str, limit: int = 10, include_deprecated: bool = False, fuzzy: bool = False,
+                filters: Optional[Dict[str, Any]] = None, after: Optional[Tuple[float, int]] = None,
+                label_role: Optional[str] = None, include_documentation: bool = False,
+                token_caches: Optional[Dict] = None, correction_cache: Optional[Dict] = None,
+                mask_cache: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Run one search, optionally sharing lookups with other queries of a batch."""
+        if label_role is not None and label_role not in LABEL_ROLES:
+            raise ValueError(f"Unknown label role: {label_role}")
         if not query or not query.strip():
             return []
         
-        query_lower = query.strip().lower()
+        corrections = {}
+        if fuzzy:
+            query, corrections = self.correct_query(query, correction_cache)
+        
+        index = self.search_index if label_role is None else self.label_role_indexes.get(label_role)
+        if index is None:
+            return []
+        # Resolved tokens are only valid for the index they came from
+        token_cache = token_caches.setdefault(label_role, {}) if token_caches is not None else None
+        scores = index.score(query, token_cache)
+        if scores is None:
+            return []
+        
+        mask = None
+        if filters or not include_deprecated:
+            mask_key = None
+            if mask_cache is not None:
+                mask_key = (include_deprecated, _freeze_filters(filters))
+                mask = mask_cache.get(mask_key)
+            if mask is None:
+                mask = self.facet_index.to_mask(self.facet_index.filter_bits(filters, include_deprecated))
+                if mask_key is not None:
+                    mask_cache[mask_key] = mask
+        
+        # Read the columns directly; this loop runs once per result of every query
+        store = self.concepts
+        role_labels = store.role_labels.get(label_role, {})
         results = []
-        seen_concepts = set()
+        for concept_id, score in index.top_k(scores, limit, mask=mask, after=after):
+            name = store.names[concept_id]
+            results.append({
+                'id': concept_id,
+                'name': name,
+                'label': role_labels.get(concept_id) or store.labels[concept_id] or name,
+                'documentation': store.documentation.get(concept_id) if include_documentation else None,
+                'data_type': store.value(concept_id, 'data_type'),
+                'period_type': store.value(concept_id, 'period_type'),
+                'balance_type': store.value(concept_id, 'balance_type'),
+                'is_deprecated': store.value(concept_id, 'is_deprecated'),
+                'score': score,
+                'corrections': corrections or None
+            })
         
-        # Search through all concepts
-        for concept_name, concept_info in self.concepts.items():
-            if len(results) >= limit:
-                break
-            
-            if concept_name in seen_concepts:
-                continue
-            
-            # Skip deprecated concepts if not requested
-            if not include_deprecated and concept_info.get('is_deprecated', False):
-                continue
-            
-            # Check if query matches concept name or label
-            name_match = query_lower in concept_name.lower()
-            label_match = query_lower in (concept_info.get('label', '') or '').lower()
+        return results
+    
+    def iter_concepts(self, include_deprecated: bool = True,
+                      filters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over concepts in ID order, one info dict at a time.
+        
+        Args:
+            include_deprecated: Whether to include deprecated concepts
+            filters: Facet filters (see facet_index.FACETS)
             
-            if name_match or label_match:
-                results.append({
-                    'name': concept_info['name'],
-                    'label': concept_info.get('label') or concept_info['name'],
-                    'documentation': concept_info.get('documentation'),
-                    'data_type': concept_info.get('data_type'),
-                    'period_type': concept_info.get('period_type'),
-                    'balance_type': concept_info.get('balance_type'),
-                    'is_deprecated': concept_info.get('is_deprecated', False)
-                })
-                seen_concepts.add(concept_name)
-        
-        # Sort results by relevance (exact matches first, then partial matches)
-        def sort_key(concept):
-            name = concept['name'].lower()
-            label = (concept['label'] or '').lower()
+        Returns:
+            Iterator of concept info dicts; only the matching IDs are held
+            in memory
+        """
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        # Bind the current store so a concurrent reload cannot mix taxonomies
+        store = self.concepts
+        concept_ids = np.flatnonzero(self.facet_index.to_mask(self.facet_index.filter_bits(filters, include_deprecated)))
+        return (store.view(int(concept_id)).to_dict() for concept_id in concept_ids)
+    
+    def suggest_concepts(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Suggest concepts for a partially typed query.
+        
+        Args:
+            text: Text typed so far
+            limit: Maximum number of suggestions to return
             
-            # Exact matches get highest priority
-            if name == query_lower or label == query_lower:
-                return 0
-            # Starts with query gets second priority
-            elif name.startswith(query_lower) or label.startswith(query_lower):
-                return 1
-            # Contains query gets lowest priority
-            else:
-                return 2
+        Returns:
+            List of suggested concepts, most popular first
+        """
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        if not text or not text.strip():
+            return []
+        
+        suggestions = []
+        for concept_id in self.suggest_index.suggest(text, limit):
+            concept = self.concepts.view(concept_id)
+            suggestions.append({
+                'name': concept.name,
+                'label': concept.label or concept.name,
+                'is_abstract': concept.is_abstract
+            })
         
-        results.sort(key=sort_key)
-        return results[:limit]
+        return suggestions
     
     def get_concept_details(self, concept_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -234,21 +675,195 @@ class TaxonomyLoader:
         if not self.is_loaded:
             raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
         
-        concept_info = self.concepts.get(concept_name)
-        if not concept_info:
+        concept = self.concepts.get(concept_name)
+        if concept is None:
+            return None
+        
+        details = concept.to_dict()
+        details['labels'] = self.concepts.labels_of(concept.id)
+        details['relationship_counts'] = self.relationship_index.counts(concept.id)
+        details['references'] = self.reference_index.references_for(concept.id)
+        return details
+    
+    def search_references(self, topic: str, subtopic: Optional[str] = None, section: Optional[str] = None,
+                          paragraph: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """
+        Find the concepts that cite a topic, subtopic, section or paragraph of the codification.
+        
+        Args:
+            topic: Codification topic, e.g. '842'
+            subtopic: Optional subtopic, e.g. '20'
+            section: Optional section, e.g. '50'
+            paragraph: Optional paragraph, e.g. '1'
+            limit: Maximum number of concepts to return
+            
+        Returns:
+            Dictionary with the total match count and the matching concepts
+            with their citations, in concept ID order
+            
+        Raises:
+            ValueError: If a level is given without the levels above it
+        """
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        index = self.reference_index
+        matches = index.lookup(topic, subtopic, section, paragraph)
+        base = len(self.concepts)
+        concepts = []
+        for node, citations in list(matches.items())[:limit]:
+            if node < base:
+                concept = self.concepts.view(node)
+                name, label, is_deprecated = concept.name, concept.label or concept.name, concept.is_deprecated
+            else:
+                name = index.node_name(node, self.concepts.names)
+                # Outside the concept store, so no deprecation is recorded for it
+                label, is_deprecated = name, False
+            concepts.append({
+                'name': name,
+                'label': label,
+                'is_deprecated': is_deprecated,
+                'citations': citations
+            })
+        
+        return {
+            'topic': topic,
+            'subtopic': subtopic,
+            'section': section,
+            'paragraph': paragraph,
+            'total': len(matches),
+            'concepts': concepts
+        }
+    
+    def get_concept_relationships(self, concept_name: str, arcroles: Optional[List[str]] = None,
+                                  direction: str = 'descendants', depth: int = 1,
+                                  elr: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Traverse the calculation, presentation and definition relationships of a concept.
+        
+        Args:
+            concept_name: Name of the concept to start from
+            arcroles: Arcrole URIs or short names such as 'summation-item' or
+                'parent-child'; all arcroles if empty
+            direction: 'descendants', 'ancestors' or 'both'
+            depth: Number of levels to follow
+            elr: Optional extended link role to stay within
+            
+        Returns:
+            Dictionary with the traversed relationships, or None if the
+            concept has no relationships and is not in the taxonomy
+        """
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        index = self.relationship_index
+        node = index.node_id(concept_name, self.concepts.ids)
+        if node is None:
+            return None
+        
+        relationships = []
+        edges = index.traverse(node, arcroles, direction, depth, elr)
+        for arcrole, source, target, elr_code, order, weight, level in edges:
+            relationships.append({
+                'from': index.node_name(source, self.concepts.names),
+                'to': index.node_name(target, self.concepts.names),
+                'arcrole': arcrole_name(arcrole),
+                'elr': index.elrs[elr_code],
+                'order': order,
+                'weight': weight,
+                'depth': level
+            })
+        
+        return {
+            'concept': concept_name,
+            'direction': direction,
+            'depth': depth,
+            'relationships': relationships
+        }
+    
+    def find_similar_concepts(self, concept_name: str, k: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find the concepts whose labels and documentation are most similar.
+        
+        Args:
+            concept_name: Name of the concept to compare against
+            k: Number of similar concepts to return
+            
+        Returns:
+            List of similar concepts with cosine similarity scores, or None
+            if the concept does not exist
+        """
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        concept_id = self.concepts.ids.get(concept_name)
+        if concept_id is None:
             return None
         
+        return self._similar_results(self.similarity_index.similar(concept_id, k))
+    
+    def find_similar_concepts_batch(self, concept_names: List[str], k: int = 10) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Find similar concepts for many concepts in one vectorized pass.
+        
+        Args:
+            concept_names: Names of the concepts to compare
+            k: Number of similar concepts per concept
+            
+        Returns:
+            Mapping of each requested name to its similar concepts, or None
+            for unknown names
+        """
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        known = [name for name in dict.fromkeys(concept_names) if name in self.concepts.ids]
+        neighbours = self.similarity_index.similar_batch([self.concepts.ids[name] for name in known], k)
+        results: Dict[str, Optional[List[Dict[str, Any]]]] = {name: None for name in concept_names}
+        for name, matches in zip(known, neighbours):
+            results[name] = self._similar_results(matches)
+        return results
+    
+    def _similar_results(self, matches: List[Tuple[int, float]]) -> List[Dict[str, Any]]:
+        """Format (concept ID, similarity) pairs for the API."""
+        results = []
+        for concept_id, score in matches:
+            concept = self.concepts.view(concept_id)
+            results.append({
+                'name': concept.name,
+                'label': concept.label or concept.name,
+                'is_deprecated': concept.is_deprecated,
+                'score': score
+            })
+        return results
+    
+    def get_facet_counts(self, query: Optional[str] = None, include_deprecated: bool = True,
+                         filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Count concepts per facet value for a query.
+        
+        Args:
+            query: Optional search term; only matching concepts are counted
+            include_deprecated: Whether to count deprecated concepts
+            filters: Facet filters applied before counting
+            
+        Returns:
+            Dictionary with the number of matching concepts and per-facet counts
+        """
+        if not self.is_loaded:
+            raise Exception("Taxonomy not loaded. Call load_taxonomy() first.")
+        
+        bits = self.facet_index.filter_bits(filters, include_deprecated)
+        if query and query.strip():
+            scores = self.search_index.score(query)
+            if scores is None:
+                bits = np.zeros_like(bits)
+            else:
+                bits &= self.facet_index.from_mask(scores > 0)
+        
         return {
-            'name': concept_info['name'],
-            'qname': concept_info.get('qname'),
-            'label': concept_info.get('label'),
-            'documentation': concept_info.get('documentation'),
-            'data_type': concept_info.get('data_type'),
-            'period_type': concept_info.get('period_type'),
-            'balance_type': concept_info.get('balance_type'),
-            'is_deprecated': concept_info.get('is_deprecated', False),
-            'is_abstract': concept_info.get('is_abstract', False),
-            'substitution_group': concept_info.get('substitution_group')
+            'total': self.facet_index.count(bits),
+            'facets': self.facet_index.counts(bits)
         }
     
     def get_taxonomy_statistics(self) -> Dict[str, Any]:
@@ -264,21 +879,13 @@ class TaxonomyLoader:
                 'error': 'Taxonomy not loaded'
             }
         
+        # Every count comes from the facet bitmaps rather than passes over the concepts
         total_concepts = len(self.concepts)
-        deprecated_count = sum(1 for c in self.concepts.values() if c.get('is_deprecated', False))
-        abstract_count = sum(1 for c in self.concepts.values() if c.get('is_abstract', False))
-        
-        # Count by data type
-        data_types = {}
-        for concept in self.concepts.values():
-            data_type = concept.get('data_type', 'Unknown')
-            data_types[data_type] = data_types.get(data_type, 0) + 1
-        
-        # Count by period type
-        period_types = {}
-        for concept in self.concepts.values():
-            period_type = concept.get('period_type', 'Unknown')
-            period_types[period_type] = period_types.get(period_type, 0) + 1
+        counts = self.facet_index.counts(facets=('is_deprecated', 'is_abstract', 'data_type', 'period_type'))
+        deprecated_count = counts['is_deprecated'].get(True, 0)
+        abstract_count = counts['is_abstract'].get(True, 0)
+        data_types = counts['data_type']
+        period_types = counts['period_type']
         
         return {
             'loaded': True,
@@ -288,7 +895,35 @@ class TaxonomyLoader:
             'active_concepts': total_concepts - deprecated_count,
             'data_types': data_types,
             'period_types': period_types,
-            'taxonomy_file': str(US_GAAP_ENTRY_POINT)
+            'taxonomy_file': str(self.entry_point),
+            'taxonomy_hash': self.taxonomy_hash,
+            'load_source': self.load_source,
+            'memory': self.get_memory_report()
+        }
+    
+    def get_memory_report(self) -> Dict[str, Any]:
+        """
+        Report approximate memory use of the concept columns and indexes.
+        
+        Returns:
+            Dictionary of bytes per column and per index, with totals
+        """
+        columns = self.concepts.memory_report()
+        indexes = {
+            'search': self.search_index.memory_bytes(),
+            'label_roles': sum(index.memory_bytes() for index in self.label_role_indexes.values()),
+            'suggest': self.suggest_index.memory_bytes(),
+            'fuzzy': self.fuzzy_index.memory_bytes(),
+            'facets': self.facet_index.memory_bytes(),
+            'similarity': self.similarity_index.memory_bytes(),
+            'relationships': self.relationship_index.memory_bytes(),
+            'references': self.reference_index.memory_bytes(),
+        }
+        return {
+            'columns': columns,
+            'columns_total': sum(columns.values()),
+            'indexes': indexes,
+            'indexes_total': sum(indexes.values())
         }
 
 # Global instance
@@ -0,0 +1,219 @@
+# backend/src/taxonomy_package.py
+"""
+Offline resolution of taxonomy URLs for Arelle.
+
+Entry points import their schemas and linkbases by absolute URL
+(https://xbrl.fasb.org/..., http://www.xbrl.org/..., https://xbrl.sec.gov/...).
+Without remapping Arelle resolves those through its web cache or the
+network, which is slow and fails on air-gapped hosts. This module reads the
+XML catalog of unpacked taxonomy packages (META-INF/catalog.xml, per the
+Taxonomy Packages 1.0 spec), adds a host-per-directory mirror for other
+bundled schemas, installs the remappings on an Arelle controller and turns
+on Arelle's offline mode. It also records how long each document takes to
+load.
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+TAXONOMY_PACKAGE_NS = "http://xbrl.org/2016/taxonomy-package"
+CATALOG_FILE = Path("META-INF") / "catalog.xml"
+TAXONOMY_PACKAGE_FILE = Path("META-INF") / "taxonomyPackage.xml"
+
+
+def _local_prefix(path: Path, keep_separator: bool) -> str:
+    """Local path prefix as used in remapped URLs."""
+    text = str(path.resolve())
+    return text + "/" if keep_separator and not text.endswith("/") else text
+
+
+def parse_catalog(package_dir: Path) -> List[Tuple[str, str]]:
+    """
+    Read the URL remappings of an unpacked taxonomy package.
+
+    Args:
+        package_dir: Package root containing META-INF/catalog.xml
+
+    Returns:
+        List of (URL prefix, local path prefix) pairs; empty if the package
+        has no catalog
+    """
+    catalog_path = Path(package_dir) / CATALOG_FILE
+    if not catalog_path.is_file():
+        return []
+
+    base = catalog_path.parent
+    remappings = []
+    for element in etree.parse(str(catalog_path)).getroot().iter():
+        tag = etree.QName(element).localname if isinstance(element.tag, str) else None
+        if tag == "rewriteURI":
+            url_prefix, target = element.get("uriStartString"), element.get("rewritePrefix")
+        elif tag == "rewriteSystem":
+            url_prefix, target = element.get("systemIdStartString"), element.get("rewritePrefix")
+        elif tag == "uri":
+            url_prefix, target = element.get("name"), element.get("uri")
+        else:
+            continue
+        if not url_prefix or target is None:
+            continue
+        # Targets are relative to the catalog file; keep a trailing slash on
+        # directory rewrites so prefix substitution yields valid paths
+        remappings.append((url_prefix, _local_prefix(base / target, keep_separator=url_prefix.endswith("/"))))
+    return remappings
+
+
+def package_identifier(package_dir: Path) -> Optional[str]:
+    """Identifier declared in a package's META-INF/taxonomyPackage.xml, if any."""
+    path = Path(package_dir) / TAXONOMY_PACKAGE_FILE
+    if not path.is_file():
+        return None
+    identifier = etree.parse(str(path)).getroot().find(f"{{{TAXONOMY_PACKAGE_NS}}}identifier")
+    return identifier.text.strip() if identifier is not None and identifier.text else None
+
+
+def mirror_remappings(mirror_dir: Optional[Path]) -> List[Tuple[str, str]]:
+    """
+    Remap URLs onto a directory laid out as <host>/<path>.
+
+    For example mirror_dir/xbrl.sec.gov/dei/2025/dei-2025.xsd serves
+    https://xbrl.sec.gov/dei/2025/dei-2025.xsd (and its http:// form).
+
+    Args:
+        mirror_dir: Mirror root; None or a missing directory yields no remappings
+
+    Returns:
+        List of (URL prefix, local path prefix) pairs
+    """
+    if mirror_dir is None or not Path(mirror_dir).is_dir():
+        return []
+    remappings = []
+    for host_dir in sorted(p for p in Path(mirror_dir).iterdir() if p.is_dir()):
+        for scheme in ("https", "http"):
+            remappings.append((f"{scheme}://{host_dir.name}/", _local_prefix(host_dir, keep_separator=True)))
+    return remappings
+
+
+def collect_remappings(package_dirs: Iterable[Path], mirror_dir: Optional[Path] = None) -> List[Tuple[str, str]]:
+    """
+    Gather the remappings of several packages plus a base schema mirror.
+
+    Args:
+        package_dirs: Unpacked taxonomy package roots
+        mirror_dir: Optional <host>/<path> mirror of other schemas
+
+    Returns:
+        Remappings ordered longest URL prefix first, so the most specific
+        mapping wins under first-match lookup
+    """
+    remappings: Dict[str, str] = {}
+    for package_dir in package_dirs:
+        package_remappings = parse_catalog(package_dir)
+        logger.info(f"Taxonomy package {package_identifier(package_dir) or package_dir}: "
+                    f"{len(package_remappings)} catalog remappings")
+        for url_prefix, target in package_remappings:
+            remappings.setdefault(url_prefix, target)
+    for url_prefix, target in mirror_remappings(mirror_dir):
+        remappings.setdefault(url_prefix, target)
+    return sorted(remappings.items(), key=lambda item: -len(item[0]))
+
+
+def configure_offline(controller, remappings: List[Tuple[str, str]], work_offline: bool = True) -> List[str]:
+    """
+    Point an Arelle controller at local copies of taxonomy files.
+
+    Offline, Arelle only logs an IOerror for a URL that is neither remapped
+    nor cached and loads the rest of the DTS without it, so such URLs are
+    collected for the caller to fail the load on.
+
+    Args:
+        controller: arelle.Cntlr.Cntlr instance
+        remappings: (URL prefix, local path prefix) pairs from collect_remappings
+        work_offline: Whether to forbid network access; unmapped URLs then
+            resolve only from Arelle's cache and bundled resources
+
+    Returns:
+        List filled with the URLs that had no local copy during later loads
+        (always empty when work_offline is False)
+    """
+    disclosure_system = controller.modelManager.disclosureSystem
+    # Remappings are consulted in order, ahead of any configured by Arelle itself
+    disclosure_system.mappedPaths = list(remappings) + [
+        mapping for mapping in disclosure_system.mappedPaths if mapping[0] not in dict(remappings)
+    ]
+    web_cache = controller.webCache
+    web_cache.workOffline = work_offline
+
+    unresolved: List[str] = []
+    if work_offline:
+        getfilename = web_cache.getfilename
+
+        def resolve(url, *args, **kwargs):
+            filepath = getfilename(url, *args, **kwargs)
+            # Remapped URLs arrive as local paths; only unmapped http(s) URLs reach the web cache
+            if (url and url.startswith(("http://", "https://")) and not kwargs.get("filenameOnly")
+                    and (filepath is None or not os.path.exists(filepath))):
+                unresolved.append(url)
+            return filepath
+
+        web_cache.getfilename = resolve
+    return unresolved
+
+
+@contextmanager
+def timed_document_loads() -> Iterator[Dict[str, float]]:
+    """
+    Record how long Arelle spends loading each document.
+
+    ModelDocument.load recurses into imports and linkbases, so the time
+    recorded for a document excludes the documents it pulled in.
+
+    Yields:
+        Dict filled with URL -> seconds once each load returns
+    """
+    from arelle import ModelDocument
+
+    timings: Dict[str, float] = {}
+    stack: List[float] = []
+    original_load = ModelDocument.load
+
+    def load(model_xbrl, uri, *args, **kwargs):
+        started = time.perf_counter()
+        stack.append(0.0)
+        document = None
+        try:
+            document = original_load(model_xbrl, uri, *args, **kwargs)
+            return document
+        finally:
+            elapsed = time.perf_counter() - started
+            children = stack.pop()
+            key = getattr(document, "uri", None) or getattr(uri, "url", uri)
+            timings[key] = timings.get(key, 0.0) + elapsed - children
+            if stack:
+                stack[-1] += elapsed
+
+    # ModelDocument resolves load() through its module globals for nested loads
+    ModelDocument.load = load
+    try:
+        yield timings
+    finally:
+        ModelDocument.load = original_load
+
+
+def log_load_timings(timings: Dict[str, float], top: int = 10):
+    """Log the total and the slowest document loads; every file at DEBUG level."""
+    if not timings:
+        return
+    total = sum(timings.values())
+    logger.info(f"Loaded {len(timings)} taxonomy documents in {total:.2f}s")
+    ranked = sorted(timings.items(), key=lambda item: -item[1])
+    for url, seconds in ranked[:top]:
+        logger.info(f"  {seconds * 1000:8.1f} ms  {url}")
+    for url, seconds in ranked[top:]:
+        logger.debug(f"  {seconds * 1000:8.1f} ms  {url}")
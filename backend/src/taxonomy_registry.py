@@ -0,0 +1,326 @@
+# backend/src/taxonomy_registry.py
+"""
+Registry of US-GAAP taxonomy versions served side by side.
+
+Each version (e.g. "2024", "2025") has its own TaxonomyLoader, loaded in
+the background on first use and replaced by a hot reload without
+interrupting requests that still hold the previous generation. Loads run
+one at a time, so several versions never hold their peak load memory at
+once and Arelle is never driven from two threads. Strings shared across
+versions are interned, so each further version mostly costs its index
+arrays. Concept crosswalks between adjacent loaded versions are computed
+as soon as both sides are ready.
+"""
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import (DEFAULT_TAXONOMY_VERSION, TAXONOMIES_DIR, TAXONOMY_EXTRACTOR, TAXONOMY_VERSIONS,
+                     USE_TAXONOMY_SNAPSHOT)
+from .taxonomy_crosswalk import TaxonomyCrosswalk
+from .taxonomy_loader import TaxonomyLoader
+from .taxonomy_snapshot import compute_taxonomy_hash, taxonomy_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_VERSION_DIR_PATTERN = re.compile(r"^us-gaap-(\d{4})$")
+
+
+def discover_taxonomy_versions(taxonomies_dir: Path = TAXONOMIES_DIR) -> Dict[str, Path]:
+    """
+    Find the taxonomy versions unpacked under the taxonomies directory.
+
+    Args:
+        taxonomies_dir: Directory holding us-gaap-<version>/ directories
+
+    Returns:
+        Mapping of version to taxonomy directory, oldest first
+    """
+    if not Path(taxonomies_dir).is_dir():
+        return {}
+    versions = {}
+    for path in sorted(Path(taxonomies_dir).iterdir()):
+        match = _VERSION_DIR_PATTERN.match(path.name)
+        if match and path.is_dir():
+            versions[match.group(1)] = path
+    return versions
+
+
+def entry_point_for(version: str, taxonomy_dir: Path) -> Path:
+    """Standard all-concepts entry point of a US-GAAP release."""
+    return Path(taxonomy_dir) / "entire" / f"us-gaap-entryPoint-all-{version}.xsd"
+
+
+@dataclass
+class TaxonomySlot:
+    """Serving state of one taxonomy version."""
+    version: str
+    loader: TaxonomyLoader
+    load_task: Optional[asyncio.Task] = None
+    reload_loader: Optional[TaxonomyLoader] = None
+    reload_task: Optional[asyncio.Task] = None
+    reload_outcome: Optional[str] = None
+
+
+class TaxonomyRegistry:
+    """Loads, serves and hot-reloads several taxonomy versions."""
+
+    def __init__(self, versions: Optional[Dict[str, Path]] = None, default_version: str = DEFAULT_TAXONOMY_VERSION,
+                 extractor: str = TAXONOMY_EXTRACTOR, use_snapshot: bool = USE_TAXONOMY_SNAPSHOT,
+                 documentation_dir: Optional[Path] = None):
+        versions = versions if versions is not None else (TAXONOMY_VERSIONS or discover_taxonomy_versions())
+        if not versions:
+            raise ValueError("No taxonomy versions configured or found")
+        self.versions = {str(version): Path(path) for version, path in sorted(versions.items())}
+        self.default_version = default_version if default_version in self.versions else max(self.versions)
+        self.extractor = extractor
+        self.use_snapshot = use_snapshot
+        # Root of the per-version documentation blob directories (None for the configured default)
+        self.documentation_dir = Path(documentation_dir) if documentation_dir is not None else None
+        self.slots: Dict[str, TaxonomySlot] = {}
+        self.crosswalks: Dict[Tuple[str, str], TaxonomyCrosswalk] = {}
+        self._lock = asyncio.Lock()
+        self._build_lock = asyncio.Lock()
+
+    def resolve(self, version: Optional[str]) -> str:
+        """
+        Validate a requested version.
+
+        Args:
+            version: Version label, or None for the default version
+
+        Returns:
+            The version label to serve
+
+        Raises:
+            KeyError: If the version is not configured
+        """
+        if version is None:
+            return self.default_version
+        if version not in self.versions:
+            raise KeyError(f"Unknown taxonomy version: {version} (available: {', '.join(self.versions)})")
+        return version
+
+    def _new_loader(self, version: str) -> TaxonomyLoader:
+        taxonomy_dir = self.versions[version]
+        documentation_dir = self.documentation_dir / taxonomy_dir.name if self.documentation_dir is not None else None
+        return TaxonomyLoader(entry_point=entry_point_for(version, taxonomy_dir), taxonomy_dir=taxonomy_dir,
+                              extractor=self.extractor, documentation_dir=documentation_dir)
+
+    async def start_load(self, version: str) -> TaxonomyLoader:
+        """
+        Get a version's loader, starting its background load the first time.
+
+        Args:
+            version: Resolved version label
+
+        Returns:
+            The version's current loader, which may still be loading
+        """
+        async with self._lock:
+            slot = self.slots.get(version)
+            if slot is None:
+                slot = self.slots[version] = TaxonomySlot(version, self._new_loader(version))
+            if slot.load_task is None and not slot.loader.is_loaded:
+                slot.load_task = asyncio.create_task(self._load_in_background(slot, slot.loader))
+        return slot.loader
+
+    async def _build(self, loader: TaxonomyLoader):
+        """Run one blocking load on a worker thread, one version at a time."""
+        async with self._build_lock:
+            await asyncio.to_thread(loader.load_taxonomy, self.use_snapshot)
+
+    async def _load_in_background(self, slot: TaxonomySlot, loader: TaxonomyLoader):
+        try:
+            await self._build(loader)
+            logger.info(f"Taxonomy {slot.version} loaded successfully")
+        except Exception as e:
+            logger.error(f"Failed to load taxonomy {slot.version}: {e}")
+            return
+        await asyncio.to_thread(self._update_crosswalks, slot.version)
+
+    async def start_reload(self, version: str, force: bool = False) -> Optional[TaxonomyLoader]:
+        """
+        Start building the next generation of a version in the background.
+
+        Args:
+            version: Resolved version label
+            force: Reload even if the taxonomy files are unchanged
+
+        Returns:
+            The generation being built (an already running reload is reused),
+            or None while the version's first load is still in progress
+        """
+        current = await self.start_load(version)
+        async with self._lock:
+            slot = self.slots[version]
+            if slot.reload_task is not None and not slot.reload_task.done():
+                return slot.reload_loader
+            # A failed first load may be retried by a reload; a running one may not
+            if not current.is_loaded and current.load_phase != 'failed':
+                return None
+            slot.reload_loader = self._new_loader(version)
+            slot.reload_loader.generation = current.generation + 1
+            slot.reload_outcome = 'running'
+            slot.reload_task = asyncio.create_task(self._reload_in_background(slot, current, slot.reload_loader, force))
+        return slot.reload_loader
+
+    async def _reload_in_background(self, slot: TaxonomySlot, current: TaxonomyLoader, loader: TaxonomyLoader,
+                                    force: bool):
+        """
+        Load a new generation and swap it in once it is ready.
+
+        The swap replaces the slot's reference only; requests that already
+        hold the previous loader finish their work on it.
+        """
+        try:
+            if not force and current.is_loaded:
+                taxonomy_hash = await asyncio.to_thread(compute_taxonomy_hash, loader.taxonomy_dir)
+                if taxonomy_hash == current.taxonomy_hash:
+                    logger.info(f"Taxonomy {slot.version} files unchanged; keeping the current generation")
+                    slot.reload_outcome = 'unchanged'
+                    slot.reload_loader = None
+                    return
+            if current.is_loaded:
+                # The new generation prunes the current blob once its own snapshot is written
+                await asyncio.to_thread(current.concepts.documentation.open)
+            await self._build(loader)
+        except Exception as e:
+            logger.error(f"Failed to reload taxonomy {slot.version}: {e}")
+            slot.reload_outcome = 'failed'
+            if loader.load_phase == 'pending':
+                # Failed before the build started; its loader would report 'pending' forever
+                slot.reload_loader = None
+            return
+
+        slot.loader = loader
+        slot.reload_outcome = 'swapped'
+        logger.info(f"Swapped in taxonomy {slot.version} generation {loader.generation} ({len(loader.concepts)} concepts)")
+        await asyncio.to_thread(self._update_crosswalks, slot.version)
+
+    def loaded_versions(self) -> List[str]:
+        """Versions whose current loader is ready, oldest first."""
+        return [version for version in self.versions
+                if version in self.slots and self.slots[version].loader.is_loaded]
+
+    def _update_crosswalks(self, version: str):
+        """Recompute the crosswalks between a newly ready version and its loaded neighbours."""
+        loaded = self.loaded_versions()
+        if version not in loaded:
+            return
+        position = loaded.index(version)
+        pairs = []
+        if position > 0:
+            pairs.append((loaded[position - 1], version))
+        if position + 1 < len(loaded):
+            pairs.append((version, loaded[position + 1]))
+        # Crosswalks spanning the new version replace any that skipped over it
+        self.crosswalks = {pair: crosswalk for pair, crosswalk in self.crosswalks.items() if version not in pair
+                           and not (pair[0] < version < pair[1])}
+        for from_version, to_version in pairs:
+            self.crosswalks[(from_version, to_version)] = self._build_crosswalk(from_version, to_version)
+
+    def _build_crosswalk(self, from_version: str, to_version: str) -> TaxonomyCrosswalk:
+        crosswalk = TaxonomyCrosswalk.build(from_version, to_version, self.slots[from_version].loader.concepts,
+                                            self.slots[to_version].loader.concepts)
+        logger.info(f"Crosswalk {from_version} -> {to_version}: {len(crosswalk.added)} added, "
+                    f"{len(crosswalk.removed)} removed, {len(crosswalk.deprecated)} deprecated")
+        return crosswalk
+
+    def crosswalk(self, from_version: str, to_version: str) -> TaxonomyCrosswalk:
+        """
+        Concept changes between two loaded versions.
+
+        Adjacent pairs are precomputed; other pairs are built on request.
+
+        Args:
+            from_version: Older version
+            to_version: Newer version
+
+        Returns:
+            TaxonomyCrosswalk between the versions
+
+        Raises:
+            ValueError: If the versions are not in order or not loaded
+        """
+        if not from_version < to_version:
+            raise ValueError("from_version must be older than to_version")
+        loaded = self.loaded_versions()
+        missing = [version for version in (from_version, to_version) if version not in loaded]
+        if missing:
+            raise ValueError(f"Taxonomy version not loaded: {', '.join(missing)}")
+        crosswalk = self.crosswalks.get((from_version, to_version))
+        if crosswalk is None or crosswalk.old is not self.slots[from_version].loader.concepts \
+                or crosswalk.new is not self.slots[to_version].loader.concepts:
+            crosswalk = self._build_crosswalk(from_version, to_version)
+        return crosswalk
+
+    def concept_changes(self, name: str) -> List[Dict[str, str]]:
+        """
+        Changes to one concept across the precomputed adjacent crosswalks.
+
+        Args:
+            name: Concept name
+
+        Returns:
+            List of {from_version, to_version, status} in version order
+        """
+        changes = []
+        for (from_version, to_version), crosswalk in sorted(self.crosswalks.items()):
+            status = crosswalk.status_of(name)
+            if status is not None:
+                changes.append({'from_version': from_version, 'to_version': to_version, 'status': status})
+        return changes
+
+    async def watch(self, interval: float):
+        """
+        Reload versions whose files change.
+
+        A change triggers a reload only once the directory has looked the
+        same for one more poll, so a release being copied in is not loaded
+        half-way.
+
+        Args:
+            interval: Seconds between polls of each version's directory
+        """
+        last: Dict[str, Any] = {}
+        pending: Dict[str, Any] = {}
+        while True:
+            for version in list(self.slots):
+                taxonomy_dir = self.versions[version]
+                try:
+                    fingerprint = await asyncio.to_thread(taxonomy_fingerprint, taxonomy_dir)
+                except Exception as e:
+                    logger.warning(f"Failed to scan taxonomy {version} files: {e}")
+                    continue
+                if version not in last or fingerprint == last[version]:
+                    last[version] = fingerprint
+                    pending.pop(version, None)
+                elif fingerprint != pending.get(version):
+                    pending[version] = fingerprint
+                elif await self.start_reload(version) is not None:
+                    logger.info(f"Taxonomy {version} files changed; reloading")
+                    last[version] = fingerprint
+                    pending.pop(version, None)
+            await asyncio.sleep(interval)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Load status, generation and latest reload of every configured version."""
+        statuses = {}
+        for version in self.versions:
+            slot = self.slots.get(version)
+            if slot is None:
+                statuses[version] = {'phase': 'pending', 'generation': 0}
+                continue
+            statuses[version] = dict(slot.loader.load_status(), generation=slot.loader.generation)
+            if slot.reload_loader is not None:
+                statuses[version]['reload'] = dict(slot.reload_loader.load_status(),
+                                                   generation=slot.reload_loader.generation,
+                                                   outcome=slot.reload_outcome)
+            elif slot.reload_outcome is not None:
+                # Reloads that never built a generation only have an outcome
+                statuses[version]['reload'] = {'outcome': slot.reload_outcome}
+        return statuses
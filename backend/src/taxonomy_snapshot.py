@@ -0,0 +1,150 @@
+# backend/src/taxonomy_snapshot.py
+"""
+Persistent snapshot of the extracted taxonomy.
+
+The snapshot holds everything TaxonomyLoader derives from the DTS so that a
+warm start can skip Arelle entirely. Snapshots are keyed by a content hash of
+the taxonomy files, so editing any file under the taxonomy directory
+invalidates them automatically.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .config import SNAPSHOT_DIR, SNAPSHOT_FORMAT_VERSION, US_GAAP_TAXONOMY_DIR
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"XBRLSNAP"
+_HEADER = struct.Struct("<8sH")
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def compute_taxonomy_hash(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR) -> str:
+    """
+    Compute a content hash over every file in the taxonomy directory.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+
+    Returns:
+        Hex digest covering relative paths and file contents
+    """
+    digest = hashlib.sha256()
+    for path in sorted(p for p in Path(taxonomy_dir).rglob("*") if p.is_file()):
+        digest.update(path.relative_to(taxonomy_dir).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def taxonomy_fingerprint(taxonomy_dir: Path = US_GAAP_TAXONOMY_DIR) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Cheap stat-based fingerprint of the taxonomy directory.
+
+    Used to notice edits without reading every file; compute_taxonomy_hash
+    still decides whether the content actually changed.
+
+    Args:
+        taxonomy_dir: Root directory of the taxonomy package
+
+    Returns:
+        Sorted (relative path, size, mtime in ns) of every file
+    """
+    fingerprint = []
+    for path in Path(taxonomy_dir).rglob("*"):
+        try:
+            if path.is_file():
+                stat = path.stat()
+                fingerprint.append((path.relative_to(taxonomy_dir).as_posix(), stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            # Removed while scanning; the next poll sees the final state
+            continue
+    return tuple(sorted(fingerprint))
+
+
+def snapshot_path(taxonomy_hash: str, snapshot_dir: Path = SNAPSHOT_DIR) -> Path:
+    """Return the snapshot file location for a taxonomy hash."""
+    return Path(snapshot_dir) / f"taxonomy-v{SNAPSHOT_FORMAT_VERSION}-{taxonomy_hash[:16]}.snap"
+
+
+def save_snapshot(state: Dict[str, Any], taxonomy_hash: str, snapshot_dir: Path = SNAPSHOT_DIR) -> Path:
+    """
+    Write a snapshot atomically.
+
+    Args:
+        state: Loader state to persist
+        taxonomy_hash: Content hash the state was built from
+        snapshot_dir: Directory holding snapshot files
+
+    Returns:
+        Path of the written snapshot
+    """
+    path = snapshot_path(taxonomy_hash, snapshot_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = {'taxonomy_hash': taxonomy_hash, 'state': state}
+    tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION))
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+    logger.info(f"Wrote taxonomy snapshot {path.name} ({path.stat().st_size} bytes)")
+    return path
+
+
+def load_snapshot(taxonomy_hash: str, snapshot_dir: Path = SNAPSHOT_DIR) -> Optional[Dict[str, Any]]:
+    """
+    Load the snapshot for a taxonomy hash.
+
+    Args:
+        taxonomy_hash: Content hash of the current taxonomy files
+        snapshot_dir: Directory holding snapshot files
+
+    Returns:
+        The persisted loader state, or None if no valid snapshot exists
+    """
+    path = snapshot_path(taxonomy_hash, snapshot_dir)
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            magic, version = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+                logger.info(f"Ignoring snapshot {path.name} with incompatible format")
+                return None
+            payload = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Failed to read taxonomy snapshot {path.name}: {e}")
+        return None
+
+    if payload.get('taxonomy_hash') != taxonomy_hash:
+        return None
+    return payload['state']
+
+
+def prune_snapshots(keep: Path, snapshot_dir: Path = SNAPSHOT_DIR) -> int:
+    """
+    Remove snapshot files other than the one in use.
+
+    Args:
+        keep: Snapshot file to keep
+        snapshot_dir: Directory holding snapshot files
+
+    Returns:
+        Number of files removed
+    """
+    removed = 0
+    for path in Path(snapshot_dir).glob("taxonomy-*.snap"):
+        if path != keep:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
@@ -0,0 +1,58 @@
+# backend/tests/test_company_index.py
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.company_index import CompanyIndex, company_tickers_expired, load_company_index
+
+TICKERS = {
+    "0": {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"},
+    "1": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "2": {"cik_str": 1067983, "ticker": "BRK-A", "title": "BERKSHIRE HATHAWAY INC"},
+    "3": {"cik_str": 1730168, "ticker": "AVGO", "title": "Broadcom Inc."},
+    "4": {"cik_str": 1424929, "ticker": "BHLB", "title": "BERKSHIRE HILLS BANCORP INC"},
+    "5": {"cik_str": 1418091, "ticker": "APLE", "title": "Apple Hospitality REIT, Inc."},
+}
+
+
+def test_ticker_cik_and_name_lookups():
+    """Test tickers in any class notation and name prefixes resolve to companies"""
+    index = CompanyIndex.build(TICKERS.values())
+    assert len(index) == 5
+
+    berkshire = index.lookup_ticker("brk.b")
+    assert berkshire == {'cik': '0001067983', 'name': 'BERKSHIRE HATHAWAY INC', 'tickers': ['BRK-B', 'BRK-A']}
+    assert index.lookup_ticker("BRK/A")['cik'] == '0001067983'
+    assert index.lookup_cik('0000320193')['name'] == 'Apple Inc.'
+    assert index.lookup_ticker("MSFT") is None
+
+    assert [c['name'] for c in index.search("Berkshire")] == ['BERKSHIRE HATHAWAY INC', 'BERKSHIRE HILLS BANCORP INC']
+    assert [c['name'] for c in index.search("berkshire hath")] == ['BERKSHIRE HATHAWAY INC']
+    # The exact ticker ranks ahead of name matches
+    assert [c['tickers'][0] for c in index.search("aple")] == ['APLE']
+    assert [c['name'] for c in index.search("apple", limit=1)] == ['Apple Inc.']
+    assert index.search("zzz") == []
+
+
+def test_cached_download_is_reused_until_expired(tmp_path):
+    """Test the tickers file is kept until expired and survives a truncated refresh"""
+    cache_path = tmp_path / "company_tickers.json"
+    assert company_tickers_expired(cache_path)
+    with pytest.raises(FileNotFoundError):
+        load_company_index(None, cache_path)
+
+    assert len(load_company_index(json.dumps(TICKERS).encode(), cache_path)) == 5
+    assert not company_tickers_expired(cache_path)
+    assert len(load_company_index(None, cache_path)) == 5
+
+    os.utime(cache_path, (0, 0))
+    assert company_tickers_expired(cache_path)
+    index = load_company_index(b'{"0": {"cik_str"', cache_path)
+    assert index.lookup_ticker("AAPL")['cik'] == '0000320193'
+    assert index.is_stale()
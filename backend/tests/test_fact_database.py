@@ -0,0 +1,97 @@
+# backend/tests/test_fact_database.py
+import asyncio
+import json
+import sys
+import zipfile
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.companyfacts_ingest import ingest_archive, ingest_from_sec
+from backend.src.fact_database import FactDatabase
+
+
+def _fact(end, val, form, filed, start=None, fy=2024, fp='FY'):
+    fact = {'end': end, 'val': val, 'accn': f"0000320193-{filed[2:4]}-000001", 'fy': fy, 'fp': fp, 'form': form,
+            'filed': filed}
+    if start:
+        fact['start'] = start
+    return fact
+
+
+COMPANY = {
+    'cik': 320193,
+    'entityName': 'Apple Inc.',
+    'facts': {
+        'dei': {'EntityCommonStockSharesOutstanding': {'label': 'Shares Outstanding', 'units': {
+            'shares': [_fact('2024-10-18', 15115823000, '10-K', '2024-11-01')]}}},
+        'us-gaap': {
+            'Revenues': {'label': 'Revenues', 'units': {'USD': [
+                _fact('2023-09-30', 383285000000, '10-K', '2023-11-03', start='2022-10-01', fy=2023),
+                _fact('2023-09-30', 383285000000, '10-K', '2024-11-01', start='2022-10-01'),
+                _fact('2024-06-29', 85777000000, '10-Q', '2024-08-02', start='2024-03-31', fp='Q3'),
+                _fact('2024-09-28', 391035000000, '10-K', '2024-11-01', start='2023-10-01'),
+            ]}},
+            'Assets': {'label': 'Assets', 'units': {'USD': [_fact('2024-09-28', 364980000000, '10-K', '2024-11-01')]}},
+        },
+    },
+}
+
+
+def _archive(tmp_path: Path) -> Path:
+    path = tmp_path / 'companyfacts.zip'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('CIK0000320193.json', json.dumps(COMPANY))
+        archive.writestr('CIK0000789019.json', json.dumps({'cik': 789019, 'entityName': 'Microsoft', 'facts': {}}))
+    return path
+
+
+def test_ingest_and_query_series(tmp_path):
+    """Test facts are stored once per company and queried with filters and dedupe"""
+    db = FactDatabase(tmp_path / 'facts.sqlite')
+    result = ingest_archive(db, _archive(tmp_path), workers=1)
+    assert (result['companies'], result['facts'], result['skipped']) == (2, 6, 0)
+    assert db.company(320193)['name'] == 'Apple Inc.'
+
+    series = db.concept_series(320193, 'Revenues')
+    assert series['taxonomy'] == 'us-gaap' and series['label'] == 'Revenues'
+    ends = [(fact['end'], fact['filed']) for fact in series['units']['USD']]
+    assert ends == [('2023-09-30', '2024-11-01'), ('2024-06-29', '2024-08-02'), ('2024-09-28', '2024-11-01')]
+
+    assert len(db.concept_series(320193, 'Revenues', latest_only=False)['units']['USD']) == 4
+    assert [fact['form'] for fact in db.concept_series(320193, 'Revenues', form='10-Q')['units']['USD']] == ['10-Q']
+    assert db.concept_series(320193, 'Revenues', unit='EUR')['units'] == {}
+    assert db.concept_series(320193, 'dei:EntityCommonStockSharesOutstanding')['units']['shares'][0]['value'] \
+        == 15115823000
+    assert db.concept_series(320193, 'NoSuchConcept') is None
+
+    reader = FactDatabase(tmp_path / 'facts.sqlite', readonly=True)
+    assert reader.concept_series(320193, 'us-gaap:Assets')['units']['USD'][0]['value'] == 364980000000
+
+
+def test_ingest_resumes_from_stored_companies(tmp_path):
+    """Test a second run skips companies already written unless forced"""
+    db = FactDatabase(tmp_path / 'facts.sqlite')
+    path = _archive(tmp_path)
+    result = ingest_archive(db, path, ciks=[320193], workers=1)
+    assert (result['companies'], result['skipped'], result['filtered']) == (1, 0, 1)
+
+    result = ingest_archive(db, path, workers=1)
+    assert (result['companies'], result['skipped'], result['filtered']) == (1, 1, 0)
+
+    result = ingest_archive(db, path, workers=1, force=True)
+    assert result['companies'] == 2
+    assert db.stats()['facts'] == 6
+
+
+def test_ingest_from_sec_writes_downloaded_companies(tmp_path):
+    """Test API downloads are parsed and written, and failed downloads are counted"""
+    class FakeClient:
+        async def get_company_facts(self, cik):
+            return json.dumps(COMPANY).encode() if cik == '0000320193' else None
+
+    db = FactDatabase(tmp_path / 'facts.sqlite')
+    result = asyncio.run(ingest_from_sec(db, FakeClient(), [320193, 789019], workers=1))
+    assert (result['companies'], result['facts'], result['failed']) == (1, 6, 1)
+    assert db.ingested_ciks() == {320193}
@@ -0,0 +1,141 @@
+# backend/tests/test_filing_sweep.py
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src import sec_client
+from backend.src.classifier import FinancialStatementClassifier
+from backend.src.company_index import CompanyIndex
+from backend.src.filing_sweep import SweepJob
+from backend.src.http_cache import HttpCache
+from backend.src.rate_limiter import TokenBucket
+from backend.src.sec_client import SECClient
+
+SUBMISSIONS = {'filings': {'recent': {
+    'form': ['10-Q', '8-K', '10-K', '10-Q'],
+    'accessionNumber': ['0000320193-25-000008', '0000320193-25-000005', '0000320193-24-000123', '0000320193-24-000081'],
+    'primaryDocument': ['aapl-20241228.htm', 'a.htm', 'aapl-20240928.htm', 'aapl-20240629.htm'],
+    'filingDate': ['2025-01-31', '2025-01-10', '2024-11-01', '2024-08-02'],
+}}}
+
+INSTANCE = b"""<?xml version="1.0" encoding="utf-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:link="http://www.xbrl.org/2003/linkbase"
+  xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:us-gaap="http://fasb.org/us-gaap/2024"
+  xmlns:dei="http://xbrl.sec.gov/dei/2024" xmlns:iso4217="http://www.xbrl.org/2003/iso4217">
+<link:schemaRef xlink:type="simple" xlink:href="aapl.xsd"/>
+<xbrli:context id="c"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+  </xbrli:entity><xbrli:period><xbrli:instant>2024-09-28</xbrli:instant></xbrli:period></xbrli:context>
+<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>
+<dei:DocumentType contextRef="c">10-K</dei:DocumentType>
+<us-gaap:Assets contextRef="c" unitRef="usd" decimals="-6">364980000000</us-gaap:Assets>
+<us-gaap:Liabilities contextRef="c" unitRef="usd" decimals="-6">308030000000</us-gaap:Liabilities>
+<us-gaap:StockholdersEquity contextRef="c" unitRef="usd" decimals="-6">56950000000</us-gaap:StockholdersEquity>
+</xbrli:xbrl>
+"""
+
+
+def _client(tmp_path, requests, unavailable=()):
+    async def handler(request):
+        path = request.url.path
+        requests.append(path)
+        if path in unavailable:
+            return httpx.Response(503)
+        if path == '/submissions/CIK0000320193.json':
+            return httpx.Response(200, json=SUBMISSIONS)
+        if path.endswith('/index.json') and '/320193/' in path:
+            return httpx.Response(200, json={'directory': {'item': [{'name': 'aapl.xsd'}, {'name': 'instance.xml'}]}})
+        if path.endswith('/instance.xml'):
+            return httpx.Response(200, content=INSTANCE)
+        return httpx.Response(404)
+
+    client = SECClient(http_cache=HttpCache(tmp_path / 'http'),
+                       rate_limiter=TokenBucket(rate=1000, capacity=10, state_path=None),
+                       transport=httpx.MockTransport(handler))
+    client._company_index = CompanyIndex.build([
+        {'cik_str': 320193, 'ticker': 'AAPL', 'title': 'Apple Inc.'},
+        {'cik_str': 789019, 'ticker': 'MSFT', 'title': 'MICROSOFT CORP'},
+    ])
+    return client
+
+
+def _sweep(tmp_path, requests, unavailable=(), **kwargs):
+    client = _client(tmp_path, requests, unavailable)
+    job = SweepJob(tickers=['AAPL', 'MSFT', 'NOPE'], output_dir=tmp_path / 'sweep', **kwargs)
+
+    async def run():
+        try:
+            return await job.run(client, FinancialStatementClassifier())
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+def test_sweep_writes_results_and_resumes(tmp_path):
+    """Test the latest filing per form is classified, failures are reported and reruns skip finished companies"""
+    requests = []
+    status = _sweep(tmp_path, requests)
+    assert status['state'] == 'completed'
+    assert (status['completed'], status['skipped'], status['failed'], status['filings']) == (1, 0, 2, 2)
+    assert set(status['errors']) == {'MSFT', 'NOPE'}
+    assert requests.count('/submissions/CIK0000320193.json') == 1
+
+    result = json.loads((tmp_path / 'sweep' / 'AAPL.json').read_text())
+    assert result['cik'] == '0000320193'
+    ten_k = result['filings']['10-K']
+    assert (ten_k['accession_number'], ten_k['filing_date']) == ('000032019324000123', '2024-11-01')
+    assert result['filings']['10-Q']['accession_number'] == '000032019325000008'
+    assert 'balance_sheet' in ten_k['statements']
+    assert ten_k['total_facts'] == 4
+    assert not (tmp_path / 'sweep' / 'MSFT.json').exists()
+
+    requests.clear()
+    status = _sweep(tmp_path, requests)
+    assert (status['completed'], status['skipped'], status['failed']) == (0, 1, 2)
+    assert '/submissions/CIK0000320193.json' not in requests
+
+
+def test_transient_failure_on_one_form_leaves_company_unswept(tmp_path, monkeypatch):
+    """Test a filing that fails to download marks the company failed so the next run retries it"""
+    monkeypatch.setattr(sec_client, 'SEC_MAX_RETRIES', 0)
+    ten_q = '/Archives/edgar/data/320193/000032019325000008/instance.xml'
+    requests = []
+    status = _sweep(tmp_path, requests, unavailable={ten_q})
+    assert (status['completed'], status['failed'], status['filings']) == (0, 3, 0)
+    assert '10-Q' in status['errors']['AAPL']
+    assert not (tmp_path / 'sweep' / 'AAPL.json').exists()
+
+    status = _sweep(tmp_path, requests)
+    assert (status['completed'], status['skipped'], status['filings']) == (1, 0, 2)
+    assert set(json.loads((tmp_path / 'sweep' / 'AAPL.json').read_text())['filings']) == {'10-K', '10-Q'}
+
+
+def test_search_and_analysis_report_the_filing_date(tmp_path):
+    """Test filing dates from the submissions list reach search results and single-filing analysis"""
+    client = _client(tmp_path, [])
+
+    async def run():
+        try:
+            return (await client.search_company_filings('AAPL', '10-K'),
+                    await client.get_filing_data('320193', '0000320193-24-000123'))
+        finally:
+            await client.aclose()
+
+    filings, filing_data = asyncio.run(run())
+    assert [(filing['accession_number'], filing['filing_date']) for filing in filings] == [
+        ('000032019324000123', '2024-11-01')]
+    assert filing_data['filing_date'] == '2024-11-01'
+
+
+def test_tickers_that_are_not_file_names_are_rejected(tmp_path):
+    """Test a ticker is checked before it becomes a result path"""
+    with pytest.raises(ValueError):
+        SweepJob(tickers=['AAPL', '../../etc/passwd'], output_dir=tmp_path)
+    assert SweepJob(tickers=['brk.b', 'BF-B'], output_dir=tmp_path).tickers == ['BRK.B', 'BF-B']
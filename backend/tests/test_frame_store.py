@@ -0,0 +1,71 @@
+# backend/tests/test_frame_store.py
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.fact_database import FactDatabase
+from backend.src.frame_store import FrameStore, build_frame_store
+
+
+def _company(cik, name, revenues, filed='2025-02-01', frame='CY2024'):
+    rows = [('USD', '2024-01-01', '2024-12-31', revenues, 2024, 'FY', '10-K', filed, f"{cik}-25-1", frame)]
+    return {'cik': cik, 'name': name, 'concepts': [('us-gaap', 'Revenues', 'Revenues', rows)]}
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = FactDatabase(tmp_path / 'facts.sqlite')
+    db.write_company(_company(1, 'Small', 10.0))
+    db.write_company(_company(2, 'Large', 300.0))
+    db.write_company(_company(3, 'Middle', 200.0))
+    restated = _company(4, 'Restated', 50.0, filed='2025-02-01')
+    restated['concepts'][0][3].append(('USD', '2024-01-01', '2024-12-31', 150.0, 2025, 'FY', '10-K', '2026-02-01',
+                                       '4-26-1', 'CY2024'))
+    restated['concepts'].append(('ifrs-full', 'Revenues', 'Revenue', [
+        ('EUR', '2024-01-01', '2024-12-31', 7.0, 2024, 'FY', '20-F', '2025-03-01', '4-25-2', 'CY2024'),
+    ]))
+    db.write_company(restated)
+    return db
+
+
+def test_frame_ranks_and_stats(db, tmp_path):
+    """Test a frame is ranked, restatements keep the latest value and stats cover the frame"""
+    store = FrameStore(build_frame_store(db, tmp_path / 'frames', universes={'sp500': [4, 1, 999]}))
+    frame = store.frame('Revenues', 'CY2024', limit=2)
+    assert frame['concept'] == 'us-gaap:Revenues'
+    assert frame['unit'] == 'USD' and frame['units'] == {'USD': 4}
+    assert [(row['company_name'], row['value'], row['percentile']) for row in frame['rows']] == [
+        ('Large', 300.0, 100.0), ('Middle', 200.0, 66.67)]
+    assert frame['rows'][0]['cik'] == '0000000002'
+    assert frame['stats']['count'] == 4 and frame['stats']['p50'] == 175.0 and frame['stats']['sum'] == 660.0
+
+    ascending = store.frame('us-gaap:Revenues', 'CY2024', ascending=True, ciks=[1, 4, 999])
+    assert [row['value'] for row in ascending['rows']] == [10.0, 150.0]
+    assert store.frame('us-gaap:Revenues', 'CY2024', ascending=True, universe='sp500')['rows'] == ascending['rows']
+    with pytest.raises(KeyError):
+        store.frame('Revenues', 'CY2024', universe='nasdaq100')
+    assert store.frame('ifrs-full:Revenues', 'CY2024')['rows'][0]['value'] == 7.0
+    assert store.frame('Revenues', 'CY2024', unit='JPY')['stats'] == {'count': 0}
+    assert store.frame('Revenues', 'CY2023') is None
+    with pytest.raises(ValueError):
+        store.frame('Revenues', 'FY2024')
+
+
+def test_rebuild_switches_current_version(db, tmp_path):
+    """Test open readers notice a rebuild and old versions are pruned"""
+    build_frame_store(db, tmp_path / 'frames')
+    store = FrameStore.open(tmp_path / 'frames')
+    assert store.is_current()
+
+    db.write_company(_company(5, 'Newcomer', 1000.0))
+    for _ in range(2):
+        build_frame_store(db, tmp_path / 'frames')
+    assert not store.is_current()
+    assert store.frame('Revenues', 'CY2024')['stats']['count'] == 4
+    assert FrameStore.open(tmp_path / 'frames').frame('Revenues', 'CY2024')['rows'][0]['company_name'] == 'Newcomer'
+    assert len(list((tmp_path / 'frames').glob('v*'))) == 2
+    assert FrameStore.open(tmp_path / 'missing') is None
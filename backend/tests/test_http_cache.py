@@ -0,0 +1,115 @@
+# backend/tests/test_http_cache.py
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.http_cache import CacheOnlyMiss, HttpCache
+
+SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK0000320193.json"
+FILING_URL = "https://www.sec.gov/Archives/edgar/data/320193/000032019324000123/aapl-20240928.htm"
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeServer:
+    """Serves one body with an ETag and answers matching conditional requests with 304."""
+
+    def __init__(self, body):
+        self.body = body
+        self.requests = []
+
+    async def __call__(self, url, headers):
+        self.requests.append(headers)
+        etag = f'"{len(self.body)}"'
+        if headers.get('If-None-Match') == etag:
+            return FakeResponse(304, headers={'ETag': etag})
+        return FakeResponse(200, self.body, {'ETag': etag, 'Content-Type': 'application/json'})
+
+
+def _fetch(cache, url, send):
+    return asyncio.run(cache.fetch_async(url, send))
+
+
+def _expire(cache, url):
+    path = cache._entry_path(url)
+    entry = json.loads(path.read_text())
+    entry['stored_at'] = 0
+    path.write_text(json.dumps(entry))
+
+
+def test_fresh_hits_revalidation_and_ttl_policy(tmp_path):
+    """Test fresh entries skip the network and expired ones revalidate with the ETag"""
+    cache = HttpCache(tmp_path, ttl_policy=[(r"/Archives/", None), (r"/submissions/", 60)])
+    server = FakeServer(json.dumps({'filings': {'form': ['10-K'] * 200}}).encode())
+
+    assert _fetch(cache, SUBMISSIONS_URL, server).source == 'miss'
+    assert _fetch(cache, SUBMISSIONS_URL, server).json() == _fetch(cache, SUBMISSIONS_URL, server).json()
+    assert len(server.requests) == 1
+
+    _expire(cache, SUBMISSIONS_URL)
+    response = _fetch(cache, SUBMISSIONS_URL, server)
+    assert response.source == 'revalidated' and response.content == server.body
+    assert server.requests[-1] == {'If-None-Match': f'"{len(server.body)}"'}
+    assert _fetch(cache, SUBMISSIONS_URL, server).source == 'hit'
+
+    # Filed documents never expire; identical bodies are stored once, compressed
+    _fetch(cache, FILING_URL, server)
+    _expire(cache, FILING_URL)
+    assert _fetch(cache, FILING_URL, server).source == 'hit'
+    stats = cache.stats()
+    assert (stats['entries'], stats['bodies'], stats['misses'], stats['revalidated']) == (2, 1, 2, 1)
+    assert stats['disk_bytes'] < len(server.body)
+
+
+def test_cache_only_mode_and_offline_fallback(tmp_path):
+    """Test cache-only mode never sends requests and failed requests serve the cached copy"""
+    server = FakeServer(b'{}')
+    _fetch(HttpCache(tmp_path), SUBMISSIONS_URL, server)
+
+    async def offline(url, headers):
+        raise ConnectionError("offline")
+
+    replay = HttpCache(tmp_path, cache_only=True)
+    _expire(replay, SUBMISSIONS_URL)
+    assert _fetch(replay, SUBMISSIONS_URL, offline).source == 'stale'
+    with pytest.raises(CacheOnlyMiss):
+        _fetch(replay, FILING_URL, offline)
+
+    assert _fetch(HttpCache(tmp_path), SUBMISSIONS_URL, offline).content == b'{}'
+    with pytest.raises(ConnectionError):
+        _fetch(HttpCache(tmp_path), FILING_URL, offline)
+
+
+def test_server_errors_serve_the_cached_copy(tmp_path):
+    """Test a 5xx answer falls back to an expired entry like a dropped connection does"""
+    cache = HttpCache(tmp_path)
+    _fetch(cache, SUBMISSIONS_URL, FakeServer(b'{"cached": true}'))
+    _expire(cache, SUBMISSIONS_URL)
+
+    async def unavailable(url, headers):
+        return FakeResponse(503)
+
+    async def not_found(url, headers):
+        return FakeResponse(404)
+
+    response = _fetch(cache, SUBMISSIONS_URL, unavailable)
+    assert response.source == 'stale' and response.json() == {'cached': True}
+    with pytest.raises(RuntimeError):
+        _fetch(cache, FILING_URL, unavailable)
+    with pytest.raises(RuntimeError):
+        _fetch(cache, FILING_URL, not_found)
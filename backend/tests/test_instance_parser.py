@@ -0,0 +1,125 @@
+# backend/tests/test_instance_parser.py
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.instance_parser import (DECIMALS_INF, DECIMALS_NONE, find_instance_document, parse_extension_roles,
+                                         parse_instance)
+
+CONTEXTS = b"""
+<xbrli:context id="FY2024"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+  </xbrli:entity><xbrli:period><xbrli:startDate>2023-10-01</xbrli:startDate><xbrli:endDate>2024-09-28</xbrli:endDate>
+  </xbrli:period></xbrli:context>
+<xbrli:context id="I2024"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+  <xbrli:segment><xbrldi:explicitMember dimension="us-gaap:StatementBusinessSegmentsAxis">aapl:AmericasSegmentMember
+  </xbrldi:explicitMember></xbrli:segment></xbrli:entity><xbrli:period><xbrli:instant>2024-09-28</xbrli:instant>
+  </xbrli:period></xbrli:context>
+<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>
+<xbrli:unit id="usdPerShare"><xbrli:divide><xbrli:unitNumerator><xbrli:measure>iso4217:USD</xbrli:measure>
+  </xbrli:unitNumerator><xbrli:unitDenominator><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unitDenominator>
+  </xbrli:divide></xbrli:unit>
+"""
+NAMESPACES = (b'xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:link="http://www.xbrl.org/2003/linkbase" '
+              b'xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:xbrldi="http://xbrl.org/2006/xbrldi" '
+              b'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:us-gaap="http://fasb.org/us-gaap/2024" '
+              b'xmlns:dei="http://xbrl.sec.gov/dei/2024" xmlns:iso4217="http://www.xbrl.org/2003/iso4217"')
+
+INSTANCE = b"""<?xml version="1.0" encoding="utf-8"?>
+<xbrli:xbrl """ + NAMESPACES + b""">
+<link:schemaRef xlink:type="simple" xlink:href="aapl-20240928.xsd"/>""" + CONTEXTS + b"""
+<dei:EntityRegistrantName contextRef="FY2024">Apple Inc.</dei:EntityRegistrantName>
+<dei:DocumentType contextRef="FY2024">10-K</dei:DocumentType>
+<us-gaap:Revenues contextRef="FY2024" unitRef="usd" decimals="-6">391035000000</us-gaap:Revenues>
+<us-gaap:Assets contextRef="I2024" unitRef="usd" decimals="-6">364980000000</us-gaap:Assets>
+<us-gaap:EarningsPerShareBasic contextRef="FY2024" unitRef="usdPerShare" decimals="2">6.11</us-gaap:EarningsPerShareBasic>
+<us-gaap:Goodwill contextRef="I2024" unitRef="usd" xsi:nil="true"/>
+<us-gaap:SharesIssued contextRef="I2024" unitRef="usd" decimals="INF">15</us-gaap:SharesIssued>
+</xbrli:xbrl>
+"""
+
+INLINE = b"""<?xml version="1.0" encoding="utf-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"
+  xmlns:ixt="http://www.xbrl.org/inlineXBRL/transformation/2020-02-12" """ + NAMESPACES + b""">
+<body><div style="display:none"><ix:header><ix:references>
+<link:schemaRef xlink:type="simple" xlink:href="aapl-20240928.xsd"/></ix:references><ix:resources>""" + CONTEXTS + b"""
+</ix:resources></ix:header></div>
+<p><ix:nonNumeric name="dei:EntityRegistrantName" contextRef="FY2024"><span>Apple</span> Inc.</ix:nonNumeric></p>
+<table><tr><td>Net sales</td><td>$<ix:nonFraction name="us-gaap:Revenues" contextRef="FY2024" unitRef="usd"
+  decimals="-6" scale="6" format="ixt:num-dot-decimal">391,035</ix:nonFraction></td></tr>
+<tr><td>Net loss</td><td>(<ix:nonFraction name="us-gaap:OtherNonoperatingIncomeExpense" contextRef="FY2024"
+  unitRef="usd" decimals="-6" scale="6" sign="-" format="ixt:num-dot-decimal">269</ix:nonFraction>)</td></tr>
+<tr><td>Impairment</td><td><ix:nonFraction name="us-gaap:GoodwillImpairmentLoss" contextRef="FY2024" unitRef="usd"
+  decimals="-6" scale="6" format="ixt:fixed-zero">&#8212;</ix:nonFraction></td></tr>
+<tr><td>Assets</td><td><ix:nonFraction name="us-gaap:Assets" contextRef="I2024" unitRef="usd" decimals="-6"
+  scale="6" format="ixt:num-comma-decimal">364.980</ix:nonFraction></td></tr></table>
+</body></html>
+"""
+
+SCHEMA = b"""<?xml version="1.0" encoding="utf-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:link="http://www.xbrl.org/2003/linkbase">
+<xs:annotation><xs:appinfo>
+<link:roleType roleURI="http://www.apple.com/role/CONSOLIDATEDBALANCESHEETS" id="CONSOLIDATEDBALANCESHEETS">
+  <link:definition>9952153 - Statement - CONSOLIDATED BALANCE SHEETS</link:definition>
+  <link:usedOn>link:presentationLink</link:usedOn></link:roleType>
+</xs:appinfo></xs:annotation></xs:schema>
+"""
+
+
+def test_instance_facts_land_in_the_fact_table():
+    """Test contexts, units, decimals, nil and cover facts of a plain instance"""
+    table = parse_instance(INSTANCE)
+    assert len(table) == 7
+    assert table.schema_refs == ['aapl-20240928.xsd']
+    assert table.cover == {'dei:EntityRegistrantName': 'Apple Inc.', 'dei:DocumentType': '10-K'}
+    assert table.units == {'usd': 'iso4217:USD', 'usdPerShare': 'iso4217:USD/xbrli:shares'}
+    assert table.contexts['I2024'] == {'start': None, 'end': '2024-09-28', 'dimensions': 1}
+
+    assert table.facts_for('us-gaap:Revenues') == [{
+        'context': 'FY2024', 'period_start': '2023-10-01', 'period_end': '2024-09-28', 'dimensional': False,
+        'unit': 'iso4217:USD', 'decimals': -6, 'value': 391035000000.0,
+    }]
+    assert table.facts_for('us-gaap:EarningsPerShareBasic')[0]['unit'] == 'iso4217:USD/xbrli:shares'
+    assert table.facts_for('us-gaap:Goodwill')[0]['value'] is None
+    assert table.decimals[table.concepts.index('us-gaap:SharesIssued')] == DECIMALS_INF
+    assert table.decimals[table.concepts.index('dei:DocumentType')] == DECIMALS_NONE
+
+    summary = table.concept_summary()
+    assert summary['us-gaap:Assets'] == {'facts': 1, 'numeric': 1}
+    assert summary['dei:DocumentType'] == {'facts': 1, 'numeric': 0}
+
+
+def test_inline_formats_scale_and_sign():
+    """Test inline XBRL values are transformed, scaled and signed"""
+    table = parse_instance(INLINE)
+    values = dict(zip((table.concepts[i] for i in table.concept), table.value))
+    assert values['us-gaap:Revenues'] == 391035000000.0
+    assert values['us-gaap:OtherNonoperatingIncomeExpense'] == -269000000.0
+    assert values['us-gaap:GoodwillImpairmentLoss'] == 0.0
+    assert values['us-gaap:Assets'] == 364980000000.0
+    assert math.isnan(values['dei:EntityRegistrantName'])
+    assert table.cover['dei:EntityRegistrantName'] == 'Apple Inc.'
+    assert table.contexts['FY2024']['start'] == '2023-10-01'
+    assert np.array_equal(table.unit[table.concept != table.concepts.index('dei:EntityRegistrantName')], [0, 0, 0, 0])
+
+
+def test_extension_roles_and_instance_selection():
+    """Test roles are read from the extension schema and the instance is picked from the index"""
+    assert parse_extension_roles(SCHEMA) == {
+        'http://www.apple.com/role/CONSOLIDATEDBALANCESHEETS': {
+            'id': 'CONSOLIDATEDBALANCESHEETS', 'definition': '9952153 - Statement - CONSOLIDATED BALANCE SHEETS'},
+    }
+    names = ['FilingSummary.xml', 'aapl-20240928.htm', 'aapl-20240928.xsd', 'aapl-20240928_cal.xml',
+             'aapl-20240928_htm.xml']
+    assert find_instance_document(names) == 'aapl-20240928_htm.xml'
+    assert find_instance_document(['a_lab.xml', 'a-20101231.xml']) == 'a-20101231.xml'
+    # Older filings also list rendered statements, which sort ahead of the instance
+    older = ['FilingSummary.xml', 'R1.xml', 'R2.xml', 'aapl-20100925.xml', 'aapl-20100925.xsd', 'aapl-20100925_lab.xml']
+    assert find_instance_document(older) == 'aapl-20100925.xml'
+    assert find_instance_document(['R1.xml', 'R12.xml', 'a-20101231.xml']) == 'a-20101231.xml'
+    assert find_instance_document(['FilingSummary.xml', 'a.htm'], primary_document='a.htm') == 'a.htm'
+    assert find_instance_document(['a.htm']) is None
@@ -0,0 +1,39 @@
+# backend/tests/test_query_cache.py
+import sys
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.query_cache import QueryCache
+
+
+def test_lru_eviction_and_counters():
+    """Test least recently used entries are evicted first"""
+    cache = QueryCache(max_size=2, ttl_seconds=60)
+    cache.put('revenue', [1])
+    cache.put('assets', [2])
+    assert cache.get('revenue') == [1]
+
+    cache.put('cash', [3])
+    assert cache.get('assets') is None
+    assert cache.get('revenue') == [1]
+    assert cache.get('cash') == [3]
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions'], stats['size']) == (3, 1, 1, 2)
+    assert stats['hit_rate'] == 0.75
+
+
+def test_ttl_expiry_and_clear():
+    """Test expired entries miss and clear empties the cache"""
+    cache = QueryCache(max_size=10, ttl_seconds=-1)
+    cache.put('revenue', [])
+    assert cache.get('revenue') is None
+    assert cache.stats()['expirations'] == 1
+
+    cache = QueryCache(max_size=10, ttl_seconds=60)
+    cache.put('revenue', [])
+    assert cache.get('revenue') == []
+    cache.clear()
+    assert len(cache) == 0 and cache.get('revenue') is None
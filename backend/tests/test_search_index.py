@@ -0,0 +1,258 @@
+# backend/tests/test_search_index.py
+import pickle
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.search_index import split_camel_case, tokenize
+from backend.src.taxonomy_loader import TaxonomyLoader
+
+MINI_TAXONOMY = Path(__file__).parent / "fixtures" / "mini-taxonomy"
+
+
+@pytest.fixture(scope="module")
+def loader(tmp_path_factory):
+    loader = TaxonomyLoader(taxonomy_dir=MINI_TAXONOMY, extractor='lxml',
+                            documentation_dir=tmp_path_factory.mktemp("documentation"))
+    loader.load_taxonomy(use_snapshot=False)
+    return loader
+
+
+def test_tokenize_splits_camel_case():
+    """Test CamelCase names and free text produce the same tokens"""
+    assert split_camel_case("EarningsPerShareBasic") == ["Earnings", "Per", "Share", "Basic"]
+    assert tokenize("AssetsCurrent") == tokenize("assets, current") == ["asset", "current"]
+
+
+def test_exact_concept_ranks_first(loader):
+    """Test that the best match wins regardless of dictionary order"""
+    results = loader.search_concepts("revenue", limit=5)
+    assert results[0]['name'] == 'Revenues'
+    assert 'RevenueFromContractWithCustomer' in [r['name'] for r in results]
+
+
+def test_prefix_and_label_matches(loader):
+    """Test partial words and label text are searchable"""
+    assert loader.search_concepts("receiv", limit=1)[0]['name'] == 'AccountsReceivableNetCurrent'
+    assert loader.search_concepts("cash equivalents", limit=1)[0]['name'] == 'CashAndCashEquivalentsAtCarryingValue'
+
+
+def test_deprecated_filter(loader):
+    """Test deprecated concepts are only returned on request"""
+    names = [r['name'] for r in loader.search_concepts("revenue item", limit=10)]
+    assert 'DeprecatedRevenueItem' not in names
+
+    names = [r['name'] for r in loader.search_concepts("revenue item", limit=10, include_deprecated=True)]
+    assert 'DeprecatedRevenueItem' in names
+
+
+def test_limit_applies_after_ranking(loader):
+    """Test the limit truncates an already ranked list"""
+    full = loader.search_concepts("amount", limit=50)
+    assert loader.search_concepts("amount", limit=2) == full[:2]
+
+
+def test_suggest_completes_prefixes(loader):
+    """Test suggestions complete partial words and rank reportable concepts first"""
+    names = [s['name'] for s in loader.suggest_concepts("rev")]
+    assert set(names) >= {'Revenues', 'RevenueFromContractWithCustomer'}
+
+    names = [s['name'] for s in loader.suggest_concepts("cash equ")]
+    assert names == ['CashAndCashEquivalentsAtCarryingValue']
+
+    names = [s['name'] for s in loader.suggest_concepts("a", limit=20)]
+    assert names.index('Assets') < names.index('BalanceSheetAbstract')
+
+
+def test_fuzzy_search_corrects_typos(loader):
+    """Test misspelled terms are corrected and reported"""
+    assert loader.search_concepts("Receivible") == []
+
+    results = loader.search_concepts("Receivible", fuzzy=True)
+    assert results[0]['name'] == 'AccountsReceivableNetCurrent'
+    assert results[0]['corrections'] == {'receivible': 'receivable'}
+
+    results = loader.search_concepts("Amortizaton", fuzzy=True)
+    assert results[0]['name'] == 'DepreciationAndAmortization'
+
+
+def test_fuzzy_search_leaves_known_terms_alone(loader):
+    """Test correctly spelled queries are not rewritten"""
+    results = loader.search_concepts("revenue", fuzzy=True)
+    assert results[0]['name'] == 'Revenues'
+    assert results[0]['corrections'] is None
+
+
+def test_facet_filters_apply_before_ranking(loader):
+    """Test facet filters restrict the candidate set"""
+    results = loader.search_concepts("revenue", filters={'period_type': 'duration', 'balance_type': 'credit'})
+    assert results and all(r['period_type'] == 'duration' and r['balance_type'] == 'credit' for r in results)
+
+    names = [r['name'] for r in loader.search_concepts("assets", filters={'period_type': 'duration'})]
+    assert 'Assets' not in names and 'AssetsCurrent' not in names
+
+
+def test_facet_counts_and_statistics(loader):
+    """Test facet counts for a query and statistics come from the bitmaps"""
+    counts = loader.get_facet_counts("revenue", include_deprecated=False)
+    assert counts['total'] == 2
+    assert counts['facets']['balance_type'] == {'credit': 2}
+
+    stats = loader.get_taxonomy_statistics()
+    assert stats['total_concepts'] == 12
+    assert stats['deprecated_concepts'] == 1
+    assert stats['abstract_concepts'] == 1
+    assert stats['period_types'] == {'duration': 7, 'instant': 5}
+
+
+def test_similar_concepts(loader):
+    """Test TF-IDF neighbours and that batch mode matches single lookups"""
+    similar = loader.find_similar_concepts('Assets', k=3)
+    names = [s['name'] for s in similar]
+    assert names[0] == 'AssetsCurrent'
+    assert 'Assets' not in names
+    assert all(0 < s['score'] <= 1 for s in similar)
+    assert loader.find_similar_concepts('NoSuchConcept') is None
+
+    batch = loader.find_similar_concepts_batch(['Assets', 'Revenues', 'NoSuchConcept'], k=3)
+    for name in ('Assets', 'Revenues'):
+        single = loader.find_similar_concepts(name, k=3)
+        assert [s['name'] for s in batch[name]] == [s['name'] for s in single]
+        assert [s['score'] for s in batch[name]] == pytest.approx([s['score'] for s in single])
+    assert batch['NoSuchConcept'] is None
+
+
+def test_batch_search_matches_single_searches(loader):
+    """Test batch results come back in request order and equal single searches"""
+    queries = [
+        {'query': 'revenue', 'limit': 3},
+        {'query': 'cash'},
+        {'query': 'Receivible', 'fuzzy': True},
+        {'query': 'revenue', 'limit': 3},
+        {'query': 'assets', 'filters': {'period_type': 'duration'}},
+        {'query': '   '},
+    ]
+    results = loader.search_concepts_batch(queries)
+    assert len(results) == len(queries)
+    for query, result in zip(queries, results):
+        assert result == loader.search_concepts(**query)
+
+
+def test_keyset_pagination_walks_the_full_ranking(loader):
+    """Test paging with (score, id) cursors reproduces the unpaginated order"""
+    full = loader.search_concepts("amount", limit=100, include_deprecated=True)
+    assert len(full) > 3
+
+    paged = []
+    after = None
+    while True:
+        page = loader.search_concepts("amount", limit=2, include_deprecated=True, after=after)
+        paged.extend(page)
+        if len(page) < 2:
+            break
+        after = (page[-1]['score'], page[-1]['id'])
+    assert [r['name'] for r in paged] == [r['name'] for r in full]
+
+
+def test_relationship_traversal(loader):
+    """Test descendants, ancestors, depth, arcrole filters and prohibited arcs"""
+    result = loader.get_concept_relationships('Assets', arcroles=['summation-item'], depth=2)
+    edges = [(r['from'], r['to'], r['depth']) for r in result['relationships']]
+    assert edges == [
+        ('Assets', 'AssetsCurrent', 1),
+        ('AssetsCurrent', 'CashAndCashEquivalentsAtCarryingValue', 2),
+        ('AssetsCurrent', 'AccountsReceivableNetCurrent', 2),
+    ]
+
+    parents = loader.get_concept_relationships('CashAndCashEquivalentsAtCarryingValue', direction='ancestors', depth=5)
+    assert {(r['arcrole'], r['from']) for r in parents['relationships']} == {
+        ('summation-item', 'AssetsCurrent'), ('summation-item', 'Assets'),
+        ('parent-child', 'AssetsCurrent'), ('parent-child', 'BalanceSheetAbstract'),
+    }
+
+    members = loader.get_concept_relationships('Revenues', arcroles=['domain-member'])
+    assert [r['to'] for r in members['relationships']] == ['DeprecatedRevenueItem', 'ProductMember']
+    assert loader.get_concept_relationships('ProductMember', direction='ancestors')['relationships'][0]['from'] == 'Revenues'
+
+    assert loader.get_concept_details('AssetsCurrent')['relationship_counts']['summation-item'] == {'parents': 1, 'children': 2}
+    assert loader.get_concept_relationships('NoSuchConcept') is None
+
+
+def test_label_roles_and_lazy_documentation(loader):
+    """Test alternate-role labels are searchable and documentation is read on request"""
+    assert loader.search_concepts("depletion", limit=1)[0]['name'] == 'DepreciationAndAmortization'
+    by_role = loader.search_concepts("cash balance", label_role='periodEndLabel')
+    assert [(r['name'], r['label']) for r in by_role] == [('CashAndCashEquivalentsAtCarryingValue', 'Cash balance, end of period')]
+    assert loader.search_concepts("assets", label_role='verboseLabel') == []
+    with pytest.raises(ValueError):
+        loader.search_concepts("assets", label_role='bogusLabel')
+
+    assert loader.search_concepts("assets", limit=1)[0]['documentation'] is None
+    assert loader.search_concepts("assets", limit=1, include_documentation=True)[0]['documentation'].startswith('Sum of')
+    assert loader.get_concept_details('Assets')['labels'] == {'totalLabel': 'Total assets'}
+
+    # A restored store maps its blob only on first read
+    documentation = pickle.loads(pickle.dumps(loader.concepts.documentation))
+    assert not documentation.is_loaded()
+    assert documentation.get(loader.concepts.ids['Assets']).startswith('Sum of')
+    assert documentation.is_loaded()
+
+
+def test_reference_search(loader):
+    """Test codification prefix lookups, external concepts and concept reference details"""
+    revenue = loader.search_references('606')
+    assert revenue['total'] == 2
+    assert [c['name'] for c in revenue['concepts']] == ['Revenues', 'RevenueFromContractWithCustomer']
+    assert revenue['concepts'][0]['citations'] == ['606-10-50-5']
+
+    assert [c['name'] for c in loader.search_references('842', '20', '45', '1')['concepts']] == ['OperatingLeaseLiability']
+    assert loader.search_references('842', '10')['total'] == 0
+    assert loader.search_references('210', '10', '45')['concepts'][0]['name'] == 'AssetsCurrent'
+    with pytest.raises(ValueError):
+        loader.search_references('210', section='45')
+
+    references = loader.get_concept_details('RevenueFromContractWithCustomer')['references']
+    assert {r['role'] for r in references} == {'disclosureRef', 'changeNote'}
+    assert references[0]['Topic'] == '606' and references[0]['Paragraph'] == '5'
+
+
+def test_concurrent_loads_run_once_and_report_phases(monkeypatch, tmp_path):
+    """Test parallel load calls share one load and the phases end in ready or failed"""
+    loader = TaxonomyLoader(taxonomy_dir=MINI_TAXONOMY, extractor='lxml', documentation_dir=tmp_path)
+    assert loader.load_status()['phase'] == 'pending'
+    phases = []
+    original_set_phase = loader._set_phase
+    loader._set_phase = lambda phase, **progress: (phases.append(phase), original_set_phase(phase, **progress))
+
+    threads = [threading.Thread(target=loader.load_taxonomy, kwargs={'use_snapshot': False}) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert phases == ['extracting', 'indexing', 'indexing', 'indexing', 'ready']
+    assert loader.load_status()['concepts'] == len(loader.concepts)
+
+    broken = TaxonomyLoader(taxonomy_dir=MINI_TAXONOMY, extractor='lxml', documentation_dir=tmp_path)
+    monkeypatch.setattr(broken, '_build_relationship_index', lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        broken.load_taxonomy(use_snapshot=False)
+    assert broken.load_status()['phase'] == 'failed' and broken.load_status()['error']
+
+
+def test_snapshot_write_prunes_orphaned_documentation(tmp_path):
+    """Test writing a snapshot removes blobs no kept snapshot refers to"""
+    loader = TaxonomyLoader(taxonomy_dir=MINI_TAXONOMY, extractor='lxml', documentation_dir=tmp_path / "documentation")
+    loader.snapshot_dir = tmp_path / "snapshots"
+    loader.load_taxonomy(use_snapshot=False)
+    orphan = tmp_path / "documentation" / "documentation-0000000000000000.blob"
+    orphan.write_bytes(b"stale")
+
+    assert loader.write_snapshot() is not None
+    assert not orphan.exists()
+    assert list((tmp_path / "documentation").iterdir()) == [loader.concepts.documentation.path]
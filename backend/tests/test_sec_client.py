@@ -0,0 +1,61 @@
+# backend/tests/test_sec_client.py
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src import sec_client as sec_client_module
+from backend.src.http_cache import HttpCache
+from backend.src.rate_limiter import TokenBucket
+from backend.src.sec_client import SECClient
+
+SUBMISSIONS = {'filings': {'recent': {'form': ['8-K', '10-K'], 'accessionNumber': ['0000320193-24-000001',
+                                                                                  '0000320193-24-000123'],
+                                     'primaryDocument': ['a.htm', 'aapl-20240928.htm']}}}
+
+
+def test_token_bucket_is_shared_through_the_state_file(tmp_path):
+    """Test two limiters on one state file (as in two workers) draw from the same bucket"""
+    state = tmp_path / "bucket.bin"
+    worker_a = TokenBucket(rate=10, capacity=1, state_path=state)
+    worker_b = TokenBucket(rate=10, capacity=1, state_path=state)
+
+    waits = [worker_a.reserve(), worker_b.reserve(), worker_a.reserve(), worker_b.reserve()]
+    assert waits[0] == 0
+    assert waits[1:] == pytest.approx([0.1, 0.2, 0.3], abs=0.02)
+
+
+def test_retries_and_coalesces_identical_requests(tmp_path, monkeypatch):
+    """Test 503s are retried and concurrent requests for one URL share a single response"""
+    monkeypatch.setattr(sec_client_module, 'SEC_RETRY_BACKOFF_SECONDS', 0.001)
+    requests = []
+
+    async def handler(request):
+        requests.append(str(request.url))
+        await asyncio.sleep(0.01)
+        if len(requests) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=SUBMISSIONS, headers={'ETag': '"v1"'})
+
+    client = SECClient(http_cache=HttpCache(tmp_path), rate_limiter=TokenBucket(rate=1000, capacity=10, state_path=None),
+                       transport=httpx.MockTransport(handler))
+
+    async def run():
+        try:
+            return await asyncio.gather(*(client.get_latest_filing('0000320193') for _ in range(5)))
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(run())
+    assert results == [('000032019324000123', 'aapl-20240928.htm')] * 5
+    assert len(requests) == 2
+    assert (client.retries, client.coalesced) == (1, 4)
+
+    # Later lookups are served from the response cache
+    assert asyncio.run(client.get_latest_filing('0000320193', '8-K')) == ('000032019324000001', 'a.htm')
+    assert len(requests) == 2
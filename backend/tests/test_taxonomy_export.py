@@ -0,0 +1,34 @@
+# backend/tests/test_taxonomy_export.py
+import csv
+import gzip
+import io
+import json
+import sys
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.taxonomy_export import stream_concepts
+
+CONCEPTS = [
+    {'name': f'Concept{i}', 'label': f'Concept, "{i}"', 'documentation': 'Amount of things.\nMore.',
+     'is_deprecated': i % 2 == 0}
+    for i in range(1234)
+]
+
+
+def test_ndjson_export_is_chunked_and_gzipped():
+    """Test NDJSON chunks decompress to one object per concept"""
+    chunks = list(stream_concepts(iter(CONCEPTS), 'ndjson', compress=True))
+    assert len(chunks) > 1
+    lines = gzip.decompress(b"".join(chunks)).decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == CONCEPTS
+
+
+def test_csv_export_has_header_and_quoted_rows():
+    """Test CSV output round-trips through a CSV reader"""
+    data = b"".join(stream_concepts(iter(CONCEPTS[:3]), 'csv')).decode("utf-8")
+    rows = list(csv.DictReader(io.StringIO(data)))
+    assert [row['label'] for row in rows] == [c['label'] for c in CONCEPTS[:3]]
+    assert rows[0]['documentation'] == 'Amount of things.\nMore.'
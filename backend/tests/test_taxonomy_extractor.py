@@ -0,0 +1,98 @@
+# backend/tests/test_taxonomy_extractor.py
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.parse_cache import ParseCache
+from backend.src.taxonomy_extractor import extract_concepts
+
+MINI_TAXONOMY = Path(__file__).parent / "fixtures" / "mini-taxonomy"
+
+
+def test_extract_concepts_reads_attributes_and_labels():
+    """Test the lxml extractor picks up schema attributes and labels"""
+    concepts = extract_concepts(MINI_TAXONOMY, max_workers=0)
+
+    assets = concepts['Assets']
+    assert assets['qname'] == 'mini:Assets'
+    assert assets['label'] == 'Assets'
+    assert assets['documentation'].startswith('Sum of the carrying amounts')
+    assert assets['data_type'] == 'xbrli:monetaryItemType'
+    assert assets['period_type'] == 'instant'
+    assert assets['balance_type'] == 'debit'
+    assert assets['substitution_group'] == 'xbrli:item'
+    assert concepts['BalanceSheetAbstract']['is_abstract'] is True
+    assert concepts['DeprecatedRevenueItem']['is_deprecated'] is True
+    assert concepts['RevenueFromContractWithCustomer']['is_deprecated'] is False
+    assert assets['labels'] == {'totalLabel': 'Total assets'}
+
+    # Unlabelled concepts fall back to their name
+    assert concepts['SegmentDescription']['label'] == 'SegmentDescription'
+    assert concepts['SegmentDescription']['documentation'] is None
+
+
+def test_deprecation_comes_from_depcon_arcs_and_label_roles(tmp_path):
+    """Test concepts are deprecated by a depcon arc or a deprecatedDate label, not by their name"""
+    taxonomy_dir = tmp_path / "taxonomy"
+    shutil.copytree(MINI_TAXONOMY, taxonomy_dir)
+    (taxonomy_dir / "elts" / "mini-depcon-def-2025.xml").unlink()
+    label_file = taxonomy_dir / "elts" / "mini-lab-2025.xml"
+    label_file.write_text(label_file.read_text().replace(
+        "xlink:role='http://www.xbrl.org/2003/role/totalLabel'",
+        "xlink:role='http://www.xbrl.org/2009/role/deprecatedDateLabel'"))
+
+    concepts = extract_concepts(taxonomy_dir, max_workers=0)
+    assert concepts['DeprecatedRevenueItem']['is_deprecated'] is False
+    assert concepts['Assets']['is_deprecated'] is True
+    assert [name for name, concept in concepts.items() if concept['is_deprecated']] == ['Assets']
+
+
+def test_process_pool_matches_in_process():
+    """Test parallel extraction yields the same result as serial extraction"""
+    assert extract_concepts(MINI_TAXONOMY, max_workers=2) == extract_concepts(MINI_TAXONOMY, max_workers=0)
+
+
+def test_parse_cache_reparses_only_changed_files(tmp_path):
+    """Test a reload with the parse cache parses just the edited file"""
+    taxonomy_dir = tmp_path / "taxonomy"
+    shutil.copytree(MINI_TAXONOMY, taxonomy_dir)
+    first = ParseCache(tmp_path / "parsed")
+    assert extract_concepts(taxonomy_dir, max_workers=0, cache=first) == extract_concepts(MINI_TAXONOMY, max_workers=0)
+    assert (first.hits, first.misses) == (0, 4)
+
+    label_file = taxonomy_dir / "elts" / "mini-lab-2025.xml"
+    label_file.write_text(label_file.read_text().replace("Total assets", "Assets, total"))
+    second = ParseCache(tmp_path / "parsed")
+    concepts = extract_concepts(taxonomy_dir, max_workers=0, cache=second)
+    assert (second.hits, second.misses) == (3, 1)
+    assert concepts['Assets']['labels'] == {'totalLabel': 'Assets, total'}
+
+    # The stale label linkbase entry is the only one the second load did not use
+    assert second.prune() == 1
+
+
+def test_parity_with_arelle(tmp_path):
+    """Test the lxml extractor matches the Arelle-backed loader, except for imported schemas"""
+    pytest.importorskip("arelle")
+    from backend.src.taxonomy_loader import TaxonomyLoader
+
+    loader = TaxonomyLoader(entry_point=MINI_TAXONOMY / "elts" / "mini-2025.xsd", taxonomy_dir=MINI_TAXONOMY,
+                            documentation_dir=tmp_path)
+    loader.load_taxonomy(use_snapshot=False)
+    arelle_concepts = {
+        name: dict(info.to_dict(), labels=loader.concepts.labels_of(info.id)) for name, info in loader.concepts.items()
+    }
+    lxml_concepts = extract_concepts(MINI_TAXONOMY, max_workers=0)
+
+    # Arelle also reports every concept of the schemas the package imports (here the XBRL base
+    # schemas; srt and dei for US-GAAP); lxml reads only the package's own schemas
+    imported = {concept.name for concept in loader.model_xbrl.qnameConcepts.values()
+                if not Path(concept.modelDocument.filepath).resolve().is_relative_to(MINI_TAXONOMY.resolve())}
+    assert set(arelle_concepts) - set(lxml_concepts) == imported
+    assert {arelle_concepts[name]['qname'].partition(':')[0] for name in imported} == {'xbrli', 'link', 'xl'}
+    assert {name: info for name, info in arelle_concepts.items() if name not in imported} == lxml_concepts
@@ -0,0 +1,89 @@
+# backend/tests/test_taxonomy_package.py
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.taxonomy_loader import TaxonomyLoader
+from backend.src.taxonomy_package import collect_remappings, configure_offline, parse_catalog, timed_document_loads
+
+MINI_TAXONOMY = Path(__file__).parent / "fixtures" / "mini-taxonomy"
+PACKAGE_URL = "https://mini.example/2025/"
+
+
+def _make_package(root: Path) -> Path:
+    """Copy the mini taxonomy into a package whose entry point imports it by URL."""
+    package_dir = root / "mini-2025"
+    shutil.copytree(MINI_TAXONOMY, package_dir)
+    (package_dir / "META-INF").mkdir()
+    (package_dir / "META-INF" / "catalog.xml").write_text(
+        "<catalog xmlns='urn:oasis:names:tc:entity:xmlns:xml:catalog'>"
+        f"<rewriteURI uriStartString='{PACKAGE_URL}' rewritePrefix='../'/></catalog>"
+    )
+    (package_dir / "entire").mkdir()
+    (package_dir / "entire" / "entry.xsd").write_text(
+        "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema' targetNamespace='http://mini.example/entry'>"
+        f"<xs:import namespace='http://example.com/mini/2025' schemaLocation='{PACKAGE_URL}elts/mini-2025.xsd'/>"
+        "</xs:schema>"
+    )
+    return package_dir
+
+
+def test_catalog_rewrites_resolve_to_package_files(tmp_path):
+    """Test catalog prefixes map onto the package directory, most specific first"""
+    package_dir = _make_package(tmp_path)
+    (tmp_path / "base" / "xbrl.sec.gov").mkdir(parents=True)
+
+    assert parse_catalog(package_dir) == [(PACKAGE_URL, str(package_dir.resolve()) + "/")]
+    remappings = collect_remappings([package_dir], tmp_path / "base")
+    assert remappings[0] == (PACKAGE_URL, str(package_dir.resolve()) + "/")
+    assert ("https://xbrl.sec.gov/", str((tmp_path / "base" / "xbrl.sec.gov").resolve()) + "/") in remappings
+    assert parse_catalog(tmp_path) == []
+
+
+def test_offline_load_uses_package_files(tmp_path):
+    """Test Arelle loads a URL-importing entry point offline from the package"""
+    pytest.importorskip("arelle")
+    from arelle import Cntlr
+
+    package_dir = _make_package(tmp_path)
+    controller = Cntlr.Cntlr(logFileName="logToBuffer")
+    unresolved = configure_offline(controller, collect_remappings([package_dir]))
+    with timed_document_loads() as timings:
+        model_xbrl = controller.modelManager.load(str(package_dir / "entire" / "entry.xsd"))
+    assert unresolved == []
+
+    names = {concept.name for concept in model_xbrl.qnameConcepts.values()
+             if concept.qname.namespaceURI == 'http://example.com/mini/2025'}
+    assert 'AssetsCurrent' in names and len(names) == 12
+    assert f"{PACKAGE_URL}elts/mini-lab-2025.xml" in timings
+    assert all(seconds >= 0 for seconds in timings.values())
+    controller.close()
+
+
+def test_offline_load_fails_on_unmapped_import(tmp_path):
+    """Test an import with no local copy fails the load instead of silently dropping its concepts"""
+    pytest.importorskip("arelle")
+    from arelle import Cntlr
+
+    package_dir = _make_package(tmp_path)
+    entry_point = package_dir / "entire" / "entry.xsd"
+    dei_url = "https://xbrl.sec.gov/dei/2025/dei-2025.xsd"
+    entry_point.write_text(entry_point.read_text().replace(
+        "</xs:schema>", f"<xs:import namespace='http://xbrl.sec.gov/dei/2025' schemaLocation='{dei_url}'/></xs:schema>"))
+
+    controller = Cntlr.Cntlr(logFileName="logToBuffer")
+    unresolved = configure_offline(controller, collect_remappings([package_dir]))
+    controller.modelManager.load(str(entry_point))
+    assert unresolved == [dei_url]
+    controller.close()
+
+    loader = TaxonomyLoader(entry_point=entry_point, taxonomy_dir=package_dir, extractor='arelle',
+                            documentation_dir=tmp_path / "documentation")
+    with pytest.raises(FileNotFoundError, match="dei-2025.xsd"):
+        loader.load_taxonomy(use_snapshot=False)
+    assert loader.load_status()['phase'] == 'failed' and not loader.is_loaded
@@ -0,0 +1,92 @@
+# backend/tests/test_taxonomy_registry.py
+import asyncio
+import pickle
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src.concept_store import ConceptStore
+from backend.src.taxonomy_crosswalk import TaxonomyCrosswalk
+from backend.src.taxonomy_registry import TaxonomyRegistry, discover_taxonomy_versions
+
+MINI_TAXONOMY = Path(__file__).parent / "fixtures" / "mini-taxonomy"
+
+
+def _make_versions(root: Path):
+    """2024 lacks SegmentDescription and the depcon network, and has OtherLiabilities, which 2025 dropped."""
+    shutil.copytree(MINI_TAXONOMY, root / "us-gaap-2025")
+    shutil.copytree(MINI_TAXONOMY, root / "us-gaap-2024")
+    schema = root / "us-gaap-2024" / "elts" / "mini-2025.xsd"
+    (root / "us-gaap-2024" / "elts" / "mini-depcon-def-2025.xml").unlink()
+    lines = [line for line in schema.read_text().splitlines()
+             if "mini_SegmentDescription" not in line and "mini-depcon-def" not in line]
+    retired = ("  <xs:element id='mini_OtherLiabilities' name='OtherLiabilities' nillable='true' "
+               "substitutionGroup='xbrli:item' type='xbrli:monetaryItemType' xbrli:periodType='instant' />")
+    lines.insert(-1, retired)
+    schema.write_text("\n".join(lines))
+
+
+def test_versions_load_side_by_side_with_crosswalk(tmp_path):
+    """Test two versions load independently and the adjacent crosswalk is precomputed"""
+    _make_versions(tmp_path)
+    versions = discover_taxonomy_versions(tmp_path)
+    assert list(versions) == ['2024', '2025']
+
+    async def load_all():
+        registry = TaxonomyRegistry(versions, default_version='2025', extractor='lxml', use_snapshot=False,
+                                    documentation_dir=tmp_path / "documentation")
+        for version in registry.versions:
+            await registry.start_load(version)
+        await asyncio.gather(*(slot.load_task for slot in registry.slots.values()))
+        return registry
+
+    registry = asyncio.run(load_all())
+    assert registry.resolve(None) == '2025'
+    with pytest.raises(KeyError):
+        registry.resolve('1999')
+
+    old, new = registry.slots['2024'].loader, registry.slots['2025'].loader
+    assert 'OtherLiabilities' in old.concepts and 'OtherLiabilities' not in new.concepts
+    crosswalk = registry.crosswalks[('2024', '2025')]
+    assert crosswalk.to_dict()['added'] == ['SegmentDescription']
+    assert crosswalk.to_dict()['removed'] == ['OtherLiabilities']
+    # Deprecation is read from 2025's depcon network
+    assert crosswalk.to_dict()['deprecated'] == ['DeprecatedRevenueItem']
+    assert registry.concept_changes('SegmentDescription') == [
+        {'from_version': '2024', 'to_version': '2025', 'status': 'added'}
+    ]
+    assert registry.concept_changes('Assets') == []
+
+    # Reloading unchanged files keeps the generation and leaves a finished status, not a pending one
+    async def reload_unchanged():
+        await registry.start_reload('2025')
+        await registry.slots['2025'].reload_task
+    asyncio.run(reload_unchanged())
+    assert registry.slots['2025'].loader is new
+    assert registry.status()['2025']['reload'] == {'outcome': 'unchanged'}
+
+    # A store restored from a snapshot shares its strings with the versions already loaded
+    restored = pickle.loads(pickle.dumps(old.concepts))
+    assert restored.names[restored.ids['Assets']] is new.concepts.names[new.concepts.ids['Assets']]
+
+
+def test_crosswalk_marks_newly_deprecated_concepts(tmp_path):
+    """Test concepts deprecated by the newer version are reported once"""
+    def concept(name, deprecated=False):
+        return {'name': name, 'label': name, 'is_deprecated': deprecated}
+
+    old = ConceptStore.from_dicts({'A': concept('A'), 'B': concept('B', True), 'C': concept('C')}, tmp_path)
+    new = ConceptStore.from_dicts({'A': concept('A', True), 'B': concept('B', True), 'D': concept('D')}, tmp_path)
+    crosswalk = TaxonomyCrosswalk.build('2024', '2025', old, new)
+
+    assert crosswalk.to_dict() == {
+        'from_version': '2024', 'to_version': '2025',
+        'counts': {'added': 1, 'removed': 1, 'deprecated': 1},
+        'added': ['D'], 'removed': ['C'], 'deprecated': ['A'],
+    }
+    assert [crosswalk.status_of(name) for name in 'ABCD'] == ['deprecated', None, 'removed', 'added']
@@ -0,0 +1,72 @@
+# backend/tests/test_taxonomy_snapshot.py
+import sys
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.src import taxonomy_loader as taxonomy_loader_module
+from backend.src.taxonomy_loader import TaxonomyLoader
+from backend.src.taxonomy_snapshot import compute_taxonomy_hash, load_snapshot, save_snapshot
+
+MINI_TAXONOMY = Path(__file__).parent / "fixtures" / "mini-taxonomy"
+
+
+def _make_taxonomy(root: Path):
+    (root / "elts").mkdir(parents=True)
+    (root / "elts" / "a.xsd").write_text("<schema/>")
+    (root / "elts" / "b-lab.xml").write_text("<linkbase/>")
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Test a snapshot written for a hash loads back unchanged"""
+    taxonomy_dir = tmp_path / "taxonomy"
+    _make_taxonomy(taxonomy_dir)
+    taxonomy_hash = compute_taxonomy_hash(taxonomy_dir)
+
+    state = {'concepts': {'Assets': {'name': 'Assets', 'label': 'Assets'}}, 'concept_labels': {'assets': ['Assets']}}
+    save_snapshot(state, taxonomy_hash, snapshot_dir=tmp_path / "snapshots")
+
+    assert load_snapshot(taxonomy_hash, snapshot_dir=tmp_path / "snapshots") == state
+
+
+def test_changed_file_invalidates_snapshot(tmp_path):
+    """Test that editing a taxonomy file changes the hash and misses the snapshot"""
+    taxonomy_dir = tmp_path / "taxonomy"
+    _make_taxonomy(taxonomy_dir)
+    old_hash = compute_taxonomy_hash(taxonomy_dir)
+    save_snapshot({'concepts': {}}, old_hash, snapshot_dir=tmp_path / "snapshots")
+
+    (taxonomy_dir / "elts" / "a.xsd").write_text("<schema><element/></schema>")
+    new_hash = compute_taxonomy_hash(taxonomy_dir)
+
+    assert new_hash != old_hash
+    assert load_snapshot(new_hash, snapshot_dir=tmp_path / "snapshots") is None
+
+
+def test_warm_load_restores_snapshot_without_extracting(tmp_path, monkeypatch):
+    """Test a second load comes from the snapshot without Arelle or the extractor"""
+    monkeypatch.setattr(taxonomy_loader_module, 'PARSE_CACHE_DIR', tmp_path / "parsed")
+
+    def new_loader():
+        loader = TaxonomyLoader(taxonomy_dir=MINI_TAXONOMY, extractor='lxml', documentation_dir=tmp_path / "docs")
+        loader.snapshot_dir = tmp_path / "snapshots"
+        return loader
+
+    cold = new_loader()
+    cold.load_taxonomy()
+    assert cold.load_status()['source'] == 'lxml'
+    assert len(list((tmp_path / "snapshots").glob("*.snap"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("taxonomy files were parsed on a warm start")
+
+    monkeypatch.setattr(taxonomy_loader_module, 'extract_concepts', fail)
+    monkeypatch.setattr(TaxonomyLoader, '_load_from_dts', fail)
+    monkeypatch.setitem(sys.modules, 'arelle', None)  # Any import of Arelle now raises ImportError
+
+    warm = new_loader()
+    warm.load_taxonomy()
+    assert warm.load_status()['source'] == 'snapshot'
+    assert warm.concepts.names == cold.concepts.names
+    assert warm.search_concepts("assets", limit=1)[0]['name'] == cold.search_concepts("assets", limit=1)[0]['name']